@@ -0,0 +1,68 @@
+"""Benchmark card PDF rendering with the full Noto Emoji font and a per-game subset.
+
+Usage:
+    python benchmarks/font_subset.py [--cards N] [--game NAME]
+
+Each mode renders the same seeded deck in memory in a fresh process, so font
+registration and subsetting are included in the time of the first card.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def run(cards: int, game: str, subset: bool) -> dict:
+    """Render a deck in this process and report timings and sizes."""
+    sys.path.insert(0, str(SRC))
+    from bingo import pdf
+    from bingo.card import generate_cards_batch
+    from bingo.data import get_game_data
+
+    pdf.SUBSET_EMOJI_FONT = subset
+    items = get_game_data(game)
+    deck = list(generate_cards_batch(cards, total_items=len(items), seed=1))
+
+    start = time.perf_counter()
+    first = pdf._render_card_pdf_bytes(deck[0], items, "Bingo Card:", game)
+    first_time = time.perf_counter() - start
+    sizes = [len(first)]
+    for card in deck[1:]:
+        sizes.append(len(pdf._render_card_pdf_bytes(card, items, "Bingo Card:", game)))
+    elapsed = time.perf_counter() - start
+    return {
+        "first_ms": first_time * 1000,
+        "per_card_ms": (elapsed - first_time) / max(1, cards - 1) * 1000,
+        "mean_bytes": sum(sizes) / len(sizes),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=200, help="Cards per mode (default: 200)")
+    parser.add_argument("--game", default="meet_me_in_st_louis", help="Game pack (default: meet_me_in_st_louis)")
+    parser.add_argument("--mode", choices=["full", "subset"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run(args.cards, args.game, args.mode == "subset")))
+        return
+
+    print(f"{args.cards} cards of {args.game}")
+    print(f"{'font':8} {'first card':>12} {'per card':>10} {'PDF size':>10}")
+    for mode in ("full", "subset"):
+        command = [sys.executable, __file__, "--cards", str(args.cards), "--game", args.game, "--mode", mode]
+        result = json.loads(subprocess.run(command, capture_output=True, text=True, check=True).stdout)
+        print(
+            f"{mode:8} {result['first_ms']:9.1f} ms {result['per_card_ms']:7.2f} ms "
+            f"{result['mean_bytes'] / 1024:7.1f} KB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,3 @@
 """Bingo card generator for movie watching parties."""
 
-__version__ = "0.1.0"
+__version__ = "0.2.0"
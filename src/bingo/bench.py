@@ -0,0 +1,358 @@
+"""Benchmarks of the card generation and rendering hot paths.
+
+Run with ``bingo bench``. Each case is timed over several rounds of
+calibrated loops; results are written as JSON, and an earlier results file
+can be given as a baseline to fail on cases whose median time per call grew
+beyond a threshold.
+"""
+
+import io
+import json
+import platform
+import random
+import statistics
+import time
+import timeit
+from collections.abc import Callable, Iterable, Sequence
+from contextlib import ExitStack, redirect_stdout
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from . import __version__
+from .card import feasible_win_range, generate_cards_batch, generate_valid_card, simulate_game
+from .data import get_game_data
+
+# Version of the results file layout
+RESULTS_VERSION = 1
+# Relative growth of a case's median time that counts as a regression
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_ROUNDS = 5
+# Shortest round; fast cases repeat their call within a round until it takes this long
+MIN_ROUND_TIME = 0.05
+# Deck sizes of the festive HTML cases
+FESTIVE_DECK_SIZES = (10, 1_000, 10_000)
+
+
+class BenchmarkUnavailableError(Exception):
+    """Raised by a case's setup when it cannot run here, e.g. without a browser."""
+
+
+@dataclass
+class BenchCase:
+    """A benchmark of one hot path.
+
+    Attributes:
+        name: Unique name, e.g. ``generate_valid_card[win_at=20]``.
+        group: Function being measured.
+        setup: Prepares inputs in a scratch directory and returns the call to
+            time; resources that need cleaning up go on the exit stack.
+        rounds: Default number of rounds.
+    """
+    name: str
+    group: str
+    setup: Callable[[Path, ExitStack], Callable[[], object]]
+    rounds: int = DEFAULT_ROUNDS
+
+
+@dataclass
+class BenchResult:
+    """Timings of one case, in seconds per call.
+
+    Attributes:
+        name: Case name.
+        group: Function measured.
+        rounds: Rounds timed.
+        loops: Calls per round.
+        min: Fastest round.
+        median: Median round, the value compared between runs.
+        mean: Mean round.
+        stdev: Standard deviation of the rounds.
+        skipped: Why the case did not run (None if it did).
+    """
+    name: str
+    group: str
+    rounds: int = 0
+    loops: int = 0
+    min: float = 0.0
+    median: float = 0.0
+    mean: float = 0.0
+    stdev: float = 0.0
+    skipped: str | None = None
+
+
+@dataclass
+class Regression:
+    """A case that got slower than its baseline by more than the threshold."""
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Current median time over baseline median time."""
+        return self.current / self.baseline
+
+
+@dataclass
+class BenchReport:
+    """Results of a benchmark run and where it ran."""
+    results: list[BenchResult]
+    environment: dict[str, str] = field(default_factory=lambda: {
+        "bingo": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    })
+    created: str = field(default_factory=lambda: time.strftime("%Y-%m-%dT%H:%M:%S%z"))
+
+
+def _generate_valid_card(win_at: int) -> Callable[[Path, ExitStack], Callable[[], object]]:
+    def setup(scratch: Path, stack: ExitStack) -> Callable[[], object]:
+        rng = random.Random(0)
+        return lambda: generate_valid_card(win_at, 30, rng=rng)
+    return setup
+
+
+def _simulate_game(scratch: Path, stack: ExitStack) -> Callable[[], object]:
+    card = generate_valid_card(20, 30, rng=random.Random(0))
+    return lambda: simulate_game(card, 30)
+
+
+def _create_festive_html(num_cards: int) -> Callable[[Path, ExitStack], Callable[[], object]]:
+    def setup(scratch: Path, stack: ExitStack) -> Callable[[], object]:
+        from .html_pdf import create_festive_html
+
+        items = get_game_data("vintage_christmas_films")
+        cards = list(generate_cards_batch(num_cards, total_items=len(items), seed=0))
+        return lambda: create_festive_html(items, cards, seed=0)
+    return setup
+
+
+def _create_card_pdf(scratch: Path, stack: ExitStack) -> Callable[[], object]:
+    from .pdf import create_card_pdf
+
+    items = get_game_data("meet_me_in_st_louis")
+    card = generate_valid_card(20, len(items), rng=random.Random(0))
+    output = str(scratch / "card.pdf")
+    return lambda: create_card_pdf(card, items, output)
+
+
+def _save_card_image(fmt: str) -> Callable[[Path, ExitStack], Callable[[], object]]:
+    def setup(scratch: Path, stack: ExitStack) -> Callable[[], object]:
+        from .images import CardImageRenderer
+
+        items = get_game_data("meet_me_in_st_louis")
+        card = generate_valid_card(20, len(items), rng=random.Random(0))
+        # Glyphs are rasterized here, once; the time covers compositing and encoding
+        renderer = CardImageRenderer(items, title2="Meet Me In St. Louis")
+        output = str(scratch / f"card.{fmt}")
+        return lambda: renderer.save(card, output, fmt)
+    return setup
+
+
+def _create_festive_pdf(scratch: Path, stack: ExitStack) -> Callable[[], object]:
+    from .festive_pdf import NativeFestiveRenderer
+
+    items = get_game_data("vintage_christmas_films")
+    cards = list(generate_cards_batch(10, total_items=len(items), seed=0))
+    renderer = NativeFestiveRenderer(items, seed=0)
+    output = str(scratch / "cards.pdf")
+    # Same deck as html_to_pdf, for comparing the two festive PDF engines
+    return lambda: renderer.render(cards, output)
+
+
+def _html_to_pdf(scratch: Path, stack: ExitStack) -> Callable[[], object]:
+    from .html_pdf import PdfRenderer, create_festive_html
+
+    items = get_game_data("vintage_christmas_films")
+    cards = list(generate_cards_batch(10, total_items=len(items), seed=0))
+    html_file = scratch / "cards.html"
+    html_file.write_text(create_festive_html(items, cards, fonts="file", seed=0), encoding="utf-8")
+    try:
+        renderer = stack.enter_context(PdfRenderer(offline=True))
+    except Exception as e:  # Playwright or its browser is not installed
+        raise BenchmarkUnavailableError(str(e).strip().splitlines()[0]) from e
+    output = str(scratch / "cards.pdf")
+    # Browser startup happens once above; the time covers loading, layout and printing
+    return lambda: renderer.html_to_pdf(str(html_file), output)
+
+
+def bench_cases() -> list[BenchCase]:
+    """Get every benchmark case, in run order."""
+    cases = [
+        BenchCase(f"generate_valid_card[win_at={win_at}]", "generate_valid_card", _generate_valid_card(win_at))
+        for win_at in feasible_win_range(30)
+    ]
+    cases.append(BenchCase("simulate_game", "simulate_game", _simulate_game))
+    cases.extend(
+        BenchCase(
+            f"create_festive_html[cards={num_cards}]",
+            "create_festive_html",
+            _create_festive_html(num_cards),
+            rounds=3 if num_cards >= 10_000 else DEFAULT_ROUNDS,
+        )
+        for num_cards in FESTIVE_DECK_SIZES
+    )
+    cases.append(BenchCase("create_card_pdf", "create_card_pdf", _create_card_pdf))
+    cases.append(BenchCase("create_festive_pdf[cards=10]", "create_festive_pdf", _create_festive_pdf))
+    cases.extend(
+        BenchCase(f"save_card_image[{fmt}]", "save_card_image", _save_card_image(fmt)) for fmt in ("png", "webp")
+    )
+    cases.append(BenchCase("html_to_pdf", "html_to_pdf", _html_to_pdf, rounds=3))
+    return cases
+
+
+def select_cases(cases: Iterable[BenchCase], patterns: Sequence[str]) -> list[BenchCase]:
+    """Keep the cases whose name contains any of `patterns` (all cases if there are none)."""
+    return [case for case in cases if not patterns or any(pattern in case.name for pattern in patterns)]
+
+
+def _calibrate(timer: timeit.Timer) -> int:
+    """Find how many calls make a round of at least `MIN_ROUND_TIME` (the first call also warms up)."""
+    loops = 1
+    while (elapsed := timer.timeit(loops)) < MIN_ROUND_TIME:
+        loops = max(2 * loops, int(loops * 1.2 * MIN_ROUND_TIME / max(elapsed, 1e-9)))
+    return loops
+
+
+def run_case(case: BenchCase, scratch: Path, rounds: int | None = None) -> BenchResult:
+    """Time a benchmark case.
+
+    Args:
+        case: Case to run.
+        scratch: Empty directory for the case's files.
+        rounds: Number of rounds (the case's default if None).
+
+    Returns:
+        Per-call timings, or a result with `skipped` set if the case cannot run.
+    """
+    with ExitStack() as stack:
+        try:
+            func = case.setup(scratch, stack)
+        except BenchmarkUnavailableError as e:
+            return BenchResult(case.name, case.group, skipped=str(e))
+        # Hot paths such as create_card_pdf report what they wrote; keep that out of the results
+        stack.enter_context(redirect_stdout(io.StringIO()))
+        timer = timeit.Timer(func)
+        loops = _calibrate(timer)
+        times = [total / loops for total in timer.repeat(rounds or case.rounds, loops)]
+    return BenchResult(
+        case.name,
+        case.group,
+        rounds=len(times),
+        loops=loops,
+        min=min(times),
+        median=statistics.median(times),
+        mean=statistics.fmean(times),
+        stdev=statistics.stdev(times) if len(times) > 1 else 0.0,
+    )
+
+
+def run_benchmarks(
+    cases: Iterable[BenchCase],
+    rounds: int | None = None,
+    progress: Callable[[BenchResult], None] | None = None,
+) -> BenchReport:
+    """Run benchmark cases one after another, each in its own scratch directory.
+
+    Args:
+        cases: Cases to run, e.g. from `bench_cases`.
+        rounds: Rounds per case (each case's default if None).
+        progress: Called with each result as it completes.
+
+    Returns:
+        The report of all cases.
+    """
+    results = []
+    for case in cases:
+        with TemporaryDirectory(prefix="bingo-bench-") as scratch:
+            result = run_case(case, Path(scratch), rounds)
+        results.append(result)
+        if progress is not None:
+            progress(result)
+    return BenchReport(results)
+
+
+def write_report(report: BenchReport, path: str | Path) -> None:
+    """Write a benchmark report as JSON."""
+    data = {"version": RESULTS_VERSION, **asdict(report)}
+    Path(path).write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def read_report(path: str | Path) -> BenchReport:
+    """Read a benchmark report written by `write_report`.
+
+    Raises:
+        ValueError: If the file is not a benchmark report of a known version.
+    """
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if data.get("version") != RESULTS_VERSION:
+            raise ValueError(f"Unsupported benchmark results version {data.get('version')!r} in {path}")
+        return BenchReport(
+            [BenchResult(**result) for result in data["results"]],
+            environment=data["environment"],
+            created=data["created"],
+        )
+    except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"Cannot read benchmark results {path}: {e}") from e
+
+
+def find_regressions(
+    report: BenchReport,
+    baseline: BenchReport,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Regression]:
+    """Compare median times with a baseline run.
+
+    Cases skipped in either run or missing from the baseline are ignored.
+
+    Args:
+        report: Current run.
+        baseline: Earlier run to compare with.
+        threshold: Allowed relative growth, e.g. 0.2 for 20% slower.
+
+    Returns:
+        Cases slower than ``baseline * (1 + threshold)``, in run order.
+    """
+    previous = {result.name: result for result in baseline.results if result.skipped is None}
+    return [
+        Regression(result.name, previous[result.name].median, result.median)
+        for result in report.results
+        if result.skipped is None
+        and result.name in previous
+        and result.median > previous[result.name].median * (1 + threshold)
+    ]
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds * 1e9:.3g} ns"
+
+
+def format_result(result: BenchResult, baseline: BenchReport | None = None) -> str:
+    """Describe one result as a table row, with the change from `baseline` if given."""
+    if result.skipped is not None:
+        return f"{result.name:40} skipped: {result.skipped}"
+    line = (
+        f"{result.name:40} {_format_time(result.median):>10} "
+        f"(min {_format_time(result.min)}, {result.rounds}x{result.loops})"
+    )
+    previous = {r.name: r for r in baseline.results if r.skipped is None} if baseline else {}
+    if result.name in previous:
+        line += f" {result.median / previous[result.name].median - 1:+.1%}"
+    return line
+
+
+def environment_warning(report: BenchReport, baseline: BenchReport) -> str | None:
+    """Describe how the baseline's environment differs from this run's (None if it does not)."""
+    changed = [
+        f"{key} {baseline.environment.get(key)} -> {value}"
+        for key, value in report.environment.items()
+        if key != "bingo" and baseline.environment.get(key) != value
+    ]
+    return f"Baseline ran elsewhere: {', '.join(changed)}" if changed else None
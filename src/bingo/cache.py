@@ -0,0 +1,116 @@
+"""Content-addressed on-disk cache for rendered cards."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from . import __version__
+
+# Default cache size limit in bytes
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Fraction of the size limit that eviction trims the cache down to, so that a
+# full cache scans its directory once per tenth of the limit written, not on every put
+EVICT_TO = 0.9
+
+
+class RenderCache:
+    """On-disk cache of rendered output keyed by a hash of its inputs.
+
+    Entries live in ``directory/<2 hex chars>/<sha256>``. Reading an entry
+    refreshes its modification time, and when the cache grows beyond
+    `max_bytes` the least recently used entries are deleted until it is back
+    under `EVICT_TO` of the limit.
+
+    Args:
+        directory: Cache directory (created if missing).
+        max_bytes: Size limit for all entries together.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size = sum(path.stat().st_size for path in self._entries())
+
+    @staticmethod
+    def key(*parts: object) -> str:
+        """Hash the inputs of a rendering into a cache key.
+
+        Args:
+            parts: JSON-serializable values that fully determine the output
+                (the package version is always included).
+
+        Returns:
+            Hex SHA-256 digest.
+        """
+        payload = json.dumps([__version__, *parts], ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def _entries(self) -> list[Path]:
+        return [path for path in self.directory.glob("??/*") if path.is_file() and not path.name.endswith(".tmp")]
+
+    def get(self, key: str) -> bytes | None:
+        """Get a cached entry, counting a hit or a miss.
+
+        Args:
+            key: Key from `RenderCache.key`.
+
+        Returns:
+            The cached bytes, or None if not cached.
+        """
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        os.utime(path)
+        self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store an entry, evicting least recently used entries if over the size limit.
+
+        Args:
+            key: Key from `RenderCache.key`.
+            data: Rendered output.
+        """
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        previous = path.stat().st_size if path.exists() else 0
+        # Write then rename so concurrent readers never see a partial entry
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+        self._size += len(data) - previous
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits in `EVICT_TO` of `max_bytes`."""
+        entries = sorted(((path.stat(), path) for path in self._entries()), key=lambda entry: entry[0].st_mtime)
+        self._size = sum(stat.st_size for stat, _ in entries)
+        target = int(self.max_bytes * EVICT_TO)
+        for stat, path in entries:
+            if self._size <= target:
+                break
+            path.unlink(missing_ok=True)
+            self._size -= stat.st_size
+
+    @property
+    def size(self) -> int:
+        """Total size of cached entries in bytes."""
+        return self._size
+
+    def summary(self) -> str:
+        """Describe hit/miss counts and cache size."""
+        return (
+            f"Render cache: {self.hits} hits, {self.misses} misses "
+            f"({self._size / (1024 * 1024):.1f} MB in {self.directory})"
+        )
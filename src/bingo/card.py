@@ -1,15 +1,243 @@
 """Bingo card generation logic."""
 
 import random
-from dataclasses import dataclass
+import re
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from functools import cache
+from itertools import permutations
+from typing import TYPE_CHECKING, overload
 
 from .data import BingoItem
 
+if TYPE_CHECKING:
+    import numpy as np
+
+GRID_SIZE = 5
+
+# Supported range of rows and columns
+MIN_GRID_SIZE = 3
+MAX_GRID_SIZE = 7
+
+# Grid value of a free space, which counts as marked from the start
+FREE = 0
+FREE_LABEL = "FREE"
+
+Cell = tuple[int, int]
+
+# Template: (win cell, other cells of its winning line, blocker cells)
+WinTemplate = tuple[Cell, tuple[Cell, ...], tuple[Cell, ...]]
+
+# Unique batches draw replacements in rounds of at least this many candidates, doubling
+# after each round that finds no new card, and give up after this many such rounds in a row
+UNIQUE_MIN_DRAW = 64
+UNIQUE_MAX_EMPTY_ROUNDS = 8
+
+_SHAPE_PATTERN = re.compile(r"^(\d+)x(\d+)(-free)?$")
+
+
+@dataclass(frozen=True)
+class CardShape:
+    """Grid dimensions of a card, optionally with a free center space.
+
+    Shapes are hashable, and everything derived from a shape (its lines, line
+    masks and winning layouts) is computed once per shape and cached.
+
+    Attributes:
+        rows: Number of rows.
+        cols: Number of columns.
+        free_center: Whether the center cell is a free space (odd sizes only).
+    """
+    rows: int = GRID_SIZE
+    cols: int = GRID_SIZE
+    free_center: bool = False
+
+    def __post_init__(self) -> None:
+        for size in (self.rows, self.cols):
+            if not MIN_GRID_SIZE <= size <= MAX_GRID_SIZE:
+                raise ValueError(f"Grid sizes must be {MIN_GRID_SIZE}-{MAX_GRID_SIZE}, got {self.rows}x{self.cols}")
+        if self.free_center and not (self.rows % 2 and self.cols % 2):
+            raise ValueError(f"A {self.rows}x{self.cols} grid has no center cell for a free space")
+
+    def __str__(self) -> str:
+        return f"{self.rows}x{self.cols}{'-free' if self.free_center else ''}"
+
+    @classmethod
+    def parse(cls, spec: str) -> "CardShape":
+        """Parse a shape such as ``"3x3"``, ``"4x4"`` or ``"5x5-free"``.
+
+        Args:
+            spec: ``ROWSxCOLS``, with ``-free`` for a free center space.
+
+        Returns:
+            The parsed shape.
+
+        Raises:
+            ValueError: If the string is malformed or the shape unsupported.
+        """
+        match = _SHAPE_PATTERN.match(spec.strip().lower())
+        if match is None:
+            raise ValueError(f"Invalid card shape {spec!r}, expected ROWSxCOLS or ROWSxCOLS-free")
+        return cls(int(match[1]), int(match[2]), match[3] is not None)
+
+    @classmethod
+    def of(cls, grid: Sequence[Sequence[int]]) -> "CardShape":
+        """Get the shape of a grid (the center holding `FREE` makes it a free space)."""
+        rows, cols = len(grid), len(grid[0])
+        free_center = bool(rows % 2 and cols % 2) and grid[rows // 2][cols // 2] == FREE
+        return cls(rows, cols, free_center)
+
+    @property
+    def size(self) -> int:
+        """Number of cells."""
+        return self.rows * self.cols
+
+    @property
+    def free_cell(self) -> Cell | None:
+        """The free space, if any."""
+        return (self.rows // 2, self.cols // 2) if self.free_center else None
+
+    @property
+    def values(self) -> int:
+        """Number of cells holding an item."""
+        return self.size - self.free_center
+
+    @property
+    def lines(self) -> "LineTable":
+        """Precomputed line tables of this shape."""
+        return line_table(self)
+
+
+DEFAULT_SHAPE = CardShape()
+
+
+@dataclass(frozen=True)
+class LineTable:
+    """Lines of a card shape and their bitmasks.
+
+    Cell (i, j) is bit ``i * cols + j`` of a mask.
+
+    Attributes:
+        lines: Rows, columns and (for square grids) both diagonals as (row, col) cells.
+        masks: Bitmask of each line.
+        cell_lines: Indices into `lines` of the lines through each bit.
+        sizes: Number of cells in each line.
+        free_mask: Bitmask of the free space (0 without one).
+        initial_counts: Marked cells per line before any call (the free space).
+    """
+    lines: tuple[tuple[Cell, ...], ...]
+    masks: tuple[int, ...]
+    cell_lines: tuple[tuple[int, ...], ...]
+    sizes: tuple[int, ...]
+    free_mask: int
+    initial_counts: tuple[int, ...]
+
+
+@cache
+def line_table(shape: CardShape = DEFAULT_SHAPE) -> LineTable:
+    """Build the line tables of a card shape (cached per shape)."""
+    rows, cols = shape.rows, shape.cols
+    lines = [
+        *(tuple((i, j) for j in range(cols)) for i in range(rows)),
+        *(tuple((i, j) for i in range(rows)) for j in range(cols)),
+    ]
+    if rows == cols:
+        lines.append(tuple((i, i) for i in range(rows)))
+        lines.append(tuple((i, rows - 1 - i) for i in range(rows)))
+    masks = tuple(sum(1 << (i * cols + j) for i, j in line) for line in lines)
+    free_mask = 1 << (shape.free_cell[0] * cols + shape.free_cell[1]) if shape.free_cell else 0
+    return LineTable(
+        lines=tuple(lines),
+        masks=masks,
+        cell_lines=tuple(tuple(k for k, mask in enumerate(masks) if mask >> bit & 1) for bit in range(shape.size)),
+        sizes=tuple(len(line) for line in lines),
+        free_mask=free_mask,
+        initial_counts=tuple(int(bool(mask & free_mask)) for mask in masks),
+    )
+
+
+# Rows, columns, main diagonal and anti-diagonal of the default 5x5 card as (row, col) cells
+LINES: tuple[tuple[Cell, ...], ...] = DEFAULT_SHAPE.lines.lines
+
+# Cell (i, j) is bit i * GRID_SIZE + j of a 25-bit mask
+LINE_MASKS: tuple[int, ...] = DEFAULT_SHAPE.lines.masks
+
+# Indices into LINES of the lines passing through each bit
+CELL_LINES: tuple[tuple[int, ...], ...] = DEFAULT_SHAPE.lines.cell_lines
+
 
 @dataclass
 class BingoCard:
-    """A 5x5 bingo card."""
-    grid: list[list[int]]  # 5x5 grid of item order numbers
+    """A bingo card, 5x5 unless its grid says otherwise (see `CardShape`).
+
+    Besides the grid, a card tracks a game in progress: `mark` sets the bit of a
+    called number and bumps the counters of the (at most 4) lines through it, so
+    bingo is detected without rescanning the grid. A free space starts marked.
+    """
+    grid: list[list[int]]  # rows x cols grid of item order numbers (FREE for a free space)
+    shape: CardShape = field(init=False, repr=False, compare=False)
+    cells: dict[int, int] = field(init=False, repr=False, compare=False)  # item order number -> bit
+    marked: int = field(init=False, repr=False, compare=False)  # bitmask of marked cells
+    _line_counts: list[int] = field(init=False, repr=False, compare=False)
+    _lines_complete: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.shape = CardShape.of(self.grid)
+        cols = self.shape.cols
+        self.cells = {
+            value: i * cols + j for i, row in enumerate(self.grid) for j, value in enumerate(row) if value != FREE
+        }
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all marks so the card can be played again."""
+        table = self.shape.lines
+        self.marked = table.free_mask
+        self._line_counts = list(table.initial_counts)
+        self._lines_complete = 0
+
+    def mark(self, number: int) -> bool:
+        """Mark a called number.
+
+        Args:
+            number: The item order number that was called.
+
+        Returns:
+            True if the card has bingo after this call.
+        """
+        bit = self.cells.get(number)
+        if bit is not None and not self.marked >> bit & 1:
+            self.marked |= 1 << bit
+            table = self.shape.lines
+            counts = self._line_counts
+            for line in table.cell_lines[bit]:
+                counts[line] += 1
+                if counts[line] == table.sizes[line]:
+                    self._lines_complete += 1
+        return self._lines_complete > 0
+
+    @property
+    def has_bingo(self) -> bool:
+        """Whether a marked line is complete."""
+        return self._lines_complete > 0
+
+    def mask(self, numbers: Iterable[int]) -> int:
+        """Get the bitmask of cells holding any of the given numbers.
+
+        Args:
+            numbers: Item order numbers, e.g. the numbers called so far.
+
+        Returns:
+            Mask with bit ``i * cols + j`` set if grid[i][j] is in `numbers`
+            (the free space is not included).
+        """
+        cells = self.cells
+        mask = 0
+        for number in numbers:
+            bit = cells.get(number)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
 
     def get_emoji_grid(self, items: list[BingoItem]) -> list[list[str]]:
         """Convert the numeric grid to emoji representation.
@@ -18,80 +246,166 @@ class BingoCard:
             items: List of BingoItem objects to map from.
 
         Returns:
-            5x5 grid of emoji strings.
+            Grid of emoji strings, with `FREE_LABEL` for a free space.
         """
         order_to_emoji = {item.order: item.emoji for item in items}
-        return [[order_to_emoji[self.grid[i][j]] for j in range(5)] for i in range(5)]
+        order_to_emoji[FREE] = FREE_LABEL
+        return [[order_to_emoji[value] for value in row] for row in self.grid]
 
 
-def generate_card(win_at: int = 20, total_items: int = 30) -> BingoCard:
+def feasible_win_range(total_items: int = 30, shape: CardShape = DEFAULT_SHAPE) -> range:
+    """Get the numbers at which a card can be made to win.
+
+    A 5x5 card needs four values called before ``win_at`` to complete its first
+    line, and four values called after it to block every line that does not
+    pass through the ``win_at`` cell; other shapes need their shortest line and
+    fewest blockers (see `win_templates`).
+
+    Args:
+        total_items: Total number of items in the game.
+        shape: Card shape.
+
+    Returns:
+        Range of feasible ``win_at`` values (empty if the game is too small for a
+        card, or the shape has no such layouts, like a 3x3 grid with a free center).
+    """
+    templates = win_templates(shape)
+    if total_items < shape.values or not templates:
+        return range(0)
+    fewest_before = min(len(line_cells) for _, line_cells, _ in templates)
+    fewest_after = min(len(blocker_cells) for _, _, blocker_cells in templates)
+    return range(fewest_before + 1, total_items - fewest_after + 1)
+
+
+@cache
+def win_templates(shape: CardShape = DEFAULT_SHAPE) -> tuple[WinTemplate, ...]:
+    """Enumerate the layouts that make a card win exactly at its ``win_at`` cell.
+
+    Each template is ``(win_cell, line_cells, blocker_cells)``: ``line_cells`` are
+    the other cells of a winning line through ``win_cell`` (filled with earlier
+    values) and ``blocker_cells`` hold one later value in every line that does
+    not pass through ``win_cell``. Blockers are one cell per remaining row and
+    column (the shorter side's cells are reused cyclically on non-square grids),
+    so each template uses the minimum number of later values. The free space
+    is never a win, line or blocker cell.
+
+    Args:
+        shape: Card shape (cached per shape).
+
+    Returns:
+        All templates of the shape.
+    """
+    lines = shape.lines.lines
+    free_cell = shape.free_cell
+    templates = []
+    for line in lines:
+        for win_cell in line:
+            if win_cell == free_cell:
+                continue
+            open_lines = [set(other) for other in lines if win_cell not in other]
+            rows = [i for i in range(shape.rows) if i != win_cell[0]]
+            cols = [j for j in range(shape.cols) if j != win_cell[1]]
+            line_cells = tuple(cell for cell in line if cell not in (win_cell, free_cell))
+            if len(rows) >= len(cols):
+                layouts = ([(row, perm[k % len(perm)]) for k, row in enumerate(rows)] for perm in permutations(cols))
+            else:
+                layouts = ([(perm[k % len(perm)], col) for k, col in enumerate(cols)] for perm in permutations(rows))
+            for layout in layouts:
+                blockers = set(layout)
+                if (
+                    free_cell not in blockers
+                    and blockers.isdisjoint(line_cells)
+                    and all(blockers & other for other in open_lines)
+                ):
+                    templates.append((win_cell, line_cells, tuple(sorted(blockers))))
+    return tuple(templates)
+
+
+@cache
+def _feasible_templates(win_at: int, total_items: int, shape: CardShape) -> tuple[WinTemplate, ...]:
+    """Get the templates with few enough line cells and blockers for ``win_at`` (cached)."""
+    return tuple(
+        template for template in win_templates(shape)
+        if len(template[1]) < win_at and len(template[2]) <= total_items - win_at
+    )
+
+
+def _check_win_at(win_at: int, total_items: int, shape: CardShape) -> None:
+    """Raise ValueError if no card of `shape` can win at `win_at`."""
+    feasible = feasible_win_range(total_items, shape)
+    if win_at not in feasible:
+        if not win_templates(shape):
+            raise ValueError(f"Cards of shape {shape} cannot be made to win at an exact call")
+        if not feasible:
+            raise ValueError(f"A {shape} game needs at least {shape.values} items, got {total_items}")
+        raise ValueError(
+            f"Cannot generate a card that wins at {win_at} with {total_items} items "
+            f"(feasible: {feasible.start}-{feasible.stop - 1})"
+        )
+
+
+def generate_card(
+    win_at: int = 20,
+    total_items: int = 30,
+    rng: random.Random | None = None,
+    shape: CardShape = DEFAULT_SHAPE,
+) -> BingoCard:
     """Generate a bingo card that wins when a specific number is called.
 
-    The card is designed so that when numbers are called in order (1, 2, 3, ...),
-    bingo is achieved exactly when `win_at` is called.
+    The card is built so that when numbers are called in order (1, 2, 3, ...),
+    bingo is achieved exactly when `win_at` is called: one line through the
+    `win_at` cell holds only earlier values, and every line that does not pass
+    through it holds a later value.
 
     Args:
         win_at: The number at which bingo should be achieved.
         total_items: Total number of items in the game.
+        rng: Random number generator to draw from (a fresh one if None).
+        shape: Card shape.
 
     Returns:
-        A BingoCard with a 5x5 grid.
-    """
-    # Initialize a 5x5 bingo card with None
-    card = [[None for _ in range(5)] for _ in range(5)]
-
-    # Place win_at in a random position
-    idx_win = (random.randint(0, 4), random.randint(0, 4))
-    card[idx_win[0]][idx_win[1]] = win_at
-
-    # Find all cells that intersect with win_at (same row, column, or diagonal)
-    # These cells must be filled with values < win_at to ensure we win at win_at
-    values_lt_win = list(range(1, win_at))
-    random.shuffle(values_lt_win)
-
-    idxs_intersect = set()
-
-    # Same row
-    for j in range(5):
-        if j != idx_win[1]:
-            idxs_intersect.add((idx_win[0], j))
-
-    # Same column
-    for i in range(5):
-        if i != idx_win[0]:
-            idxs_intersect.add((i, idx_win[1]))
-
-    # Main diagonal (top-left to bottom-right)
-    if idx_win[0] == idx_win[1]:
-        for i in range(5):
-            if i != idx_win[0]:
-                idxs_intersect.add((i, i))
-
-    # Anti-diagonal (top-right to bottom-left)
-    if idx_win[0] + idx_win[1] == 4:
-        for i in range(5):
-            if i != idx_win[0]:
-                idxs_intersect.add((i, 4 - i))
-
-    # Fill intersecting cells with values less than win_at
-    for idx in idxs_intersect:
-        if card[idx[0]][idx[1]] is None:
-            card[idx[0]][idx[1]] = values_lt_win.pop()
-
-    # Fill remaining cells with remaining random values
-    remaining_values = values_lt_win + list(range(win_at + 1, total_items + 1))
-    random.shuffle(remaining_values)
-
-    for i in range(5):
-        for j in range(5):
-            if card[i][j] is None:
-                card[i][j] = remaining_values.pop()
+        A BingoCard with a grid of the given shape.
+
+    Raises:
+        ValueError: If no card can win at `win_at` (see `feasible_win_range`).
+    """
+    _check_win_at(win_at, total_items, shape)
+
+    if rng is None:
+        rng = random.Random()
+    win_cell, line_cells, blocker_cells = rng.choice(_feasible_templates(win_at, total_items, shape))
+    values_lt_win = rng.sample(range(1, win_at), win_at - 1)
+    values_gt_win = rng.sample(range(win_at + 1, total_items + 1), total_items - win_at)
+
+    card: list[list[int | None]] = [[None for _ in range(shape.cols)] for _ in range(shape.rows)]
+    if shape.free_cell:
+        card[shape.free_cell[0]][shape.free_cell[1]] = FREE
+    card[win_cell[0]][win_cell[1]] = win_at
+    for i, j in line_cells:
+        card[i][j] = values_lt_win.pop()
+    for i, j in blocker_cells:
+        card[i][j] = values_gt_win.pop()
+
+    # Every line is now settled, so the remaining cells can take any leftover values
+    remaining_values = values_lt_win + values_gt_win
+    rng.shuffle(remaining_values)
+
+    for row in card:
+        for j, value in enumerate(row):
+            if value is None:
+                row[j] = remaining_values.pop()
 
     return BingoCard(grid=card)
 
 
 def check_bingo(card: BingoCard, called_numbers: set[int]) -> bool:
-    """Check if a card has bingo.
+    """Check if a card has bingo after an arbitrary set of calls.
+
+    This is the stateless convenience check: it builds the card's mask of
+    called cells from scratch, looking up whichever of the card's cells and
+    `called_numbers` is smaller, so each call costs O(min(cells, called)).
+    To follow a game call by call, use `BingoCard.mark`, which updates only
+    the counters of the lines through each marked cell.
 
     Args:
         card: The bingo card to check.
@@ -100,32 +414,23 @@ def check_bingo(card: BingoCard, called_numbers: set[int]) -> bool:
     Returns:
         True if the card has a bingo (complete row, column, or diagonal).
     """
-    grid = card.grid
-
-    # Check rows
-    for i in range(5):
-        if all(grid[i][j] in called_numbers for j in range(5)):
-            return True
-
-    # Check columns
-    for j in range(5):
-        if all(grid[i][j] in called_numbers for i in range(5)):
-            return True
-
-    # Check main diagonal
-    if all(grid[i][i] in called_numbers for i in range(5)):
-        return True
-
-    # Check anti-diagonal
-    if all(grid[i][4 - i] in called_numbers for i in range(5)):
-        return True
-
-    return False
+    table = card.shape.lines
+    if len(called_numbers) > len(card.cells):
+        mask = 0
+        for number, bit in card.cells.items():
+            if number in called_numbers:
+                mask |= 1 << bit
+    else:
+        mask = card.mask(called_numbers)
+    mask |= table.free_mask
+    return any(mask & line_mask == line_mask for line_mask in table.masks)
 
 
 def simulate_game(card: BingoCard, total_items: int = 30) -> int:
     """Simulate a game where numbers are called in order.
 
+    Any marks on the card are cleared before and after the simulation.
+
     Args:
         card: The bingo card to simulate.
         total_items: Total number of items to call.
@@ -133,30 +438,401 @@ def simulate_game(card: BingoCard, total_items: int = 30) -> int:
     Returns:
         The number at which bingo was achieved.
     """
-    called_numbers = set()
-    for number in range(1, total_items + 1):
-        called_numbers.add(number)
-        if check_bingo(card, called_numbers):
-            return number
-    return total_items
-
-
-def generate_valid_card(win_at: int = 20, total_items: int = 30, max_attempts: int = 100) -> BingoCard:
+    card.reset()
+    try:
+        for number in range(1, total_items + 1):
+            if card.mark(number):
+                return number
+        return total_items
+    finally:
+        card.reset()
+
+
+def generate_valid_card(
+    win_at: int = 20,
+    total_items: int = 30,
+    rng: random.Random | None = None,
+    shape: CardShape = DEFAULT_SHAPE,
+) -> BingoCard:
     """Generate a card that wins exactly at the specified number.
 
     Args:
         win_at: The number at which bingo should be achieved.
         total_items: Total number of items in the game.
-        max_attempts: Maximum number of generation attempts.
+        rng: Random number generator to draw from (a fresh one if None).
+        shape: Card shape.
 
     Returns:
         A BingoCard that wins exactly at win_at.
 
     Raises:
-        RuntimeError: If unable to generate a valid card.
+        ValueError: If `win_at` is outside `feasible_win_range(total_items, shape)`.
     """
-    for _ in range(max_attempts):
-        card = generate_card(win_at, total_items)
-        if simulate_game(card, total_items) == win_at:
-            return card
-    raise RuntimeError(f"Failed to generate card that wins at {win_at} after {max_attempts} attempts")
+    return generate_card(win_at, total_items, rng=rng, shape=shape)
+
+
+class CardBatch(Sequence[BingoCard]):
+    """A batch of cards stored as one ``(n, rows, cols)`` integer array.
+
+    Indexing returns a `BingoCard` built from the corresponding grid on demand,
+    so large batches never materialize more card objects than are used.
+    """
+
+    def __init__(self, grids: "np.ndarray") -> None:
+        self.grids = grids
+
+    def __len__(self) -> int:
+        return len(self.grids)
+
+    @overload
+    def __getitem__(self, index: int) -> BingoCard: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "CardBatch": ...
+
+    def __getitem__(self, index: int | slice) -> "BingoCard | CardBatch":
+        if isinstance(index, slice):
+            return CardBatch(self.grids[index])
+        return BingoCard(grid=self.grids[index].tolist())
+
+    def completion_times(self) -> "np.ndarray":
+        """Get the number at which each card wins when numbers are called in order."""
+        return completion_times(self.grids)
+
+
+def completion_times(grids: "np.ndarray") -> "np.ndarray":
+    """Compute when each card wins when numbers are called in order.
+
+    A line completes when its largest value is called, and a card wins with its
+    first completed line, so the win number is the minimum over the lines of
+    each line's maximum. A free space holds `FREE` (0), so it never delays a line.
+
+    Args:
+        grids: Integer array of shape ``(n, rows, cols)``.
+
+    Returns:
+        Array of shape ``(n,)`` with each card's winning number.
+    """
+    import numpy as np
+
+    grids = np.asarray(grids)
+    rows, cols = grids.shape[1:]
+    flat = grids.reshape(-1, rows * cols)
+    return flat[:, line_indices(CardShape(rows, cols))].max(axis=2).min(axis=1)
+
+
+@cache
+def line_indices(shape: CardShape = DEFAULT_SHAPE) -> "np.ndarray":
+    """Get the bit indices of each line as a ``(lines, cells)`` array.
+
+    Lines shorter than the longest one (the columns or rows of a non-square
+    grid) are padded by repeating their first cell, which leaves their maximum
+    unchanged.
+    """
+    import numpy as np
+
+    table = shape.lines
+    width = max(table.sizes)
+    bits = [[i * shape.cols + j for i, j in line] for line in table.lines]
+    return np.array([line + line[:1] * (width - len(line)) for line in bits])
+
+
+@cache
+def _template_groups(shape: CardShape) -> tuple[tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"], ...]:
+    """Get the `win_templates` as bit-index arrays: win, line, blocker and open cells.
+
+    Templates are grouped by their numbers of line cells and blockers, in
+    that order, so that each group's arrays are rectangular (a free space
+    shortens the lines through it). Cached per shape; callers drop the
+    groups their ``win_at`` cannot use. Bit indices fit in int8 up to
+    MAX_GRID_SIZE, which keeps a 7x7 shape's arrays under 2 MB.
+    """
+    import numpy as np
+
+    free_bits = {shape.free_cell[0] * shape.cols + shape.free_cell[1]} if shape.free_cell else set()
+    groups: dict[tuple[int, int], list[tuple[int, list[int], list[int], list[int]]]] = {}
+    for win_cell, line_cells, blocker_cells in win_templates(shape):
+        win_bit = win_cell[0] * shape.cols + win_cell[1]
+        line = [i * shape.cols + j for i, j in line_cells]
+        blockers = [i * shape.cols + j for i, j in blocker_cells]
+        used = {win_bit, *line, *blockers, *free_bits}
+        open_bits = [bit for bit in range(shape.size) if bit not in used]
+        groups.setdefault((len(line), len(blockers)), []).append((win_bit, line, blockers, open_bits))
+    return tuple(
+        tuple(np.array(bits, dtype=np.int8) for bits in (win, line, blockers, open_bits))
+        for win, line, blockers, open_bits in (zip(*group, strict=True) for _, group in sorted(groups.items()))
+    )
+
+
+# splitmix64 constants
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+
+
+def _splitmix64(x: "np.ndarray") -> "np.ndarray":
+    """Hash a uint64 array elementwise with the splitmix64 finalizer."""
+    import numpy as np
+
+    z = x + np.uint64(_GOLDEN_GAMMA)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(_MIX1)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(_MIX2)
+    return z ^ (z >> np.uint64(31))
+
+
+def card_streams(seed: int, start: int, n: int, width: int) -> "np.ndarray":
+    """Get `width` random 64-bit words for each of cards ``start .. start + n - 1``.
+
+    Word ``s`` of card ``i`` is a hash of ``(seed, i, s)``, so every card has
+    its own stream that does not depend on how many cards are generated
+    alongside it or in which order.
+
+    Args:
+        seed: Deck seed (non-negative).
+        start: Index of the first card.
+        n: Number of cards.
+        width: Number of words per card.
+
+    Returns:
+        Array of shape ``(n, width)`` with dtype uint64.
+
+    Raises:
+        ValueError: If `seed` is negative.
+    """
+    import numpy as np
+
+    if seed < 0:
+        raise ValueError(f"Seed must not be negative, got {seed}")
+    seed_word = np.random.SeedSequence(seed).generate_state(1, dtype=np.uint64)[0]
+    with np.errstate(over="ignore"):
+        card_words = _splitmix64(seed_word ^ _splitmix64(np.arange(start, start + n, dtype=np.uint64)))
+        return _splitmix64(card_words[:, None] + np.arange(width, dtype=np.uint64) * np.uint64(_GOLDEN_GAMMA))
+
+
+def new_seed() -> int:
+    """Draw a fresh 63-bit deck seed from the operating system."""
+    return random.SystemRandom().getrandbits(63)
+
+
+def generate_cards_batch(
+    n: int,
+    win_at: int = 20,
+    total_items: int = 30,
+    seed: int | None = None,
+    start: int = 0,
+    unique: "CardIndex | None" = None,
+    shape: CardShape = DEFAULT_SHAPE,
+) -> CardBatch:
+    """Generate many cards that win exactly at `win_at` with vectorized NumPy operations.
+
+    Uses the same layouts as `generate_card`, drawing every card's template and
+    value permutations in a few array operations instead of a Python loop.
+    Card ``i`` of a deck depends only on ``(seed, i)`` (see `card_streams`), so
+    ``generate_cards_batch(1, ..., seed=seed, start=i)[0]`` regenerates it on
+    its own and any split of a deck into batches gives the same cards.
+
+    With `unique`, candidates already in the index (or repeated within the
+    batch) are discarded and replaced by further cards of the deck stream, so
+    the batch holds `n` distinct cards, all of which are added to the index.
+    Card ``i`` is then the ``i``-th accepted candidate rather than deck card ``i``.
+    Replacements are drawn in oversized rounds (see `UNIQUE_MIN_DRAW`), of
+    which only the cards needed are added to the index.
+
+    Args:
+        n: Number of cards to generate.
+        win_at: The number at which bingo should be achieved.
+        total_items: Total number of items in the game.
+        seed: Deck seed (a fresh one from `new_seed` if None).
+        start: Deck index of the first card.
+        unique: Index of cards to avoid duplicating.
+        shape: Card shape.
+
+    Returns:
+        A CardBatch of `n` cards.
+
+    Raises:
+        ValueError: If `n`, `start` or `seed` is negative, or `win_at` is
+            outside `feasible_win_range(total_items, shape)`.
+        RuntimeError: If `UNIQUE_MAX_EMPTY_ROUNDS` uniqueness rounds in a row find no new card.
+    """
+    import numpy as np
+
+    if n < 0:
+        raise ValueError(f"Cannot generate a negative number of cards ({n})")
+    if start < 0:
+        raise ValueError(f"Deck index of the first card must not be negative, got {start}")
+    if seed is not None and seed < 0:
+        raise ValueError(f"Seed must not be negative, got {seed}")
+    _check_win_at(win_at, total_items, shape)
+    if seed is None:
+        seed = new_seed()
+    grids = _generate_grids(n, win_at, total_items, seed, start, shape)
+    if unique is None:
+        return CardBatch(grids)
+
+    kept = [grids[unique.filter(grids)]]
+    found = len(kept[0])
+    start += n
+    draw = max(2 * (n - found), UNIQUE_MIN_DRAW)
+    empty_rounds = 0
+    while found < n:
+        candidates = _generate_grids(draw, win_at, total_items, seed, start, shape)
+        # Later candidates stay out of the index, so the batch is the first `n` distinct cards of the stream
+        accepted = candidates[unique.filter(candidates, limit=n - found)]
+        start += len(candidates)
+        if len(accepted):
+            empty_rounds = 0
+        else:
+            empty_rounds += 1
+            if empty_rounds == UNIQUE_MAX_EMPTY_ROUNDS:
+                raise RuntimeError(f"Could not find {n} unique cards that win at {win_at} with {total_items} items")
+            draw *= 2
+        kept.append(accepted)
+        found += len(accepted)
+    return CardBatch(np.concatenate(kept))
+
+
+def _generate_grids(n: int, win_at: int, total_items: int, seed: int, start: int, shape: CardShape) -> "np.ndarray":
+    """Generate deck cards ``start .. start + n - 1`` as an ``(n, rows, cols)`` array."""
+    import numpy as np
+
+    groups = [
+        group for group in _template_groups(shape)
+        if group[1].shape[1] < win_at and group[2].shape[1] <= total_items - win_at
+    ]
+    leftover_counts = [
+        total_items - 1 - line_bits.shape[1] - blocker_bits.shape[1] for _, line_bits, blocker_bits, _ in groups
+    ]
+
+    # Sorting random words gives a uniform permutation: one word picks the
+    # template, then one word per value to shuffle at each step
+    words = card_streams(seed, start, n, total_items + max(leftover_counts))
+    templates = (words[:, 0] % np.uint64(sum(len(group[0]) for group in groups))).astype(np.intp)
+
+    values_lt_win = np.arange(1, win_at)[np.argsort(words[:, 1:win_at], axis=1)]
+    values_gt_win = np.arange(win_at + 1, total_items + 1)[np.argsort(words[:, win_at:total_items], axis=1)]
+
+    grids = np.full((n, shape.size), FREE, dtype=np.int64)
+    first = 0
+    for (win_bits, line_bits, blocker_bits, open_bits), n_leftover in zip(groups, leftover_counts, strict=True):
+        in_group = (templates >= first) & (templates < first + len(win_bits))
+        rows = np.flatnonzero(in_group)[:, None]
+        group_templates = templates[in_group] - first
+        first += len(win_bits)
+
+        n_line = line_bits.shape[1]
+        n_blockers = blocker_bits.shape[1]
+        lt_win = values_lt_win[in_group]
+        gt_win = values_gt_win[in_group]
+        leftover = np.concatenate([lt_win[:, n_line:], gt_win[:, n_blockers:]], axis=1)
+        order = np.argsort(words[in_group, total_items:total_items + n_leftover], axis=1)
+        remaining_values = np.take_along_axis(leftover, order, axis=1)
+
+        grids[rows[:, 0], win_bits[group_templates]] = win_at
+        grids[rows, line_bits[group_templates]] = lt_win[:, :n_line]
+        grids[rows, blocker_bits[group_templates]] = gt_win[:, :n_blockers]
+        grids[rows, open_bits[group_templates]] = remaining_values[:, : open_bits.shape[1]]
+
+    grids = grids.reshape(n, shape.rows, shape.cols)
+    if n and not (completion_times(grids) == win_at).all():
+        raise RuntimeError(f"Generated cards do not all win at {win_at}")
+    return grids
+
+
+def card_fingerprints(grids: "np.ndarray", symmetric: bool = False) -> list[bytes]:
+    """Encode each grid as a fingerprint of one byte per cell in row-major order (25 bytes for 5x5).
+
+    Args:
+        grids: Integer array of shape ``(n, rows, cols)`` with values below 256.
+        symmetric: Whether to canonicalize under rotation and reflection, so a
+            card and its rotated/reflected copies (7 for square grids, 3 for
+            others) share a fingerprint (the smallest of their encodings).
+            These copies win at the same number, since the symmetries map
+            lines onto lines.
+
+    Returns:
+        One fingerprint per grid.
+
+    Raises:
+        ValueError: If a grid holds a value that does not fit in a byte.
+    """
+    import numpy as np
+
+    grids = np.asarray(grids)
+    if grids.size and not (0 <= grids.min() and grids.max() < 256):
+        raise ValueError("Card fingerprints need item numbers below 256")
+    grids = grids.astype(np.uint8)
+    rows, cols = grids.shape[1:]
+    cells = rows * cols
+    if symmetric:
+        if rows == cols:
+            rotations = [np.rot90(grids, k, axes=(1, 2)) for k in range(4)]
+            variants = [*rotations, *(rotation.transpose(0, 2, 1) for rotation in rotations)]
+        else:
+            variants = [grids, grids[:, ::-1], grids[:, :, ::-1], grids[:, ::-1, ::-1]]
+        # Only the center can be FREE (0), so no fixed-width byte string loses trailing NUL bytes
+        stacked = np.ascontiguousarray(np.stack(variants, axis=1))
+        encoded = stacked.reshape(len(grids), len(variants), cells).view(f"S{cells}")
+        return np.sort(encoded[..., 0], axis=1)[:, 0].tolist()
+    flat = np.ascontiguousarray(grids).reshape(len(grids), cells)
+    return [row.tobytes() for row in flat]
+
+
+class CardIndex:
+    """Set of card fingerprints used to keep a deck free of duplicates.
+
+    Membership checks are constant time, so the cost per card stays flat as a
+    deck grows (a 100,000-card index takes a few megabytes).
+
+    Args:
+        symmetric: Whether rotated or reflected copies of a card count as duplicates.
+    """
+
+    def __init__(self, symmetric: bool = False) -> None:
+        self.symmetric = symmetric
+        self.fingerprints: set[bytes] = set()
+        self.discarded = 0
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+    def __contains__(self, card: BingoCard) -> bool:
+        return card_fingerprints([card.grid], self.symmetric)[0] in self.fingerprints
+
+    def add(self, card: BingoCard) -> bool:
+        """Add a card unless it duplicates one already in the index.
+
+        Args:
+            card: Candidate card.
+
+        Returns:
+            True if the card was new and added, False if it was discarded.
+        """
+        return bool(self.filter([card.grid])[0])
+
+    def filter(self, grids: "np.ndarray", limit: int | None = None) -> "np.ndarray":
+        """Add every new grid to the index, discarding duplicates.
+
+        Args:
+            grids: Integer array of shape ``(n, 5, 5)``.
+            limit: Stop once this many grids were added; later grids are
+                neither added nor counted as discarded.
+
+        Returns:
+            Boolean array of shape ``(n,)``, True for grids that were added.
+        """
+        import numpy as np
+
+        fingerprints = self.fingerprints
+        keep = np.zeros(len(grids), dtype=bool)
+        added = examined = 0
+        for i, fingerprint in enumerate(card_fingerprints(grids, self.symmetric)):
+            if added == limit:
+                break
+            examined += 1
+            if fingerprint not in fingerprints:
+                fingerprints.add(fingerprint)
+                keep[i] = True
+                added += 1
+        self.discarded += examined - added
+        return keep
@@ -1,22 +1,205 @@
-"""Command-line interface for bingo card generation."""
+"""Command-line interface for bingo card generation.
+
+Renderers are imported by the subcommands that use them, so ``bingo --help``
+and HTML-only commands start without loading ReportLab, Playwright or Pillow.
+"""
 
 import argparse
+import os
 import sys
+from pathlib import Path
+
+from .cache import DEFAULT_MAX_BYTES, RenderCache
+from .card import CardIndex, CardShape, feasible_win_range, generate_cards_batch, new_seed
+from .data import available_games, get_pack
+from .fonts import FONT_MODES
+from .imposition import N_UP_CHOICES, PAPER_SIZES
+from .planner import generate_planned_batch, parse_win_distribution, plan_wins
+from .simulate import CALL_ORDERS, simulate_deck
+
+UNIQUE_MODES = ["exact", "symmetric"]
+# Mirrors bingo.images.IMAGE_FORMATS, which the CLI does not import at startup
+IMAGE_FORMATS = ("png", "webp")
+# Mirrors bingo.html_pdf.PDF_ENGINES, which the CLI does not import at startup
+PDF_ENGINES = ("chromium", "native")
+# Top-level packages of the renderers that startup should not pay for
+HEAVY_PACKAGES = ("reportlab", "playwright", "PIL")
+# Number of imports listed by --profile-startup
+PROFILE_TOP = 20
+
+
+def card_shape(spec: str) -> CardShape:
+    """Parse a ``--shape`` value for argparse."""
+    try:
+        return CardShape.parse(spec)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from e
+
+
+def check_counts(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Exit with a usage error on negative counts, deck indices, seeds or jobs, or nothing to simulate."""
+    if args.num < 0:
+        parser.error("--num must not be negative")
+    if args.command == "simulate" and args.num < 1:
+        parser.error("--num must be at least 1 to simulate")
+    if getattr(args, "games", 1) < 1:
+        parser.error("--games must be at least 1")
+    if getattr(args, "start", 0) < 0:
+        parser.error("--start must not be negative")
+    if args.seed is not None and args.seed < 0:
+        parser.error("--seed must not be negative")
+    if args.jobs < 0:
+        parser.error("--jobs must not be negative")
+
+
+def check_win_at(parser: argparse.ArgumentParser, args: argparse.Namespace, total_items: int) -> None:
+    """Exit with a usage error if ``--win-at`` is not feasible for the card shape."""
+    feasible = feasible_win_range(total_items, args.shape)
+    if args.win_at not in feasible:
+        if not feasible:
+            parser.error(f"Cards of shape {args.shape} cannot win at an exact call with {total_items} items")
+        parser.error(f"--win-at must be between {feasible.start} and {feasible.stop - 1} for {args.shape} cards")
+
+
+def plan_schedule(parser: argparse.ArgumentParser, args: argparse.Namespace, total_items: int) -> list[int] | None:
+    """Turn ``--win-distribution`` into a per-card win schedule, exiting on a bad spec.
+
+    Without a distribution, checks instead that ``--win-at`` is feasible for the card shape.
+    """
+    if args.win_distribution is None:
+        check_win_at(parser, args, total_items)
+        return None
+    try:
+        targets = parse_win_distribution(args.win_distribution, total_items, args.shape)
+        return plan_wins(targets, args.num, seed=args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+def import_times(stderr: str) -> list[tuple[str, int, int, int]]:
+    """Parse ``python -X importtime`` output.
+
+    Args:
+        stderr: Standard error of the profiled interpreter.
+
+    Returns:
+        (module, self microseconds, cumulative microseconds, nesting depth)
+        for every import, in the order imports finished.
+    """
+    times = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Header line
+        module = fields[2].strip()
+        # Nested imports are indented by two more spaces per level
+        depth = (len(fields[2].rstrip()) - len(module) - 1) // 2
+        times.append((module, int(fields[0]), int(fields[1]), depth))
+    return times
+
+
+def profile_startup(argv: list[str]) -> int:
+    """Run a bingo command in a fresh interpreter and print its slowest imports.
+
+    Args:
+        argv: Command-line arguments of the command (without ``--profile-startup``).
+
+    Returns:
+        Exit code of the profiled command.
+    """
+    import subprocess
+    import time
+
+    env = dict(os.environ)
+    # Make the child import this copy of bingo even when it is not installed
+    package_root = str(Path(__file__).resolve().parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+    start = time.perf_counter()
+    # Start like the console script, so bingo.cli itself is among the timed imports
+    entry = "import sys; sys.argv[0] = 'bingo'; from bingo.cli import main; sys.exit(main())"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", entry, *argv],
+        env=env,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    other = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+    if other:
+        print("\n".join(other), file=sys.stderr)
+    times = import_times(result.stderr)
+    total = sum(cumulative for _, _, cumulative, depth in times if depth == 0)
+    heavy = sorted({module.partition(".")[0] for module, *_ in times} & set(HEAVY_PACKAGES))
+
+    print(f"\nStartup profile of 'bingo {' '.join(argv)}': {elapsed:.2f}s wall, {total / 1000:.1f} ms importing")
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for module, self_us, cumulative, _ in sorted(times, key=lambda entry: -entry[2])[:PROFILE_TOP]:
+        print(f"{cumulative / 1000:9.1f} ms {self_us / 1000:7.1f} ms  {module}")
+    print(f"Renderers imported: {', '.join(heavy) or 'none'}")
+    return result.returncode
+
+
+def run_bench(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    """Run ``bingo bench``: time the selected cases, write JSON and compare with a baseline."""
+    from .bench import (
+        DEFAULT_THRESHOLD,
+        bench_cases,
+        environment_warning,
+        find_regressions,
+        format_result,
+        read_report,
+        run_benchmarks,
+        select_cases,
+        write_report,
+    )
 
-from .data import get_game_data
-from .html_pdf import generate_festive_cards
-from .pdf import create_key_pdf, generate_cards
+    cases = select_cases(bench_cases(), args.patterns)
+    if not cases:
+        parser.error(f"No benchmark case matches {', '.join(args.patterns)}")
+    if args.list:
+        print("\n".join(case.name for case in cases))
+        return 0
+    if args.rounds is not None and args.rounds < 1:
+        parser.error("--rounds must be at least 1")
+    if args.threshold is not None and args.threshold < 0:
+        parser.error("--threshold must not be negative")
+    baseline = None
+    if args.compare:
+        try:
+            baseline = read_report(args.compare)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
 
-# Available games and their display names for filenames
-GAME_CHOICES = ["meet_me_in_st_louis", "vintage_christmas_films"]
-GAME_FILE_PREFIXES = {
-    "meet_me_in_st_louis": "meet-me-in-st-louis",
-    "vintage_christmas_films": "vintage-christmas-films",
-}
+    report = run_benchmarks(cases, rounds=args.rounds, progress=lambda r: print(format_result(r, baseline)))
+    write_report(report, args.output)
+    print(f"Results written to {args.output}")
+    if baseline is None:
+        return 0
+
+    warning = environment_warning(report, baseline)
+    if warning:
+        print(warning)
+    threshold = DEFAULT_THRESHOLD if args.threshold is None else args.threshold
+    regressions = find_regressions(report, baseline, threshold)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.name}: {regression.baseline * 1000:.3f} ms -> "
+            f"{regression.current * 1000:.3f} ms ({regression.ratio - 1:+.1%})"
+        )
+    if regressions:
+        print(f"{len(regressions)} of {len(report.results)} cases slower than the baseline by over {threshold:.0%}")
+        return 1
+    print(f"No case slower than the baseline by over {threshold:.0%}")
+    return 0
 
 
 def main() -> int:
     """Main entry point for the bingo CLI."""
+    # Game packs are only listed here; one is loaded once a command needs it
+    games = available_games()
     parser = argparse.ArgumentParser(
         description="Generate bingo cards for movie watching parties.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -25,8 +208,39 @@ Examples:
   bingo key                     Generate a bingo key PDF
   bingo cards --num 20          Generate 20 bingo cards
   bingo cards -n 10 -o ./cards  Generate 10 cards in ./cards directory
+  bingo cards -n 200 -j 0       Render 200 cards using all CPUs
+  bingo cards -s 42 --start 6 -n 1
+                                Regenerate card 7 of the deck with seed 42
+  bingo cards -n 200 --single-file --key
+                                Write 200 cards and the key to one PDF
+  bingo festive -n 2000 --unique symmetric
+                                Never repeat a card, even rotated or mirrored
+  bingo cards --shape 5x5-free -w 16
+                                Classic cards with a free center space
+  bingo festive -n 40 --win-distribution "2@18,5@20,rest@24+"
+                                Stagger winners: 2 at call 18, 5 at 20, others from 24
+  bingo simulate --games 1000000 --order film --jitter 2 --skip 0.1
+                                Estimate winners when events are missed or reordered
+  bingo pdf output/*.html       Convert HTML files to PDF with one browser
+  bingo --profile-startup festive -n 30
+                                Show which module imports slow down a command
+  bingo festive -n 500 --pdf --chunk-size 50
+                                Print a large deck in concurrent 50-card shards
+  bingo festive -n 500 --pdf-engine native
+                                Draw the festive PDF with ReportLab, no browser needed
+  bingo cards -n 200 --n-up 4 --paper a4
+                                Print 4 cards per A4 sheet with cut marks
+  bingo images -n 50 -f webp --dpi 96
+                                Render 50 cards as WebP images for sharing on screen
+  bingo bench --compare bench.json -o new.json
+                                Time the hot paths and fail on a 20% slowdown
         """,
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Run the command in a fresh interpreter and print per-module import times",
+    )
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
 
     # Key command
@@ -38,7 +252,7 @@ Examples:
     )
     key_parser.add_argument(
         "-g", "--game",
-        choices=GAME_CHOICES,
+        choices=games,
         default="meet_me_in_st_louis",
         help="Game/movie name (default: meet_me_in_st_louis)",
     )
@@ -63,16 +277,157 @@ Examples:
     )
     cards_parser.add_argument(
         "-g", "--game",
-        choices=GAME_CHOICES,
+        choices=games,
         default="meet_me_in_st_louis",
         help="Game/movie name (default: meet_me_in_st_louis)",
     )
+    cards_parser.add_argument(
+        "--shape",
+        type=card_shape,
+        default=CardShape(),
+        metavar="ROWSxCOLS[-free]",
+        help="Card grid, 3 to 7 cells per side, '-free' for a free center, e.g. 3x3, 4x6, 5x5-free (default: 5x5)",
+    )
+    cards_parser.add_argument(
+        "--win-distribution",
+        metavar="SPEC",
+        default=None,
+        help="How many cards win at each call instead of --win-at, e.g. '2@18,5@20,rest@24+'",
+    )
+    cards_parser.add_argument(
+        "-s", "--seed",
+        type=int,
+        default=None,
+        help="Seed that fixes the deck; reuse a printed seed to reproduce a run (default: random)",
+    )
+    cards_parser.add_argument(
+        "--unique",
+        nargs="?",
+        const="exact",
+        choices=UNIQUE_MODES,
+        default=None,
+        help="Never repeat a card; 'symmetric' also rejects rotated/reflected copies (default mode: exact)",
+    )
+    cards_parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Reuse rendered cards from this render cache directory",
+    )
+    cards_parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="Render cache size limit in MB (default: %(default)s)",
+    )
     cards_parser.add_argument(
         "-w", "--win-at",
         type=int,
         default=20,
         help="Number at which cards should win (default: 20)",
     )
+    cards_parser.add_argument(
+        "--start",
+        type=int,
+        default=0,
+        help="Deck index of the first card, to regenerate part of a seeded deck (default: 0)",
+    )
+    cards_parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes used to render cards, 0 for all CPUs (default: 1)",
+    )
+    cards_parser.add_argument(
+        "--single-file",
+        action="store_true",
+        help="Write all cards to one multi-page PDF (<prefix>.pdf)",
+    )
+    cards_parser.add_argument(
+        "--key",
+        action="store_true",
+        help="Append the bingo key as the last page (with --single-file)",
+    )
+    cards_parser.add_argument(
+        "--n-up",
+        type=int,
+        choices=N_UP_CHOICES,
+        default=1,
+        help="Cards per print sheet, with cut marks (implies --single-file; default: 1)",
+    )
+    cards_parser.add_argument(
+        "--paper",
+        choices=PAPER_SIZES,
+        default="letter",
+        help="Paper size of the print sheets (implies --single-file; default: letter)",
+    )
+
+    # Images command (PNG/WebP cards)
+    images_parser = subparsers.add_parser("images", help="Render bingo cards as PNG or WebP images")
+    images_parser.add_argument(
+        "-n", "--num",
+        type=int,
+        default=10,
+        help="Number of cards to generate (default: 10)",
+    )
+    images_parser.add_argument(
+        "-o", "--output-dir",
+        default=".",
+        help="Output directory (default: current directory)",
+    )
+    images_parser.add_argument(
+        "-p", "--prefix",
+        default=None,
+        help="Filename prefix (default: <game>_card)",
+    )
+    images_parser.add_argument(
+        "-g", "--game",
+        choices=games,
+        default="meet_me_in_st_louis",
+        help="Game/movie name (default: meet_me_in_st_louis)",
+    )
+    images_parser.add_argument(
+        "--shape",
+        type=card_shape,
+        default=CardShape(),
+        metavar="ROWSxCOLS[-free]",
+        help="Card grid, 3 to 7 cells per side, '-free' for a free center, e.g. 3x3, 4x6, 5x5-free (default: 5x5)",
+    )
+    images_parser.add_argument(
+        "-w", "--win-at",
+        type=int,
+        default=20,
+        help="Number at which cards should win (default: 20)",
+    )
+    images_parser.add_argument(
+        "-s", "--seed",
+        type=int,
+        default=None,
+        help="Seed that fixes the deck; the same seed gives the cards of 'bingo cards' (default: random)",
+    )
+    images_parser.add_argument(
+        "--start",
+        type=int,
+        default=0,
+        help="Deck index of the first card, to regenerate part of a seeded deck (default: 0)",
+    )
+    images_parser.add_argument(
+        "-f", "--format",
+        choices=IMAGE_FORMATS,
+        default="png",
+        help="Image format (default: png)",
+    )
+    images_parser.add_argument(
+        "--dpi",
+        type=int,
+        default=150,
+        help="Resolution in pixels per inch (default: 150)",
+    )
+    images_parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=0,
+        help="Number of rendering threads, 0 for all CPUs (default: 0)",
+    )
 
     # Festive command (HTML output)
     festive_parser = subparsers.add_parser("festive", help="Generate festive HTML bingo cards")
@@ -89,10 +444,48 @@ Examples:
     )
     festive_parser.add_argument(
         "-g", "--game",
-        choices=GAME_CHOICES,
+        choices=games,
         default="vintage_christmas_films",
         help="Game/movie name (default: vintage_christmas_films)",
     )
+    festive_parser.add_argument(
+        "--shape",
+        type=card_shape,
+        default=CardShape(),
+        metavar="ROWSxCOLS[-free]",
+        help="Card grid, 3 to 7 cells per side, '-free' for a free center, e.g. 3x3, 4x6, 5x5-free (default: 5x5)",
+    )
+    festive_parser.add_argument(
+        "--win-distribution",
+        metavar="SPEC",
+        default=None,
+        help="How many cards win at each call instead of --win-at, e.g. '2@18,5@20,rest@24+'",
+    )
+    festive_parser.add_argument(
+        "-s", "--seed",
+        type=int,
+        default=None,
+        help="Seed that fixes the deck; reuse a printed seed to reproduce a run (default: random)",
+    )
+    festive_parser.add_argument(
+        "--unique",
+        nargs="?",
+        const="exact",
+        choices=UNIQUE_MODES,
+        default=None,
+        help="Never repeat a card; 'symmetric' also rejects rotated/reflected copies (default mode: exact)",
+    )
+    festive_parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Reuse rendered cards from this render cache directory",
+    )
+    festive_parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="Render cache size limit in MB (default: %(default)s)",
+    )
     festive_parser.add_argument(
         "-w", "--win-at",
         type=int,
@@ -107,26 +500,238 @@ Examples:
     festive_parser.add_argument(
         "--pdf",
         action="store_true",
-        help="Also generate PDF (requires playwright)",
+        help="Also generate PDF (requires playwright unless --pdf-engine native)",
+    )
+    festive_parser.add_argument(
+        "--pdf-engine",
+        choices=PDF_ENGINES,
+        default=None,
+        help="How to make the PDF (implies --pdf): print the HTML with Chromium, or draw it natively "
+        "with ReportLab (default: chromium)",
+    )
+    festive_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="With --pdf and the chromium engine, print shards of this many cards concurrently and join them",
+    )
+    festive_parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=0,
+        help="Number of shards printed at once with --chunk-size, 0 for all CPUs (default: 0)",
+    )
+    festive_parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Write gzip-compressed HTML (.html.gz); a Chromium --pdf then requires --chunk-size",
+    )
+    festive_parser.add_argument(
+        "--fonts",
+        choices=FONT_MODES,
+        default="google",
+        help="Webfont source: Google Fonts, or bundled fonts as file URLs or inline data; "
+        "local modes draw emoji with monochrome Noto Emoji (default: google)",
+    )
+    festive_parser.add_argument(
+        "--n-up",
+        type=int,
+        choices=N_UP_CHOICES,
+        default=1,
+        help="Cards per sheet of the PDF, with cut marks (default: 1)",
+    )
+    festive_parser.add_argument(
+        "--paper",
+        choices=PAPER_SIZES,
+        default="letter",
+        help="Paper size of the PDF (default: letter)",
+    )
+
+    # Simulate command (Monte Carlo games against a deck)
+    simulate_parser = subparsers.add_parser("simulate", help="Simulate games with randomized call orders")
+    simulate_parser.add_argument(
+        "-n", "--num",
+        type=int,
+        default=30,
+        help="Number of cards in the deck (default: 30)",
+    )
+    simulate_parser.add_argument(
+        "-g", "--game",
+        choices=games,
+        default="meet_me_in_st_louis",
+        help="Game/movie name (default: meet_me_in_st_louis)",
+    )
+    simulate_parser.add_argument(
+        "--shape",
+        type=card_shape,
+        default=CardShape(),
+        metavar="ROWSxCOLS[-free]",
+        help="Card grid, 3 to 7 cells per side, '-free' for a free center, e.g. 3x3, 4x6, 5x5-free (default: 5x5)",
+    )
+    simulate_parser.add_argument(
+        "-w", "--win-at",
+        type=int,
+        default=20,
+        help="Number at which cards win in film order (default: 20)",
+    )
+    simulate_parser.add_argument(
+        "--win-distribution",
+        metavar="SPEC",
+        default=None,
+        help="How many cards win at each call in film order instead of --win-at",
+    )
+    simulate_parser.add_argument(
+        "-s", "--seed",
+        type=int,
+        default=None,
+        help="Seed that fixes the deck and the simulated games (default: random)",
+    )
+    simulate_parser.add_argument(
+        "--games",
+        type=int,
+        default=100_000,
+        help="Number of games to simulate (default: 100000)",
+    )
+    simulate_parser.add_argument(
+        "--order",
+        choices=CALL_ORDERS,
+        default="shuffle",
+        help="Call events in random order, or in film order with --jitter/--skip (default: shuffle)",
+    )
+    simulate_parser.add_argument(
+        "--jitter",
+        type=float,
+        default=0.0,
+        help="With --order film, move each event by this many positions (standard deviation)",
+    )
+    simulate_parser.add_argument(
+        "--skip",
+        type=float,
+        default=0.0,
+        help="Probability that an event is missed, e.g. for partial viewing (default: 0)",
+    )
+    simulate_parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=0,
+        help="Number of simulation processes, 0 for all CPUs (default: 0)",
+    )
+
+    # PDF command (batch HTML/markdown conversion)
+    pdf_parser = subparsers.add_parser("pdf", help="Convert HTML/markdown files to PDF (requires playwright)")
+    pdf_parser.add_argument(
+        "files",
+        nargs="+",
+        help="HTML (.html) or markdown (.md) files to convert",
+    )
+    pdf_parser.add_argument(
+        "-o", "--output-dir",
+        default=None,
+        help="Output directory (default: next to each input file)",
+    )
+    pdf_parser.add_argument(
+        "-g", "--game",
+        choices=games,
+        default="meet_me_in_st_louis",
+        help="Game/movie name used to style markdown (default: meet_me_in_st_louis)",
+    )
+    pdf_parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Use bundled fonts for markdown and skip waiting for the network",
+    )
+
+    # Bench command (timings of the hot paths)
+    bench_parser = subparsers.add_parser("bench", help="Benchmark card generation and rendering")
+    bench_parser.add_argument(
+        "-k",
+        dest="patterns",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Only run cases whose name contains PATTERN (repeatable)",
+    )
+    bench_parser.add_argument(
+        "-o", "--output",
+        default="bench.json",
+        help="JSON results file (default: bench.json)",
+    )
+    bench_parser.add_argument(
+        "--compare",
+        metavar="BASELINE",
+        default=None,
+        help="Results file of an earlier run; exit with status 1 if a case got slower than --threshold",
+    )
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=None,
+        help="Allowed growth of a case's median time over the baseline (default: 0.2, i.e. 20%%)",
+    )
+    bench_parser.add_argument(
+        "--rounds",
+        type=int,
+        default=None,
+        help="Rounds per case (default: 5, 3 for the slowest cases)",
+    )
+    bench_parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List the benchmark cases and exit",
     )
 
     args = parser.parse_args()
 
+    if args.profile_startup:
+        return profile_startup([arg for arg in sys.argv[1:] if arg != "--profile-startup"])
+
     if args.command is None:
         parser.print_help()
         return 1
 
+    deck_parsers = {
+        "cards": cards_parser, "images": images_parser, "festive": festive_parser, "simulate": simulate_parser,
+    }
+    if args.command in deck_parsers:
+        check_counts(deck_parsers[args.command], args)
+
+    if args.command in ("cards", "images", "festive", "simulate") and args.seed is None:
+        args.seed = new_seed()
+        print(f"Seed: {args.seed}")
+
+    unique = None
+    if getattr(args, "unique", None):
+        unique = CardIndex(symmetric=args.unique == "symmetric")
+
+    cache = None
+    if getattr(args, "cache_dir", None):
+        cache = RenderCache(args.cache_dir, max_bytes=args.cache_size * 1024 * 1024)
+
+    if args.command == "bench":
+        return run_bench(bench_parser, args)
+
+    # Load (and validate) the selected game pack
+    try:
+        pack = get_pack(args.game)
+    except ValueError as e:
+        parser.error(str(e))
+
     if args.command == "key":
-        items = get_game_data(args.game)
-        game_prefix = GAME_FILE_PREFIXES[args.game]
+        items = pack.items
+        game_prefix = pack.file_prefix
         output = args.output or f"{game_prefix}_key.pdf"
+        from .pdf import create_key_pdf
         create_key_pdf(items, output, game=args.game)
         return 0
 
     if args.command == "cards":
-        items = get_game_data(args.game)
-        game_prefix = GAME_FILE_PREFIXES[args.game]
+        items = pack.items
+        win_schedule = plan_schedule(cards_parser, args, len(items))
+        game_prefix = pack.file_prefix
         prefix = args.prefix or f"{game_prefix}_card"
+        if args.n_up != 1 or args.paper != "letter":
+            args.single_file = True
+        from .pdf import generate_cards
         filenames = generate_cards(
             items,
             num_cards=args.num,
@@ -134,17 +739,69 @@ Examples:
             prefix=prefix,
             win_at=args.win_at,
             game=args.game,
+            seed=args.seed,
+            start=args.start,
+            workers=args.jobs,
+            single_file=args.single_file,
+            include_key=args.key,
+            cache=cache,
+            unique=unique,
+            win_schedule=win_schedule,
+            shape=args.shape,
+            n_up=args.n_up,
+            paper=args.paper,
         )
-        print(f"Generated {len(filenames)} cards")
+        if args.single_file:
+            print(f"Generated {args.num} cards in {filenames[0]}")
+        else:
+            print(f"Generated {len(filenames)} cards")
+        if unique is not None:
+            print(f"Unique deck: discarded {unique.discarded} duplicate candidates")
+        if cache is not None:
+            print(cache.summary())
+        return 0
+
+    if args.command == "images":
+        if args.dpi <= 0:
+            images_parser.error("--dpi must be positive")
+        check_win_at(images_parser, args, len(pack.items))
+        from .images import generate_images
+        filenames = generate_images(
+            pack.items,
+            num_cards=args.num,
+            output_dir=args.output_dir,
+            prefix=args.prefix or f"{pack.file_prefix}_card",
+            win_at=args.win_at,
+            game=args.game,
+            seed=args.seed,
+            start=args.start,
+            shape=args.shape,
+            fmt=args.format,
+            dpi=args.dpi,
+            workers=args.jobs,
+        )
+        print(f"Generated {len(filenames)} card images")
         return 0
 
     if args.command == "festive":
-        from pathlib import Path
-        items = get_game_data(args.game)
-        game_prefix = GAME_FILE_PREFIXES[args.game]
+        items = pack.items
+        win_schedule = plan_schedule(festive_parser, args, len(items))
+        game_prefix = pack.file_prefix
         output_dir = Path("output")
         output_dir.mkdir(exist_ok=True)
         output = args.output or str(output_dir / f"{game_prefix}_cards-festive.html")
+        pdf_engine = args.pdf_engine or "chromium"
+        if args.pdf_engine is not None:
+            args.pdf = True
+        if pdf_engine == "native" and args.chunk_size:
+            festive_parser.error("--chunk-size requires --pdf-engine chromium")
+        if args.gzip and args.pdf and pdf_engine == "chromium" and not args.chunk_size:
+            festive_parser.error("--gzip with --pdf requires --chunk-size")
+        if (args.n_up != 1 or args.paper != "letter") and not args.pdf:
+            festive_parser.error("--n-up and --paper apply to the PDF; add --pdf or --pdf-engine")
+        if args.gzip and not output.endswith(".gz"):
+            output += ".gz"
+        from .html_pdf import generate_festive_cards
         generate_festive_cards(
             items,
             num_cards=args.num,
@@ -152,11 +809,68 @@ Examples:
             game=args.game,
             win_at=args.win_at,
             include_key=not args.no_key,
+            fonts=args.fonts,
+            pdf_file=output.removesuffix(".gz").replace(".html", ".pdf") if args.pdf else None,
+            chunk_size=args.chunk_size,
+            jobs=args.jobs,
+            compress=args.gzip,
+            cache=cache,
+            seed=args.seed,
+            unique=unique,
+            win_schedule=win_schedule,
+            shape=args.shape,
+            pdf_engine=pdf_engine,
+            n_up=args.n_up,
+            paper=args.paper,
+        )
+        if unique is not None:
+            print(f"Unique deck: discarded {unique.discarded} duplicate candidates")
+        if cache is not None:
+            print(cache.summary())
+        return 0
+
+    if args.command == "simulate":
+        items = pack.items
+        win_schedule = plan_schedule(simulate_parser, args, len(items))
+        if win_schedule is not None:
+            deck = generate_planned_batch(win_schedule, total_items=len(items), seed=args.seed, shape=args.shape)
+        else:
+            deck = generate_cards_batch(
+                args.num, win_at=args.win_at, total_items=len(items), seed=args.seed, shape=args.shape
+            )
+        try:
+            result = simulate_deck(
+                deck.grids,
+                len(items),
+                games=args.games,
+                order=args.order,
+                jitter=args.jitter,
+                skip=args.skip,
+                seed=args.seed,
+                workers=args.jobs,
+            )
+        except ValueError as e:
+            simulate_parser.error(str(e))
+        print(result.summary())
+        return 0
+
+    if args.command == "pdf":
+        from .html_pdf import PdfRenderer
+        output_dir = Path(args.output_dir) if args.output_dir else None
+        if output_dir:
+            output_dir.mkdir(parents=True, exist_ok=True)
+        with PdfRenderer(offline=args.offline) as renderer:
+            for source in map(Path, args.files):
+                pdf_output = str((output_dir or source.parent) / f"{source.stem}.pdf")
+                if source.suffix == ".md":
+                    renderer.markdown_to_pdf(str(source), pdf_output, game=args.game)
+                else:
+                    renderer.html_to_pdf(str(source), pdf_output)
+        total = sum(seconds for _, seconds in renderer.timings)
+        print(
+            f"Converted {len(renderer.timings)} files in {total:.2f}s "
+            f"(browser startup {renderer.startup_time:.2f}s)"
         )
-        if args.pdf:
-            from .html_pdf import html_to_pdf
-            pdf_output = output.replace(".html", ".pdf")
-            html_to_pdf(output, pdf_output)
         return 0
 
     return 1
@@ -1,6 +1,47 @@
-"""Bingo game data definitions."""
+"""Bingo game data definitions.
 
-from dataclasses import dataclass
+Games are defined by game packs: JSON or TOML files named after the game
+(``meet_me_in_st_louis.json``) holding its items, titles, festive theme and
+key sections. Packs are discovered from
+
+- the files bundled in ``bingo/games``,
+- the directories listed in the ``BINGO_GAME_PATH`` environment variable
+  (separated by `os.pathsep`; later directories override earlier ones), and
+- ``bingo.games`` entry points of installed distributions, each resolving to
+  a `GamePack`, a callable returning one, or the path of a pack file.
+
+Discovery only lists names; a pack is parsed and validated the first time it
+is used and then cached, so startup does not depend on the number of packs.
+"""
+
+import json
+import os
+import tomllib
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
+
+# Directory of the bundled game packs
+GAMES_DIR = Path(__file__).parent / "games"
+# Environment variable with extra game pack directories
+GAME_PATH_ENV = "BINGO_GAME_PATH"
+ENTRY_POINT_GROUP = "bingo.games"
+PACK_SUFFIXES = (".json", ".toml")
+
+# Festive theme of packs that do not define colors
+DEFAULT_COLORS = {
+    "primary": "#8B0000",  # Dark red
+    "secondary": "#228B22",  # Forest green
+    "accent": "#FFD700",  # Gold
+    "bg": "#FFF8DC",  # Cornsilk
+    "border": "#8B4513",  # Saddle brown
+    "text": "#2F4F4F",  # Dark slate gray
+}
 
 
 @dataclass
@@ -11,81 +52,180 @@ class BingoItem:
     description: str
 
 
-# Meet Me In St. Louis (1944) bingo items
-# Songs are prefixed with musical note, quotes with speech bubble
-MEET_ME_IN_ST_LOUIS = [
-    BingoItem(1, "\U0001F3B5\U0001F3A1", "Meet Me in St. Louis, Louis"),
-    BingoItem(2, "\U0001F4AC\U0001F480", "I expect she won't live through the night. She has four fatal diseases."),
-    BingoItem(3, "\U0001F4AC\U0001F6D1", "For heaven's sakes, stop that screeching!"),
-    BingoItem(4, "\U0001F4AC\U0001F3A1", "I can't believe it. Right here where we live - right here in St. Louis."),
-    BingoItem(5, "\U0001F3B5\U0001F3E0", "The Boy Next Door"),
-    BingoItem(6, "\U0001F4AC\u2705", "Just when was I voted out of this family?"),
-    BingoItem(7, "\U0001F4AC\U0001F37A", "I was drunk last night, dear Mother; I was drunk the night before."),
-    BingoItem(8, "\U0001F3B5\U0001F483", "Skip to My Lou"),
-    BingoItem(9, "\U0001F3B5\U0001F38B", "Under the Bamboo Tree"),
-    BingoItem(10, "\U0001F3B5\U0001F319", "Over the Bannister"),
-    BingoItem(11, "\U0001F3B5\U0001F68B", "The Trolley Song"),
-    BingoItem(12, "\U0001F4AC\U0001F52B", "They'll all be safe with me. I've got twelve guns in my room."),
-    BingoItem(13, "\U0001F4AC\U0001F608", "You're the most deceitful, horrible, sinful creature I ever saw..."),
-    BingoItem(14, "\U0001F4AC\U0001F44A", "If there's anything I hate, loathe, despise, and abominate, it's a bully."),
-    BingoItem(15, "\U0001F4AC\U0001F498", "If you're not busy tomorrow night, could you beat me up again?"),
-    BingoItem(16, "\U0001F4AC\u26B0\uFE0F", "It'll take me at least a week to dig up all my dolls in the cemetery."),
-    BingoItem(17, "\U0001F4AC\U0001F3E2", "Rich people have houses. People like us live in flats..."),
-    BingoItem(18, "\U0001F3B5\U0001F694", "Aren't you afraid to stay here alone with a criminal?"),
-    BingoItem(19, "\U0001F4AC\U0001F634", "You don't need any beauty sleep."),
-    BingoItem(20, "\U0001F4AC\U0001F48B", "I'm going to let John Truett kiss me tonight."),
-    BingoItem(21, "\U0001F4AC\U0001F440", "If we're going to wreck Lucille Ballard's evening, we've simply got to be a sensation."),  # noqa: E501
-    BingoItem(22, "\U0001F4AC\U0001F338", "Men don't want the bloom rubbed off."),
-    BingoItem(23, "\U0001F4AC\U0001F33A", "Personally, I think I have too much bloom. Maybe that's the trouble with me."),  # noqa: E501
-    BingoItem(24, "\U0001F4AC\U0001F4B0", "Money! I hate, loathe, despise, and abominate money!"),
-    BingoItem(25, "\U0001F4AC\U0001F3B7", "Wasn't I lucky to be born in my favorite city?"),
-    BingoItem(26, "\U0001F4AC\U0001F46D", "You and I"),
-    BingoItem(27, "\U0001F4AC\U0001F46B", "We could be happy anywhere as long as we're together."),
-    BingoItem(28, "\U0001F4AC\u2603\uFE0F", "I'd rather kill them if we can't take them with us."),
-    BingoItem(29, "\U0001F3B5\U0001F384", "Have Yourself a Merry Little Christmas"),
-    BingoItem(30, "\U0001F4AC\U0001F4A1", "I never dreamed anything could be so beautiful."),
-]
-
-
-# Vintage Christmas Films (1898-1909) bingo items
-# 4 silent films: Santa Claus (1898), A Winter Straw Ride (1906),
-# The Night Before Christmas (1905), A Trap for Santa Claus (1909)
-VINTAGE_CHRISTMAS_FILMS = [
-    # Santa Claus (1898) - 2 events
-    BingoItem(1, "\U0001F385\U0001F6CF\uFE0F", "Maid puts children to bed"),
-    BingoItem(2, "\U0001F385\U0001F9E6", "Santa fills stockings"),
-    # A Winter Straw Ride (1906) - 6 events
-    BingoItem(3, "\U0001F6F7\U0001F6F7", "Board straw carts"),
-    BingoItem(4, "\U0001F6F7\u26EA", "Leaving church"),
-    BingoItem(5, "\U0001F6F7\U0001F40E", "Ride begins"),
-    BingoItem(6, "\U0001F6F7\u26C4", "Snowball throwing"),
-    BingoItem(7, "\U0001F6F7\U0001F4A5", "Cart tips over"),
-    BingoItem(8, "\U0001F6F7\U0001F3C3\u200D\u2640\uFE0F", "Chase scene"),
-    # The Night Before Christmas (1905) - 8 events
-    BingoItem(9, "\U0001F319\U0001F98C", "Santa feeds reindeer"),
-    BingoItem(10, "\U0001F319\U0001F528", "Finishes making toys"),
-    BingoItem(11, "\U0001F319\U0001F467", "Children hang stockings"),
-    BingoItem(12, "\U0001F319\U0001F634", "Children sent to bed"),
-    BingoItem(13, "\U0001F319\U0001F4E6", "Santa loads sleigh"),
-    BingoItem(14, "\U0001F319\U0001F3D4\uFE0F", "Sleigh journey (diorama)"),
-    BingoItem(15, "\U0001F319\U0001F3E0", "Santa on rooftop"),
-    BingoItem(16, "\U0001F319\U0001F381", "Children discover presents"),
-    # A Trap for Santa Claus (1909) - 14 events
-    BingoItem(17, "\U0001F4B0\U0001F37A", "Father drinking at bar"),
-    BingoItem(18, "\U0001F4B0\U0001F44B", "Father abandons family"),
-    BingoItem(19, "\U0001F4B0\U0001F4DC", "Attorney brings news of inheritance"),
-    BingoItem(20, "\U0001F4B0\U0001F3E1", "Wife inherits fortune"),
-    BingoItem(21, "\U0001F4B0\U0001F69A", "Family moves to mansion"),
-    BingoItem(22, "\U0001F4B0\U0001FA9F", "No chimney in new house"),
-    BingoItem(23, "\U0001F4B0\U0001F64F", "Children pray before bed"),
-    BingoItem(24, "\U0001F4B0\U0001FAA4", "Children set trap for Santa"),
-    BingoItem(25, "\U0001F4B0\U0001F6CF\uFE0F", "Mother tucks children into bed"),
-    BingoItem(26, "\U0001F4B0\U0001F622", "Mother's sadness (missing husband)"),
-    BingoItem(27, "\U0001F4B0\U0001F977", "Father appears as burglar"),
-    BingoItem(28, "\U0001F4B0\u26A1", "Father caught in trap"),
-    BingoItem(29, "\U0001F4B0\U0001F631", "Mother recognizes husband"),
-    BingoItem(30, "\U0001F4B0\U0001F91D", "Family reconciliation"),
-]
+@dataclass
+class GamePack:
+    """Everything that defines a game: its items, titles and festive theme.
+
+    Attributes:
+        name: Game name used on the command line, e.g. ``meet_me_in_st_louis``.
+        title: Display title.
+        items: Items in film order (``order`` runs from 1).
+        subtitle: Festive card subtitle.
+        file_prefix: Prefix of output filenames (defaults to the hyphenated name).
+        colors: Festive theme colors, see `DEFAULT_COLORS`.
+        key_sections: Key page sections as (section name, first order, last order).
+    """
+    name: str
+    title: str
+    items: list[BingoItem]
+    subtitle: str = ""
+    file_prefix: str = ""
+    colors: dict[str, str] = field(default_factory=lambda: dict(DEFAULT_COLORS))
+    key_sections: list[tuple[str, int, int]] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.file_prefix:
+            self.file_prefix = self.name.replace("_", "-")
+
+    def validate(self) -> None:
+        """Check that items are numbered 1..N and the theme and sections are complete.
+
+        Raises:
+            ValueError: If the pack is inconsistent.
+        """
+        if not self.items:
+            raise ValueError(f"Game pack {self.name!r} has no items")
+        orders = [item.order for item in self.items]
+        if orders != list(range(1, len(orders) + 1)):
+            raise ValueError(f"Game pack {self.name!r} items must be numbered 1..{len(orders)} in order")
+        for item in self.items:
+            if not item.emoji or not item.description:
+                raise ValueError(f"Game pack {self.name!r} item {item.order} needs an emoji and a description")
+        missing = DEFAULT_COLORS.keys() - self.colors.keys()
+        if missing:
+            raise ValueError(f"Game pack {self.name!r} colors are missing {', '.join(sorted(missing))}")
+        for section, first, last in self.key_sections:
+            if not 1 <= first <= last <= len(self.items):
+                raise ValueError(f"Game pack {self.name!r} key section {section!r} is outside 1..{len(self.items)}")
+
+
+def parse_pack(name: str, data: Mapping) -> GamePack:
+    """Build a validated GamePack from the contents of a pack file.
+
+    Args:
+        name: Game name.
+        data: Parsed pack with ``title`` and ``items`` (each with ``order``,
+            ``emoji`` and ``description``), and optionally ``subtitle``,
+            ``file_prefix``, ``colors`` and ``key_sections`` (each with
+            ``name``, ``first`` and ``last``).
+
+    Returns:
+        The game pack.
+
+    Raises:
+        ValueError: If fields are missing or inconsistent.
+    """
+    try:
+        pack = GamePack(
+            name=name,
+            title=data["title"],
+            items=[BingoItem(int(item["order"]), item["emoji"], item["description"]) for item in data["items"]],
+            subtitle=data.get("subtitle", ""),
+            file_prefix=data.get("file_prefix", ""),
+            colors={**DEFAULT_COLORS, **data.get("colors", {})},
+            key_sections=[
+                (section["name"], int(section["first"]), int(section["last"]))
+                for section in data.get("key_sections", [])
+            ],
+        )
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Game pack {name!r} is missing or has a malformed field: {e}") from e
+    pack.validate()
+    return pack
+
+
+def read_pack(path: str | Path, name: str | None = None) -> GamePack:
+    """Load a game pack file.
+
+    Args:
+        path: ``.json`` or ``.toml`` pack file.
+        name: Game name (defaults to the file name without suffix).
+
+    Returns:
+        The validated game pack.
+
+    Raises:
+        ValueError: If the file is not a valid pack.
+    """
+    path = Path(path)
+    try:
+        if path.suffix == ".toml":
+            data = tomllib.loads(path.read_text(encoding="utf-8"))
+        else:
+            data = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, tomllib.TOMLDecodeError) as e:
+        raise ValueError(f"Cannot parse game pack {path}: {e}") from e
+    return parse_pack(name or path.stem, data)
+
+
+def _pack_files(directory: Path) -> dict[str, Path]:
+    if not directory.is_dir():
+        return {}
+    return {path.stem: path for path in sorted(directory.iterdir()) if path.suffix in PACK_SUFFIXES}
+
+
+@cache
+def _game_sources() -> dict[str, "Path | EntryPoint"]:
+    """Find every available game without loading any of them."""
+    from importlib.metadata import entry_points
+
+    sources: dict[str, Path | EntryPoint] = {}
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        sources[entry_point.name] = entry_point
+    sources.update(_pack_files(GAMES_DIR))
+    for directory in filter(None, os.environ.get(GAME_PATH_ENV, "").split(os.pathsep)):
+        sources.update(_pack_files(Path(directory)))
+    return sources
+
+
+def available_games() -> list[str]:
+    """Get the names of all discovered games, sorted."""
+    return sorted(_game_sources())
+
+
+@cache
+def get_pack(name: str) -> GamePack:
+    """Load, validate and cache a game pack.
+
+    Args:
+        name: Name of the game/movie.
+
+    Returns:
+        The game pack.
+
+    Raises:
+        ValueError: If game name is not recognized or its pack is invalid.
+    """
+    sources = _game_sources()
+    if name not in sources:
+        raise ValueError(f"Unknown game: {name}. Available: {available_games()}")
+    source = sources[name]
+    if isinstance(source, Path):
+        return read_pack(source)
+
+    loaded: GamePack | Callable[[], GamePack] | str | Path = source.load()
+    if isinstance(loaded, str | Path):
+        return read_pack(loaded, name)
+    pack = loaded if isinstance(loaded, GamePack) else loaded()
+    pack.validate()
+    return pack
+
+
+def find_pack(name: str) -> GamePack | None:
+    """Get a game pack, or None if no game of that name is available."""
+    return get_pack(name) if name in _game_sources() else None
+
+
+def game_title(name: str) -> str:
+    """Get the title of a game from its pack (the name itself for unknown games)."""
+    pack = find_pack(name)
+    return pack.title if pack else name
+
+
+def reload_games() -> None:
+    """Forget discovered and cached packs, e.g. after changing ``BINGO_GAME_PATH``."""
+    _game_sources.cache_clear()
+    get_pack.cache_clear()
 
 
 def get_game_data(name: str = "meet_me_in_st_louis") -> list[BingoItem]:
@@ -100,10 +240,17 @@ def get_game_data(name: str = "meet_me_in_st_louis") -> list[BingoItem]:
     Raises:
         ValueError: If game name is not recognized.
     """
-    games = {
-        "meet_me_in_st_louis": MEET_ME_IN_ST_LOUIS,
-        "vintage_christmas_films": VINTAGE_CHRISTMAS_FILMS,
-    }
-    if name not in games:
-        raise ValueError(f"Unknown game: {name}. Available: {list(games.keys())}")
-    return games[name]
+    return get_pack(name).items
+
+
+# Item lists of the bundled games, loaded on first access
+_LEGACY_GAMES = {
+    "MEET_ME_IN_ST_LOUIS": "meet_me_in_st_louis",
+    "VINTAGE_CHRISTMAS_FILMS": "vintage_christmas_films",
+}
+
+
+def __getattr__(name: str) -> list[BingoItem]:
+    if name in _LEGACY_GAMES:
+        return get_game_data(_LEGACY_GAMES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,503 @@
+"""Festive bingo cards drawn directly as vector PDF with ReportLab.
+
+A browser-free counterpart of the festive HTML templates in `bingo.html_pdf`:
+the same page layout, theme colors, double borders, corner decorations,
+snowflakes and two-column key, with sizes taken from the template CSS as it
+prints (1px = 0.75pt). Rendering needs no Chromium and costs a few
+milliseconds per card.
+"""
+
+import hashlib
+import random
+import time
+from collections.abc import Iterable
+from functools import cache, partial
+from html import unescape
+
+from reportlab.lib.colors import HexColor, white
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen import canvas
+
+from .card import DEFAULT_SHAPE, FREE, FREE_LABEL, BingoCard, CardShape
+from .data import DEFAULT_COLORS, BingoItem, find_pack
+from .fonts import FONT_DIR
+from .html_pdf import SNOWFLAKE_POOL_SIZE, snowflake_key, snowflake_params, snowflake_picks
+from .imposition import impose_pages, sheet_layout
+from .pdf import draw_emoji, get_emoji_atlas, get_emoji_font, register_fonts
+
+# Points per CSS pixel
+PX = 0.75
+PAGE_WIDTH, PAGE_HEIGHT = letter
+# The 7.5in x 10in card page inside the 0.5in @page margin
+PAGE_MARGIN = 36.0
+BOX_WIDTH = PAGE_WIDTH - 2 * PAGE_MARGIN
+BOX_HEIGHT = PAGE_HEIGHT - 2 * PAGE_MARGIN
+BORDER = 4 * PX  # Double border width in print
+BOX_RADIUS = 15 * PX
+CARD_PADDING = 0.3 * 72
+KEY_PADDING = 0.35 * 72
+# The accent frame and corner decorations sit 25px inside the border
+DECOR_INSET = 25 * PX
+GRID_GAP = 4 * PX
+# Line box height as a multiple of the font size, and the baseline's offset from the top of the box
+LINE_HEIGHT = 1.25
+BASELINE = 0.95
+
+# Decorations drawn with the emoji font: corners, titles and footers
+DECORATIONS = "❄\U0001F384"
+CARD_FOOTER = "❄ Mark each event as you see it in the films! ❄"
+KEY_FOOTER = "❄ Happy Viewing! ❄"
+# Snowflake symbols in ZapfDingbats, a standard PDF font that needs no embedding
+_DINGBATS = {"❄", "❅", "❆"}
+# Cell fills: the midpoints of the alternating white-to-tint cell gradients
+_CELL_FILLS = (HexColor("#FFFBF8"), HexColor("#FAFAFA"))
+
+# Festive webfonts (see LOCAL_WEBFONTS) by role, with the standard PDF font used when one is not bundled
+FESTIVE_FONTS = {
+    "title": ("CinzelDecorative-Bold.ttf", "Times-Bold"),
+    "text": ("MountainsofChristmas-Regular.ttf", "Helvetica"),
+    "bold": ("MountainsofChristmas-Bold.ttf", "Helvetica-Bold"),
+    "italic": ("MountainsofChristmas-Regular.ttf", "Helvetica-Oblique"),
+}
+
+
+@cache
+def festive_fonts() -> dict[str, str]:
+    """Register the bundled festive webfonts and get the font name of each role."""
+    register_fonts()
+    names = {}
+    for role, (filename, fallback) in FESTIVE_FONTS.items():
+        path = FONT_DIR / filename
+        if not path.exists():
+            names[role] = fallback
+            continue
+        names[role] = path.stem
+        if path.stem not in pdfmetrics.getRegisteredFontNames():
+            pdfmetrics.registerFont(TTFont(path.stem, str(path)))
+    return names
+
+
+def _baseline(top: float, size: float) -> float:
+    """Get the PDF y of the baseline of a line whose box starts `top` points below the top of the page."""
+    return PAGE_HEIGHT - top - BASELINE * size
+
+
+class NativeFestiveRenderer:
+    """Festive cards and key drawn on a ReportLab canvas, set up once per game.
+
+    Colors, titles and key sections come from the game pack, and the grid
+    geometry, fonts and snowflake pool are prepared once, as in
+    `bingo.html_pdf.FestiveRenderer`. With the same seed, a card gets the
+    same snowflakes as its HTML page.
+
+    Cell backgrounds are flat fills of their gradients' midpoints, and the
+    festive webfonts fall back to standard PDF fonts unless they are bundled
+    in FONT_DIR.
+
+    Args:
+        items: List of BingoItem objects.
+        game: Game name for styling and title.
+        seed: Seed for the snowflake decorations (random if None).
+        shape: Shape of the cards.
+    """
+
+    def __init__(
+        self,
+        items: list[BingoItem],
+        game: str = "vintage_christmas_films",
+        seed: int | None = None,
+        shape: CardShape = DEFAULT_SHAPE,
+    ) -> None:
+        self.items = items
+        self.shape = shape
+        pack = find_pack(game)
+        self.colors = {name: HexColor(value) for name, value in (pack.colors if pack else DEFAULT_COLORS).items()}
+        self.game_title = pack.title if pack else game.replace("_", " ").title()
+        self.subtitle = pack.subtitle if pack else ""
+        self.key_sections = pack.key_sections if pack else []
+        self.fonts = festive_fonts()
+        self.emoji_font = get_emoji_font(items, extra=DECORATIONS)
+        self.emoji_atlas = get_emoji_atlas(items)
+        self._emoji = {item.order: item.emoji for item in items}
+        self._emoji_chars = {char for item in items for char in item.emoji} | set(DECORATIONS)
+
+        rng = random.Random(seed)
+        self._snowflakes = [snowflake_params(rng) for _ in range(SNOWFLAKE_POOL_SIZE)]
+        self._snowflake_key = snowflake_key(seed)
+        self._layout_grid()
+        # Names the shared card form of this theme, titles and shape (see `_card_form`)
+        self._form_key = hashlib.sha256(
+            repr((self.game_title, self.subtitle, shape, sorted(self.colors.items()))).encode()
+        ).hexdigest()[:16]
+
+    def _layout_grid(self) -> None:
+        """Place the grid and its cells below the titles, as the card CSS does."""
+        rows, cols = self.shape.rows, self.shape.cols
+        span = max(rows, cols)
+        content_width = BOX_WIDTH - 2 * (BORDER + CARD_PADDING)
+        self._grid_width = min(content_width, 100 * PX * cols * 5 / span)
+        cell = (self._grid_width - 2 * GRID_GAP - (cols - 1) * GRID_GAP) / cols
+        self._grid_height = rows * cell + (rows + 1) * GRID_GAP
+        self._emoji_size = 160 * PX / span
+        self._free_size = 80 * PX / span
+
+        # Title (h1 + 5px), game title (h2 + 15px) and subtitle (+ 15px) above the grid
+        self._titles, self._grid_top = self._title_lines(
+            PAGE_MARGIN + BORDER + CARD_PADDING,
+            "\U0001F384 BINGO \U0001F384",
+            (28 * PX, 20 * PX, 14 * PX),
+            (5 * PX, 15 * PX, 15 * PX),
+            self.subtitle,
+            content_width,
+        )
+        self._footer_top = self._grid_top + self._grid_height + 15 * PX
+        # Emoji size of each item, shrunk where a sequence is wider than the cell's 5px padding allows
+        self._cell_emoji = {}
+        for order, emoji in self._emoji.items():
+            width = self._emoji_width(emoji) or 1
+            self._cell_emoji[order] = (emoji, min(self._emoji_size, (cell - 10 * PX) / width))
+
+        self._grid_x = (PAGE_WIDTH - self._grid_width) / 2
+        grid_y = PAGE_HEIGHT - self._grid_top - self._grid_height
+        self._cells = [
+            (
+                self._grid_x + GRID_GAP + col * (cell + GRID_GAP),
+                grid_y + GRID_GAP + (rows - 1 - row) * (cell + GRID_GAP),
+                cell,
+            )
+            for row in range(rows)
+            for col in range(cols)
+        ]
+
+    def _emoji_width(self, emoji: str) -> float:
+        """Width of an emoji string's ink in ems (its advance without Noto Emoji)."""
+        shaped = self.emoji_atlas.get(emoji) if self.emoji_atlas is not None else None
+        return shaped.width if shaped is not None else pdfmetrics.stringWidth(emoji, self.emoji_font, 1)
+
+    def _runs(self, text: str, font: str, size: float, emoji_size: float | None = None) -> list[tuple[str, str, float]]:
+        """Split text into (text, font, size) runs, drawing emoji in the emoji font."""
+        runs: list[tuple[str, str, float]] = []
+        for char in text:
+            run = (self.emoji_font, emoji_size or size) if char in self._emoji_chars else (font, size)
+            if runs and runs[-1][1:] == run:
+                runs[-1] = (runs[-1][0] + char, *run)
+            else:
+                runs.append((char, *run))
+        return runs
+
+    @staticmethod
+    def _draw_centred(
+        c: canvas.Canvas, y: float, runs: Iterable[tuple[str, str, float]], char_space: float = 0.0
+    ) -> None:
+        """Draw runs of text centred on the page, on one baseline."""
+        runs = list(runs)
+        width = sum(pdfmetrics.stringWidth(text, font, size) + char_space * len(text) for text, font, size in runs)
+        text_object = c.beginText((PAGE_WIDTH - width) / 2, y)
+        text_object.setCharSpace(char_space)
+        for text, font, size in runs:
+            text_object.setFont(font, size)
+            text_object.textOut(text)
+        c.drawText(text_object)
+
+    def _draw_frame(self, c: canvas.Canvas, snowflakes: Iterable[int] = ()) -> None:
+        """Draw the page background, double border, accent frame, snowflakes and corners."""
+        colors = self.colors
+        x, y = PAGE_MARGIN, PAGE_MARGIN
+
+        # 135deg background gradient, clipped to the rounded page
+        c.saveState()
+        path = c.beginPath()
+        path.roundRect(x, y, BOX_WIDTH, BOX_HEIGHT, BOX_RADIUS)
+        c.clipPath(path, stroke=0, fill=0)
+        half = (BOX_WIDTH + BOX_HEIGHT) / 4
+        cx, cy = PAGE_WIDTH / 2, PAGE_HEIGHT / 2
+        c.linearGradient(cx - half, cy + half, cx + half, cy - half, [colors["bg"], white, colors["bg"]], [0, 0.5, 1])
+        c.restoreState()
+
+        # Double border: two lines a third of the border width each
+        line = BORDER / 3
+        c.setStrokeColor(colors["border"])
+        c.setLineWidth(line)
+        for inset in (line / 2, BORDER - line / 2):
+            c.roundRect(x + inset, y + inset, BOX_WIDTH - 2 * inset, BOX_HEIGHT - 2 * inset, BOX_RADIUS - inset)
+
+        # Accent frame
+        inset = BORDER + DECOR_INSET
+        c.saveState()
+        c.setStrokeColor(colors["accent"])
+        c.setStrokeAlpha(0.4)
+        c.setLineWidth(2 * PX)
+        c.roundRect(x + inset, y + inset, BOX_WIDTH - 2 * inset, BOX_HEIGHT - 2 * inset, 10 * PX)
+        c.restoreState()
+
+        # Snowflakes, positioned in percent of the padding box
+        inner_width, inner_height = BOX_WIDTH - 2 * BORDER, BOX_HEIGHT - 2 * BORDER
+        c.saveState()
+        c.setFillColor(colors["accent"])
+        c.setFillAlpha(0.15)
+        for index in snowflakes:
+            left, top, symbol, size = self._snowflakes[index]
+            char, size = unescape(symbol), size * PX
+            c.setFont("ZapfDingbats" if char in _DINGBATS else self.fonts["text"], size)
+            c.drawString(
+                x + BORDER + inner_width * left / 100,
+                _baseline(PAGE_MARGIN + BORDER + inner_height * top / 100, size),
+                char,
+            )
+        c.restoreState()
+
+        # Corner decorations, centred on the accent frame's corners
+        size = 32 * PX
+        c.saveState()
+        c.setFillColor(colors["text"])
+        c.setFillAlpha(0.6)
+        c.setFont(self.emoji_font, size)
+        left, right = x + inset, x + BOX_WIDTH - inset
+        bottom, top = y + inset, y + BOX_HEIGHT - inset
+        for cx, cy, char in ((left, top, "❄"), (right, top, "\U0001F384"),
+                             (left, bottom, "\U0001F384"), (right, bottom, "❄")):
+            c.drawCentredString(cx, cy - 0.35 * size, char)
+        c.restoreState()
+
+    def _title_lines(
+        self,
+        top: float,
+        heading: str,
+        sizes: tuple[float, float, float],
+        gaps: tuple[float, float, float],
+        subtitle: str,
+        width: float,
+    ) -> tuple[list[tuple[float, str, list[tuple[str, str, float]], float]], float]:
+        """Lay out the heading, game title and subtitle from `top` down, wrapped to `width`.
+
+        Returns:
+            (baseline, color name, runs, character spacing) of each line, and
+            the top of what follows them.
+        """
+        fonts = self.fonts
+        lines = []
+        for text, font, color, size, gap, char_space in (
+            (heading, fonts["title"], "primary", sizes[0], gaps[0], 2 * PX),
+            (self.game_title, fonts["text"], "secondary", sizes[1], gaps[1], 0.0),
+            (subtitle, fonts["italic"], "text", sizes[2], gaps[2], 0.0),
+        ):
+            for line in simpleSplit(text, font, size, width):
+                lines.append((_baseline(top, size), color, self._runs(line, font, size), char_space))
+                top += LINE_HEIGHT * size
+            top += gap
+        return lines, top
+
+    def _draw_lines(self, c: canvas.Canvas, lines: Iterable[tuple[float, str, list, float]]) -> None:
+        for baseline, color, runs, char_space in lines:
+            c.setFillColor(self.colors[color])
+            self._draw_centred(c, baseline, runs, char_space)
+
+    def _draw_footer(self, c: canvas.Canvas, text: str, top: float, size: float) -> None:
+        c.saveState()
+        c.setFillColor(self.colors["text"])
+        c.setFillAlpha(0.7)
+        self._draw_centred(c, _baseline(top, size), self._runs(text, self.fonts["text"], size))
+        c.restoreState()
+
+    def _card_form(self, c: canvas.Canvas) -> str:
+        """Define the titles, grid and free space label once per canvas, as a form every card places.
+
+        The frame, snowflakes and footer stay on the page: they use gradients
+        and transparency, which ReportLab does not carry into forms.
+
+        Returns:
+            Form name.
+        """
+        name = f"FestiveCard_{self._form_key}"
+        if c.hasForm(name):
+            return name
+
+        colors = self.colors
+        c.saveState()  # Keep the canvas's fonts and colors out of the page after the form
+        c.beginForm(name, 0, 0, PAGE_WIDTH, PAGE_HEIGHT)
+        self._draw_lines(c, self._titles)
+        # Grid: theme border color behind rounded cells
+        c.setFillColor(colors["border"])
+        c.roundRect(
+            self._grid_x, PAGE_HEIGHT - self._grid_top - self._grid_height,
+            self._grid_width, self._grid_height, 10 * PX, stroke=0, fill=1,
+        )
+        for i, (x, y, size) in enumerate(self._cells):
+            c.setFillColor(_CELL_FILLS[i % 2])
+            c.roundRect(x, y, size, size, 5 * PX, stroke=0, fill=1)
+        if self.shape.free_cell is not None:
+            row, col = self.shape.free_cell
+            x, y, size = self._cells[row * self.shape.cols + col]
+            c.setFillColor(colors["primary"])
+            c.setFont(self.fonts["bold"], self._free_size)
+            c.drawCentredString(x + size / 2, y + size / 2 - 0.35 * self._free_size, FREE_LABEL)
+        c.endForm()
+        c.restoreState()
+        return name
+
+    def draw_card(self, c: canvas.Canvas, card: BingoCard) -> None:
+        """Draw one card on the current page of a canvas."""
+        self._draw_frame(c, snowflake_picks(card.grid, self._snowflake_key))
+        c.doForm(self._card_form(c))
+
+        c.setFillColor(self.colors["text"])
+        values = [value for row in card.grid for value in row]
+        for (x, y, size), value in zip(self._cells, values, strict=True):
+            if value != FREE:
+                emoji, emoji_size = self._cell_emoji[value]
+                draw_emoji(c, emoji, x + size / 2, y + size / 2, emoji_size, self.emoji_font, self.emoji_atlas)
+
+        self._draw_footer(c, CARD_FOOTER, self._footer_top, 11 * PX)
+
+    def draw_key(self, c: canvas.Canvas) -> None:
+        """Draw the key/cheat sheet on the current page of a canvas."""
+        colors, fonts = self.colors, self.fonts
+        self._draw_frame(c)
+        left = PAGE_MARGIN + BORDER + KEY_PADDING
+        width = BOX_WIDTH - 2 * (BORDER + KEY_PADDING)
+        titles, top = self._title_lines(
+            left,
+            "\U0001F384 BINGO KEY \U0001F384",
+            (24 * PX, 16 * PX, 12 * PX),
+            (2 * PX, 8 * PX, 8 * PX),
+            f"Reference guide for all {len(self.items)} events",
+            width,
+        )
+        self._draw_lines(c, titles)
+
+        # Two-column grid of items, with full-width section headers
+        column_gap, row_gap = 16 * PX, 4 * PX
+        column = (width - column_gap) / 2
+        text_size, emoji_size = 10 * PX, 14 * PX
+        # Emoji take at least 22px and as much as they need, then a 6px gap
+        emoji_widths = {
+            item.order: max(22 * PX, self._emoji_width(item.emoji) * emoji_size)
+            for item in self.items
+        }
+        top += 10 * PX
+
+        if self.key_sections:
+            blocks = [
+                (name, [item for item in self.items if first <= item.order <= last])
+                for name, first, last in self.key_sections
+            ]
+        else:
+            blocks = [(None, self.items)]
+        for block, (name, items) in enumerate(blocks):
+            if name is not None:
+                top += 6 * PX if block else 0
+                height = LINE_HEIGHT * 11 * PX + 8 * PX
+                y = PAGE_HEIGHT - top - height
+                c.saveState()
+                path = c.beginPath()
+                path.roundRect(left, y, width, height, 4 * PX)
+                c.clipPath(path, stroke=0, fill=0)
+                c.linearGradient(left, y, left + width, y, [colors["secondary"], colors["primary"]], [0, 1])
+                c.restoreState()
+                c.setFillColor(white)
+                c.setFont(fonts["bold"], 11 * PX)
+                c.drawCentredString(left + width / 2, _baseline(top + 4 * PX, 11 * PX), name)
+                top += height + row_gap
+
+            for start in range(0, len(items), 2):
+                pair = items[start:start + 2]
+                lines = [
+                    simpleSplit(item.description, fonts["text"], text_size, column - emoji_widths[item.order] - 6 * PX)
+                    for item in pair
+                ]
+                content = max(LINE_HEIGHT * emoji_size, *(len(desc) * 1.15 * text_size for desc in lines))
+                height = content + 2 * 3 * PX + PX
+                for i, (item, desc) in enumerate(zip(pair, lines, strict=True)):
+                    x = left + i * (column + column_gap)
+                    middle = PAGE_HEIGHT - top - 3 * PX - content / 2
+                    c.setFillColor(colors["text"])
+                    emoji_width = emoji_widths[item.order]
+                    draw_emoji(
+                        c, item.emoji, x + emoji_width / 2, middle, emoji_size, self.emoji_font, self.emoji_atlas
+                    )
+                    # Description lines, vertically centred like the emoji
+                    leading = 1.15 * text_size
+                    text_object = c.beginText(
+                        x + emoji_width + 6 * PX, middle + (len(desc) - 1) * leading / 2 - 0.35 * text_size
+                    )
+                    text_object.setFont(fonts["text"], text_size, leading=leading)
+                    for text_line in desc:
+                        text_object.textLine(text_line)
+                    c.drawText(text_object)
+                    # Dotted bottom border
+                    c.setStrokeColor(colors["border"])
+                    c.setLineWidth(PX)
+                    c.setDash(PX, 2 * PX)
+                    c.line(x, PAGE_HEIGHT - top - height + PX / 2, x + column, PAGE_HEIGHT - top - height + PX / 2)
+                    c.setDash()
+                top += height + row_gap
+
+        self._draw_footer(c, KEY_FOOTER, top - row_gap + 10 * PX, 10 * PX)
+
+    def render(
+        self,
+        cards: Iterable[BingoCard],
+        pdf_file: str,
+        include_key: bool = True,
+        n_up: int = 1,
+        paper: str = "letter",
+    ) -> int:
+        """Draw a deck to a PDF file, one card per page and optionally the key last.
+
+        Args:
+            cards: BingoCard objects to render (consumed lazily).
+            pdf_file: Path for output PDF file.
+            include_key: Whether to end with the key/cheat sheet.
+            n_up: Cards per print sheet (see `bingo.imposition`); the key
+                gets a sheet of its own.
+            paper: Paper size of the print sheets.
+
+        Returns:
+            Number of sheets written.
+        """
+        c = canvas.Canvas(pdf_file, pagesize=letter, invariant=1)
+        c.setTitle(f"Bingo Cards - {self.game_title}")
+        sheets = impose_pages(c, sheet_layout(n_up, paper), (partial(self.draw_card, card=card) for card in cards))
+        if include_key:
+            sheets += impose_pages(c, sheet_layout(1, paper), [self.draw_key])
+        c.save()
+        return sheets
+
+
+def create_festive_pdf(
+    items: list[BingoItem],
+    cards: Iterable[BingoCard],
+    pdf_file: str,
+    game: str = "vintage_christmas_films",
+    include_key: bool = True,
+    seed: int | None = None,
+    shape: CardShape = DEFAULT_SHAPE,
+    n_up: int = 1,
+    paper: str = "letter",
+) -> str:
+    """Render festive cards and optional key straight to PDF, without a browser.
+
+    Args:
+        items: List of BingoItem objects.
+        cards: BingoCard objects to render.
+        pdf_file: Path for output PDF file.
+        game: Game name for styling and title.
+        include_key: Whether to end with the key/cheat sheet.
+        seed: Seed for the snowflake decorations (random if None).
+        shape: Shape of the cards.
+        n_up: Cards per print sheet, one of `bingo.imposition.N_UP_CHOICES`.
+        paper: Paper size, a key of `bingo.imposition.PAPER_SIZES`.
+
+    Returns:
+        Path to generated PDF file.
+    """
+    start = time.perf_counter()
+    layout = sheet_layout(n_up, paper)
+    renderer = NativeFestiveRenderer(items, game=game, seed=seed, shape=shape)
+    sheets = renderer.render(cards, pdf_file, include_key=include_key, n_up=n_up, paper=paper)
+    imposed = "" if layout.identity else f"{sheets} {paper} sheets, {n_up} cards per sheet, "
+    print(f"Generated PDF: {pdf_file} ({imposed}{time.perf_counter() - start:.2f}s)")
+    return pdf_file
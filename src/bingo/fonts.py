@@ -0,0 +1,127 @@
+"""Fonts bundled with bingo and the ways renderers can load them.
+
+Kept free of rendering dependencies so the CLI can offer font options
+without importing ReportLab or Playwright.
+"""
+
+import hashlib
+import os
+from collections.abc import Iterable
+from functools import cache
+from pathlib import Path
+
+FONT_DIR = Path(__file__).parent.parent.parent / "fonts"
+NOTO_EMOJI_PATH = FONT_DIR / "NotoEmoji-VariableFont.ttf"
+# Cross-platform font search: check common locations, fallback to Helvetica
+_NOTO_SANS_CANDIDATES = [
+    FONT_DIR / "NotoSans-Regular.ttf",  # Bundled (preferred)
+    Path.home() / "Library/Fonts/NotoSans-Regular.ttf",  # macOS user
+    Path("/usr/share/fonts/truetype/noto/NotoSans-Regular.ttf"),  # Linux
+    Path("/usr/share/fonts/noto/NotoSans-Regular.ttf"),  # Linux alt
+    Path("C:/Windows/Fonts/NotoSans-Regular.ttf"),  # Windows
+]
+NOTO_SANS_PATH = next((p for p in _NOTO_SANS_CANDIDATES if p.exists()), None)
+
+# Bundled webfonts for offline rendering: family -> (CSS weight, filename in FONT_DIR).
+# Missing files are reported by `missing_webfonts`; the browser falls back to the next font in the stack.
+LOCAL_WEBFONTS = {
+    "Mountains of Christmas": [("400", "MountainsofChristmas-Regular.ttf"), ("700", "MountainsofChristmas-Bold.ttf")],
+    "Cinzel Decorative": [("400", "CinzelDecorative-Regular.ttf"), ("700", "CinzelDecorative-Bold.ttf")],
+    "Noto Emoji": [("300 700", "NotoEmoji-VariableFont.ttf")],
+}
+# Webfont sources: Google Fonts links, or bundled fonts as file URLs or inline data URIs
+FONT_MODES = ("google", "file", "data")
+
+# Directory of prebuilt font subsets and emoji atlases - BINGO_FONT_CACHE overrides it
+FONT_CACHE_DIR = Path(
+    os.environ.get("BINGO_FONT_CACHE")
+    or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "bingo" / "fonts"
+)
+
+# Version of the subset files, part of their cache keys: bump it whenever `subset_font` changes its output
+SUBSET_VERSION = 2
+
+# Font variation tables, which ReportLab ignores; subsets keep only the default outlines
+_VARIATION_TABLES = ["fvar", "gvar", "avar", "cvar", "HVAR", "MVAR", "VVAR", "STAT"]
+
+
+def missing_webfonts() -> list[str]:
+    """Get the `LOCAL_WEBFONTS` faces whose files are missing from FONT_DIR, as "family weight (filename)"."""
+    return [
+        f"{family} {weight} ({filename})"
+        for family, faces in LOCAL_WEBFONTS.items()
+        for weight, filename in faces
+        if not (FONT_DIR / filename).exists()
+    ]
+
+
+def emoji_codepoints(emoji: Iterable[str]) -> frozenset[int]:
+    """Get the code points used by emoji strings, e.g. every `BingoItem.emoji` of a game."""
+    return frozenset(ord(char) for text in emoji for char in text)
+
+
+@cache
+def _file_digest(path: Path, mtime_ns: int, size: int) -> str:
+    """Hash a file's contents (cached per path, modification time and size)."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def font_cache_key(font_path: str | Path, *parts: object) -> str:
+    """Hash a font file's contents, the fontTools version and `parts` into a cache file name."""
+    import fontTools
+
+    stat = Path(font_path).stat()
+    digest = _file_digest(Path(font_path), stat.st_mtime_ns, stat.st_size)
+    return hashlib.sha256(f"{digest}:{fontTools.version}:{':'.join(map(str, parts))}".encode()).hexdigest()
+
+
+def subset_font(font_path: str | Path, codepoints: Iterable[int], cache_dir: str | Path | None = None) -> Path:
+    """Get a TrueType subset of a font holding only the glyphs of `codepoints`.
+
+    Subsets are built with fontTools and stored as ``<sha256>.ttf`` in
+    `cache_dir`, where the hash covers the font file contents, the code points
+    and the fontTools version. Every later call, in any process, reuses the
+    file, so rendering workers only load a small font instead of the full one.
+    Each subset gets a PostScript name of its own (the source's name and the
+    first 16 hex digits of the hash), since ReportLab treats fonts with the
+    same name as one.
+
+    Args:
+        font_path: Source ``.ttf`` file.
+        codepoints: Unicode code points to keep (missing ones are ignored).
+        cache_dir: Subset directory (`FONT_CACHE_DIR` if None; created if missing).
+
+    Returns:
+        Path of the subset font.
+    """
+    font_path = Path(font_path)
+    codepoints = sorted(set(codepoints))
+    key = font_cache_key(font_path, codepoints, SUBSET_VERSION)
+    directory = Path(cache_dir) if cache_dir is not None else FONT_CACHE_DIR
+    path = directory / f"{key}.ttf"
+    if path.exists():
+        return path
+
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    options = subset.Options()
+    options.drop_tables += _VARIATION_TABLES
+    options.layout_features = ["*"]
+    options.notdef_outline = True
+    font = TTFont(font_path)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+    names = font["name"]
+    ps_name = f"{names.getDebugName(6)}-{key[:16]}"
+    names.removeNames(nameID=6)
+    names.setName(ps_name, 6, 3, 1, 0x409)
+    names.setName(ps_name, 6, 1, 0, 0)
+
+    directory.mkdir(parents=True, exist_ok=True)
+    # Write then rename so concurrent workers never load a partial font
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    font.save(tmp)
+    tmp.replace(path)
+    return path
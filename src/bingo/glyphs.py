@@ -0,0 +1,237 @@
+"""Emoji shaped and measured once, for renderers that draw them on every card.
+
+ReportLab and Pillow's basic text layout draw a string one code point at a
+time: a ZWJ sequence such as 🏃‍♀️ comes out as 🏃♀, and the string is centred
+on its advance width rather than on its ink. `shape_emoji` applies the emoji
+font's ligatures to a string once per process and records the glyphs left,
+the characters that draw them and their ink box. `emoji_atlas` does so for
+a whole game and stores the result next to the font subsets, so later
+processes load it without fontTools. `bingo.pdf` places the shaped
+characters by their ink box, and `bingo.images` rasterizes them once per size.
+"""
+
+import json
+import os
+from collections.abc import Iterable
+from dataclasses import astuple, dataclass
+from functools import cache
+from pathlib import Path
+
+from .fonts import FONT_CACHE_DIR, NOTO_EMOJI_PATH, font_cache_key
+
+# Features whose ligatures form emoji sequences (Noto Emoji puts them all in ccmp)
+LIGATURE_FEATURES = ("ccmp", "liga")
+
+
+@dataclass(frozen=True)
+class ShapedEmoji:
+    """An emoji string as the font draws it.
+
+    Lengths are in ems (multiply by the font size), measured from the start of
+    the baseline.
+
+    Attributes:
+        text: The emoji string, e.g. a `BingoItem.emoji`.
+        glyphs: Names of the glyphs drawn, after ligatures.
+        chars: Characters that draw `glyphs` in renderers without shaping.
+        advance: Advance width of the whole string.
+        bounds: Ink box ``(x_min, y_min, x_max, y_max)``, all zero without ink.
+    """
+    text: str
+    glyphs: tuple[str, ...]
+    chars: str
+    advance: float
+    bounds: tuple[float, float, float, float]
+
+    @property
+    def width(self) -> float:
+        """Width of the ink box."""
+        return self.bounds[2] - self.bounds[0]
+
+    @property
+    def height(self) -> float:
+        """Height of the ink box."""
+        return self.bounds[3] - self.bounds[1]
+
+    @property
+    def center(self) -> tuple[float, float]:
+        """Centre of the ink box."""
+        return (self.bounds[0] + self.bounds[2]) / 2, (self.bounds[1] + self.bounds[3]) / 2
+
+
+class _FontTables:
+    """The parts of a font needed to shape and measure emoji, loaded once per font."""
+
+    def __init__(self, font_path: Path):
+        from fontTools.ttLib import TTFont
+
+        font = TTFont(font_path, lazy=True)
+        self.units_per_em = font["head"].unitsPerEm
+        self.cmap = font.getBestCmap()
+        # The lowest code point of each glyph draws it without shaping
+        self.codepoints = {}
+        for codepoint, glyph in sorted(self.cmap.items(), reverse=True):
+            self.codepoints[glyph] = codepoint
+        self.advances = {glyph: advance for glyph, (advance, _) in font["hmtx"].metrics.items()}
+        # TrueType glyph headers hold their ink boxes; other outlines are drawn to measure them.
+        # Variable fonts give their default outlines, which is what ReportLab embeds.
+        self.glyf = font["glyf"] if "glyf" in font else None
+        self.glyph_set = None if self.glyf is not None else font.getGlyphSet()
+        self.ligatures = _ligature_lookups(font)
+        self._bounds: dict[str, tuple[float, float, float, float] | None] = {}
+
+    def bounds(self, glyph: str) -> tuple[float, float, float, float] | None:
+        """Ink box of a glyph in font units, or None if it has no outline."""
+        if glyph not in self._bounds:
+            if self.glyf is not None:
+                outline = self.glyf[glyph]
+                has_ink = outline.numberOfContours != 0
+                self._bounds[glyph] = (outline.xMin, outline.yMin, outline.xMax, outline.yMax) if has_ink else None
+            else:
+                from fontTools.pens.boundsPen import BoundsPen
+
+                pen = BoundsPen(self.glyph_set)
+                self.glyph_set[glyph].draw(pen)
+                self._bounds[glyph] = pen.bounds
+        return self._bounds[glyph]
+
+
+def _ligature_lookups(font) -> list[dict[str, list]]:
+    """Ligature substitutions of `LIGATURE_FEATURES`, as first glyph -> ligatures, in lookup order.
+
+    Contextual lookups are skipped; emoji fonts use them for flag tag
+    sequences, which no game uses.
+    """
+    if "GSUB" not in font:
+        return []
+    table = font["GSUB"].table
+    indices = sorted({
+        index
+        for record in table.FeatureList.FeatureRecord
+        if record.FeatureTag in LIGATURE_FEATURES
+        for index in record.Feature.LookupListIndex
+    })
+    lookups = []
+    for index in indices:
+        lookup = table.LookupList.Lookup[index]
+        subtables = lookup.SubTable
+        if lookup.LookupType == 7:  # Extension lookups wrap their subtables
+            subtables = [subtable.ExtSubTable for subtable in subtables]
+        ligatures: dict[str, list] = {}
+        for subtable in subtables:
+            if subtable.LookupType == 4:
+                for first, entries in subtable.ligatures.items():
+                    ligatures.setdefault(first, []).extend(entries)
+        if ligatures:
+            lookups.append(ligatures)
+    return lookups
+
+
+def _apply_ligatures(glyphs: list[str], ligatures: dict[str, list]) -> list[str]:
+    """Replace each run of glyphs by the first ligature matching it."""
+    shaped = []
+    i = 0
+    while i < len(glyphs):
+        for ligature in ligatures.get(glyphs[i], ()):
+            end = i + 1 + len(ligature.Component)
+            if glyphs[i + 1:end] == list(ligature.Component):
+                shaped.append(ligature.LigGlyph)
+                i = end
+                break
+        else:
+            shaped.append(glyphs[i])
+            i += 1
+    return shaped
+
+
+@cache
+def _font_tables(font_path: Path) -> _FontTables:
+    return _FontTables(font_path)
+
+
+@cache
+def shape_emoji(text: str, font_path: str | Path = NOTO_EMOJI_PATH) -> ShapedEmoji:
+    """Shape and measure an emoji string (cached, so each string is shaped once per process).
+
+    Variation selectors and joiners left over after ligatures neither
+    advance nor leave ink, so they are dropped. If a ligature has no code
+    point of its own, `chars` stays `text`.
+
+    Args:
+        text: Emoji string.
+        font_path: Emoji font (bundled Noto Emoji by default).
+
+    Returns:
+        The shaped string.
+    """
+    font = _font_tables(Path(font_path))
+    unshaped = [font.cmap.get(ord(char), ".notdef") for char in text]
+    glyphs = unshaped
+    for ligatures in font.ligatures:
+        glyphs = _apply_ligatures(glyphs, ligatures)
+    glyphs = [glyph for glyph in glyphs if font.advances[glyph] or font.bounds(glyph)]
+    if all(glyph in font.codepoints for glyph in glyphs):
+        chars = "".join(chr(font.codepoints[glyph]) for glyph in glyphs)
+    else:
+        glyphs = [glyph for glyph in unshaped if font.advances[glyph] or font.bounds(glyph)]
+        chars = text
+
+    x = 0
+    boxes = []
+    for glyph in glyphs:
+        box = font.bounds(glyph)
+        if box is not None:
+            boxes.append((x + box[0], box[1], x + box[2], box[3]))
+        x += font.advances[glyph]
+    bounds = (
+        (min(b[0] for b in boxes), min(b[1] for b in boxes), max(b[2] for b in boxes), max(b[3] for b in boxes))
+        if boxes
+        else (0, 0, 0, 0)
+    )
+    em = font.units_per_em
+    return ShapedEmoji(text, tuple(glyphs), chars, x / em, tuple(v / em for v in bounds))
+
+
+def emoji_atlas(
+    emoji: Iterable[str], font_path: str | Path = NOTO_EMOJI_PATH, cache_dir: str | Path | None = None
+) -> dict[str, ShapedEmoji]:
+    """Shape every emoji string of a game, e.g. each `BingoItem.emoji`.
+
+    The atlas is kept for the rest of the process and stored as
+    ``<sha256>.json`` in `cache_dir`, where the hash covers the font file
+    contents, the strings and the fontTools version, so every later process
+    reuses it instead of shaping again.
+
+    Args:
+        emoji: Emoji strings.
+        font_path: Emoji font (bundled Noto Emoji by default).
+        cache_dir: Atlas directory (`FONT_CACHE_DIR` if None; created if missing).
+
+    Returns:
+        Shaped strings by text.
+    """
+    return _emoji_atlas(tuple(sorted(set(emoji))), Path(font_path), Path(cache_dir or FONT_CACHE_DIR))
+
+
+@cache
+def _emoji_atlas(emoji: tuple[str, ...], font_path: Path, cache_dir: Path) -> dict[str, ShapedEmoji]:
+    path = cache_dir / f"{font_cache_key(font_path, 'emoji-atlas', json.dumps(emoji))}.json"
+    try:
+        entries = json.loads(path.read_text(encoding="utf-8"))
+        return {
+            text: ShapedEmoji(text, tuple(glyphs), chars, advance, tuple(bounds))
+            for text, glyphs, chars, advance, bounds in entries
+        }
+    except (OSError, ValueError):
+        pass
+
+    atlas = {text: shape_emoji(text, font_path) for text in emoji}
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent workers never load a partial atlas
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps([astuple(shaped) for shaped in atlas.values()], ensure_ascii=False), encoding="utf-8")
+        tmp.replace(path)
+    except OSError:
+        pass  # Atlas cache not writable: shape again in each process
+    return atlas
@@ -1,30 +1,37 @@
 """Festive HTML-based PDF generation for bingo cards."""
 
+import base64
+import gzip
+import hashlib
+import os
 import random
+import re
+import tempfile
+import time
+import warnings
+from collections.abc import Iterable, Iterator, Sequence
+from html import escape
 from pathlib import Path
 
-from .card import BingoCard, generate_valid_card
-from .data import BingoItem
-
-# Festive color schemes
-FESTIVE_COLORS = {
-    "vintage_christmas_films": {
-        "primary": "#8B0000",  # Dark red
-        "secondary": "#228B22",  # Forest green
-        "accent": "#FFD700",  # Gold
-        "bg": "#FFF8DC",  # Cornsilk
-        "border": "#8B4513",  # Saddle brown
-        "text": "#2F4F4F",  # Dark slate gray
-    },
-    "meet_me_in_st_louis": {
-        "primary": "#8B0000",  # Dark red (Victorian theme)
-        "secondary": "#FFD700",  # Gold
-        "accent": "#FFD700",  # Gold
-        "bg": "#FFF8E7",  # Cream/antique
-        "border": "#8B4513",  # Saddle brown
-        "text": "#2F1810",  # Dark brown
-    },
-}
+from .cache import RenderCache
+from .card import DEFAULT_SHAPE, FREE, FREE_LABEL, BingoCard, CardIndex, CardShape, generate_cards_batch
+from .data import DEFAULT_COLORS, BingoItem, find_pack
+from .fonts import FONT_DIR, FONT_MODES, LOCAL_WEBFONTS, missing_webfonts
+from .imposition import impose_pdf, sheet_layout
+from .planner import generate_planned_batch, win_summary
+
+GOOGLE_FONT_LINKS = """\
+    <link href="https://fonts.googleapis.com/css2?family=Mountains+of+Christmas:wght@400;700&display=swap"
+          rel="stylesheet">
+    <link href="https://fonts.googleapis.com/css2?family=Cinzel+Decorative:wght@400;700&display=swap"
+          rel="stylesheet">"""
+
+# Seconds to wait for local fonts to finish loading before printing
+FONT_LOAD_TIMEOUT = 10.0
+# Festive PDF backends: print the HTML with Chromium, or draw vector PDF with ReportLab (`bingo.festive_pdf`)
+PDF_ENGINES = ("chromium", "native")
+# Version of the festive card page markup, part of its render cache keys: bump it whenever the output changes
+FESTIVE_CARD_RENDER_VERSION = 1
 
 FESTIVE_HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
@@ -32,10 +39,7 @@ FESTIVE_HTML_TEMPLATE = '''<!DOCTYPE html>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title}</title>
-    <link href="https://fonts.googleapis.com/css2?family=Mountains+of+Christmas:wght@400;700&display=swap"
-          rel="stylesheet">
-    <link href="https://fonts.googleapis.com/css2?family=Cinzel+Decorative:wght@400;700&display=swap"
-          rel="stylesheet">
+{font_links}
     <style>
         @page {{
             size: letter portrait;
@@ -115,9 +119,10 @@ FESTIVE_HTML_TEMPLATE = '''<!DOCTYPE html>
 
         .bingo-grid {{
             display: grid;
-            grid-template-columns: repeat(5, 1fr);
+            /* --cols and --span (the longer side) are set per card; cells are sized as on a 5x5 grid */
+            grid-template-columns: repeat(var(--cols, 5), 1fr);
             gap: 4px;
-            max-width: 500px;
+            max-width: calc(100px * var(--cols, 5) * 5 / var(--span, 5));
             margin: 0 auto;
             background: {border};
             padding: 4px;
@@ -132,12 +137,18 @@ FESTIVE_HTML_TEMPLATE = '''<!DOCTYPE html>
             justify-content: center;
             background: linear-gradient(180deg, #FFFFFF 0%, #F5F5F5 100%);
             border-radius: 5px;
-            font-size: 32px;
+            font-size: calc(160px / var(--span, 5));
             box-shadow: 0 2px 5px rgba(0,0,0,0.1);
             transition: transform 0.2s;
             padding: 5px;
         }}
 
+        .bingo-cell.free-space {{
+            font-size: calc(80px / var(--span, 5));
+            font-weight: bold;
+            color: {primary};
+        }}
+
         .bingo-cell:hover {{
             transform: scale(1.05);
             box-shadow: 0 4px 15px rgba(0,0,0,0.2);
@@ -349,7 +360,7 @@ CARD_TEMPLATE = '''
     </div>
     <div class="subtitle">{subtitle}</div>
 
-    <div class="bingo-grid">
+    <div class="bingo-grid" style="--cols: {cols}; --span: {span}">
         {cells}
     </div>
 
@@ -384,19 +395,266 @@ KEY_TEMPLATE = '''
 '''
 
 
-def generate_snowflakes(count: int = 15) -> str:
+def webfont_links(fonts: str = "google") -> str:
+    """Get the ``<head>`` markup that loads the festive webfonts.
+
+    Args:
+        fonts: "google" links Google Fonts; "file" and "data" declare the fonts
+            bundled in FONT_DIR as ``@font-face`` rules using file URLs or inline
+            base64 data URIs, so rendering needs no network. Local modes also
+            draw the card cells, corners and snowflakes with the monochrome
+            Noto Emoji font instead of the host's color emoji.
+
+    Returns:
+        HTML to place in the document head.
+
+    Raises:
+        ValueError: If `fonts` is not one of FONT_MODES.
+
+    Warns:
+        UserWarning: If a local mode is missing bundled faces (see `missing_webfonts`),
+            which the browser replaces with the next font in the stack.
+    """
+    if fonts not in FONT_MODES:
+        raise ValueError(f"Unknown font mode: {fonts}. Available: {list(FONT_MODES)}")
+    if fonts == "google":
+        return GOOGLE_FONT_LINKS
+    missing = missing_webfonts()
+    if missing:
+        warnings.warn(
+            f"Bundled webfonts missing from {FONT_DIR}, using fallback fonts: {', '.join(missing)}", stacklevel=2
+        )
+
+    rules = []
+    for family, faces in LOCAL_WEBFONTS.items():
+        for weight, filename in faces:
+            path = FONT_DIR / filename
+            if not path.exists():
+                continue
+            if fonts == "data":
+                url = "data:font/ttf;base64," + base64.b64encode(path.read_bytes()).decode("ascii")
+            else:
+                url = path.absolute().as_uri()
+            rules.append(
+                f"        @font-face {{ font-family: '{family}'; font-weight: {weight}; "
+                f"src: url('{url}') format('truetype'); }}"
+            )
+    # Emoji come from the bundled font too, rather than whatever emoji font the host has
+    if (FONT_DIR / LOCAL_WEBFONTS["Noto Emoji"][0][1]).exists():
+        rules.append("        .bingo-cell, .corner, .emoji, .snowflake { font-family: 'Noto Emoji', sans-serif; }")
+    return "    <style>\n" + "\n".join(rules) + "\n    </style>"
+
+
+SNOWFLAKE_SYMBOLS = ["&#10052;", "&#10053;", "&#10054;", "&#42;"]
+SNOWFLAKES_PER_CARD = 12
+# Number of pre-rendered snowflakes each FestiveRenderer draws card decorations from
+SNOWFLAKE_POOL_SIZE = 512
+
+# Separator between cells and key rows, matching the template indentation
+_ROW_SEPARATOR = "\n        "
+# Placeholder used to split formatted templates into static chunks
+_SLOT = "\x00"
+
+
+def snowflake_params(rng: random.Random) -> tuple[int, int, str, int]:
+    """Draw one snowflake: left and top (percent of the page), symbol (HTML entity) and size (px)."""
+    x = rng.randint(5, 95)
+    y = rng.randint(5, 95)
+    symbol = rng.choice(SNOWFLAKE_SYMBOLS)
+    size = rng.randint(15, 30)
+    return x, y, symbol, size
+
+
+def snowflake_picks(grid: list[list[int]], key: bytes | None) -> list[int]:
+    """Pick the pool indices of a card's snowflakes.
+
+    With a `key` (derived from the deck seed) the picks are a keyed hash of
+    the grid, which is reproducible and much cheaper than seeding a Random per
+    card; without one they are random.
+    """
+    if key is None:
+        return random.choices(range(SNOWFLAKE_POOL_SIZE), k=SNOWFLAKES_PER_CARD)
+    n = int.from_bytes(hashlib.blake2b(str(grid).encode(), key=key).digest(), "little")
+    picks = []
+    for _ in range(SNOWFLAKES_PER_CARD):
+        n, index = divmod(n, SNOWFLAKE_POOL_SIZE)
+        picks.append(index)
+    return picks
+
+
+def snowflake_key(seed: int | None) -> bytes | None:
+    """Get the `snowflake_picks` key of a deck seed (None for random picks)."""
+    return None if seed is None else hashlib.sha256(str(seed).encode()).digest()
+
+
+def _snowflake(rng: random.Random) -> str:
+    """Render one randomly placed snowflake."""
+    x, y, symbol, size = snowflake_params(rng)
+    return f'<span class="snowflake" style="left:{x}%;top:{y}%;font-size:{size}px">{symbol}</span>'
+
+
+def generate_snowflakes(count: int = 15, rng: random.Random | None = None) -> str:
     """Generate random snowflake decorations."""
-    snowflakes = []
-    symbols = ["&#10052;", "&#10053;", "&#10054;", "&#42;"]
-    for _ in range(count):
-        x = random.randint(5, 95)
-        y = random.randint(5, 95)
-        symbol = random.choice(symbols)
-        size = random.randint(15, 30)
-        snowflakes.append(
-            f'<span class="snowflake" style="left:{x}%;top:{y}%;font-size:{size}px">{symbol}</span>'
+    rng = rng or random.Random()
+    return "".join(_snowflake(rng) for _ in range(count))
+
+
+def _key_item(item: BingoItem) -> str:
+    """Render one key page entry."""
+    return (
+        f'<div class="key-item">'
+        f'<span class="emoji">{item.emoji}</span>'
+        f'<span class="desc">{escape(item.description, quote=False)}</span>'
+        f'</div>'
+    )
+
+
+class FestiveRenderer:
+    """Festive HTML templates compiled for one game.
+
+    Everything that does not vary per card is formatted once: the document head
+    and CSS, the static parts of the card and key templates, the HTML of every
+    item's grid cell and a pool of snowflake decorations. Rendering a card is
+    then a single list join.
+
+    Args:
+        items: List of BingoItem objects.
+        game: Game name for styling and title.
+        fonts: Webfont source, see `webfont_links`.
+        cache: Render cache for card page fragments (a cached page keeps the
+            snowflakes it was first rendered with).
+        seed: Seed for the snowflake decorations. Each card's snowflakes then
+            depend only on the seed and its grid, so output is reproducible
+            (random if None).
+        shape: Shape of the cards, which sets the grid layout.
+    """
+
+    def __init__(
+        self,
+        items: list[BingoItem],
+        game: str = "vintage_christmas_films",
+        fonts: str = "google",
+        cache: RenderCache | None = None,
+        seed: int | None = None,
+        shape: CardShape = DEFAULT_SHAPE,
+    ) -> None:
+        self.items = items
+        self.game = game
+        self.cache = cache
+        self.seed = seed
+        rng = random.Random(seed)
+        self._snowflake_key = snowflake_key(seed)
+        # Theme, titles and key sections come from the game pack; unknown games get a plain default
+        pack = find_pack(game)
+        colors = pack.colors if pack else DEFAULT_COLORS
+        self.game_title = escape(pack.title if pack else game.replace("_", " ").title(), quote=False)
+        subtitle = escape(pack.subtitle, quote=False) if pack else ""
+        self.key_sections = pack.key_sections if pack else []
+
+        self.head, self.tail = FESTIVE_HTML_TEMPLATE.format(
+            title=f"Bingo Cards - {self.game_title}",
+            font_links=webfont_links(fonts),
+            content=_SLOT,
+            **colors,
+        ).split(_SLOT)
+        # CARD_TEMPLATE places {snowflakes} before {cells}
+        self._card_start, self._card_middle, self._card_end = CARD_TEMPLATE.format(
+            game_title=self.game_title,
+            subtitle=subtitle,
+            cols=shape.cols,
+            span=max(shape.rows, shape.cols),
+            snowflakes=_SLOT,
+            cells=_SLOT,
+        ).split(_SLOT)
+        self._cells = {item.order: f'<div class="bingo-cell">{item.emoji}</div>' for item in items}
+        self._cells[FREE] = f'<div class="bingo-cell free-space">{FREE_LABEL}</div>'
+        self._snowflakes = [_snowflake(rng) for _ in range(SNOWFLAKE_POOL_SIZE)]
+        # Everything besides the grid that determines a card page, and the fonts it is styled with
+        self._cache_salt = RenderCache.key(
+            "festive_card",
+            FESTIVE_CARD_RENDER_VERSION,
+            fonts,
+            self._card_start,
+            self._card_middle,
+            self._card_end,
+            self._cells,
+            seed,
+        )
+
+    def render_card(self, card: BingoCard) -> str:
+        """Render one card page."""
+        if self.cache is None:
+            return self._render_card(card)
+        key = RenderCache.key(self._cache_salt, card.grid)
+        data = self.cache.get(key)
+        if data is not None:
+            return data.decode("utf-8")
+        page = self._render_card(card)
+        self.cache.put(key, page.encode("utf-8"))
+        return page
+
+    def _card_snowflakes(self, card: BingoCard) -> str:
+        return "".join([self._snowflakes[i] for i in snowflake_picks(card.grid, self._snowflake_key)])
+
+    def _render_card(self, card: BingoCard) -> str:
+        cells = self._cells
+        return "".join((
+            self._card_start,
+            self._card_snowflakes(card),
+            self._card_middle,
+            _ROW_SEPARATOR.join([cells[value] for row in card.grid for value in row]),
+            self._card_end,
+        ))
+
+    def render_key(self) -> str:
+        """Render the key/cheat sheet page."""
+        if self.key_sections:
+            rows = []
+            for section_name, start, end in self.key_sections:
+                rows.append(f'<div class="key-section-header">{escape(section_name, quote=False)}</div>')
+                rows.extend(_key_item(item) for item in self.items if start <= item.order <= end)
+        else:
+            rows = [_key_item(item) for item in self.items]
+
+        return KEY_TEMPLATE.format(
+            game_title=self.game_title,
+            num_events=len(self.items),
+            rows=_ROW_SEPARATOR.join(rows),
         )
-    return "".join(snowflakes)
+
+    def iter_render(self, cards: Iterable[BingoCard], include_key: bool = True) -> Iterator[str]:
+        """Render a complete HTML document piece by piece.
+
+        Cards are rendered only as the iterator advances, so `cards` may be a
+        lazy sequence and the document never has to exist in memory at once.
+
+        Args:
+            cards: BingoCard objects to render.
+            include_key: Whether to include the key/cheat sheet.
+
+        Yields:
+            The head, each page (preceded by a newline after the first) and the tail.
+        """
+        yield self.head
+        separator = ""
+        for card in cards:
+            yield separator + self.render_card(card)
+            separator = "\n"
+        if include_key:
+            yield separator + self.render_key()
+        yield self.tail
+
+    def render(self, cards: Iterable[BingoCard], include_key: bool = True) -> str:
+        """Render a complete HTML document.
+
+        Args:
+            cards: BingoCard objects to render.
+            include_key: Whether to include the key/cheat sheet.
+
+        Returns:
+            Complete HTML string.
+        """
+        return "".join(self.iter_render(cards, include_key=include_key))
 
 
 def create_festive_html(
@@ -404,6 +662,9 @@ def create_festive_html(
     cards: list[BingoCard],
     game: str = "vintage_christmas_films",
     include_key: bool = True,
+    fonts: str = "google",
+    seed: int | None = None,
+    shape: CardShape = DEFAULT_SHAPE,
 ) -> str:
     """Create festive HTML with bingo cards and optional key.
 
@@ -412,101 +673,65 @@ def create_festive_html(
         cards: List of BingoCard objects to render.
         game: Game name for styling and title.
         include_key: Whether to include the key/cheat sheet.
+        fonts: Webfont source, see `webfont_links`.
+        seed: Seed for the snowflake decorations (random if None).
+        shape: Shape of the cards.
 
     Returns:
         Complete HTML string.
     """
-    colors = FESTIVE_COLORS.get(game, FESTIVE_COLORS["vintage_christmas_films"])
-
-    game_titles = {
-        "vintage_christmas_films": "Vintage Christmas Films",
-        "meet_me_in_st_louis": "Meet Me In St. Louis",
-    }
-    game_title = game_titles.get(game, game.replace("_", " ").title())
-
-    subtitles = {
-        "vintage_christmas_films": (
-            "Santa Claus (1898) &bull; A Winter Straw Ride (1906) &bull; "
-            "The Night Before Christmas (1905) &bull; A Trap for Santa Claus (1909)"
-        ),
-        "meet_me_in_st_louis": "A Musical Journey Through the Seasons",
-    }
-    subtitle = subtitles.get(game, "")
-
-    content_parts = []
-
-    # Generate card pages
-    for card in cards:
-        emoji_grid = card.get_emoji_grid(items)
-        cells = []
-        for row in emoji_grid:
-            for emoji in row:
-                cells.append(f'<div class="bingo-cell">{emoji}</div>')
-
-        card_html = CARD_TEMPLATE.format(
-            game_title=game_title,
-            subtitle=subtitle,
-            cells="\n        ".join(cells),
-            snowflakes=generate_snowflakes(12),
-        )
-        content_parts.append(card_html)
+    renderer = FestiveRenderer(items, game=game, fonts=fonts, seed=seed, shape=shape)
+    return renderer.render(cards, include_key=include_key)
 
-    # Generate key page
-    if include_key:
-        rows = []
-        # Group items by sections based on game
-        if game == "vintage_christmas_films":
-            sections = [
-                ("Santa Claus (1898)", 1, 2),
-                ("A Winter Straw Ride (1906)", 3, 8),
-                ("The Night Before Christmas (1905)", 9, 16),
-                ("A Trap for Santa Claus (1909)", 17, 30),
-            ]
-        elif game == "meet_me_in_st_louis":
-            sections = [
-                ("Summer 1903", 1, 8),
-                ("Autumn 1903", 9, 16),
-                ("Winter 1903", 17, 24),
-                ("Spring 1904", 25, 30),
-            ]
-        else:
-            sections = None
-
-        if sections:
-            for section_name, start, end in sections:
-                rows.append(f'<div class="key-section-header">{section_name}</div>')
-                for item in items:
-                    if start <= item.order <= end:
-                        rows.append(
-                            f'<div class="key-item">'
-                            f'<span class="emoji">{item.emoji}</span>'
-                            f'<span class="desc">{item.description}</span>'
-                            f'</div>'
-                        )
-        else:
-            for item in items:
-                rows.append(
-                    f'<div class="key-item">'
-                    f'<span class="emoji">{item.emoji}</span>'
-                    f'<span class="desc">{item.description}</span>'
-                    f'</div>'
-                )
-
-        key_html = KEY_TEMPLATE.format(
-            game_title=game_title,
-            num_events=len(items),
-            rows="\n        ".join(rows),
-        )
-        content_parts.append(key_html)
 
-    # Combine into full HTML
-    html = FESTIVE_HTML_TEMPLATE.format(
-        title=f"Bingo Cards - {game_title}",
-        content="\n".join(content_parts),
-        **colors,
-    )
+def iter_festive_html(
+    items: list[BingoItem],
+    cards: Iterable[BingoCard],
+    game: str = "vintage_christmas_films",
+    include_key: bool = True,
+    fonts: str = "google",
+    cache: RenderCache | None = None,
+    seed: int | None = None,
+    shape: CardShape = DEFAULT_SHAPE,
+) -> Iterator[str]:
+    """Stream festive HTML with bingo cards and optional key.
+
+    Suitable for writing to a file or returning as a streaming web response.
 
-    return html
+    Args:
+        items: List of BingoItem objects.
+        cards: BingoCard objects to render (consumed lazily).
+        game: Game name for styling and title.
+        include_key: Whether to include the key/cheat sheet.
+        fonts: Webfont source, see `webfont_links`.
+        cache: Render cache for card page fragments.
+        seed: Seed for the snowflake decorations (random if None).
+        shape: Shape of the cards.
+
+    Returns:
+        Iterator over consecutive chunks of the HTML document.
+    """
+    renderer = FestiveRenderer(items, game=game, fonts=fonts, cache=cache, seed=seed, shape=shape)
+    return renderer.iter_render(cards, include_key=include_key)
+
+
+def write_festive_html(chunks: Iterable[str], output_file: str, compress: bool = False) -> int:
+    """Write streamed HTML chunks to a file as they are produced.
+
+    Args:
+        chunks: HTML chunks, e.g. from `iter_festive_html`.
+        output_file: Output filename.
+        compress: Whether to gzip the output.
+
+    Returns:
+        Number of characters written (before compression).
+    """
+    opener = gzip.open if compress else open
+    written = 0
+    with opener(output_file, "wt", encoding="utf-8") as f:
+        for chunk in chunks:
+            written += f.write(chunk)
+    return written
 
 
 def generate_festive_cards(
@@ -516,9 +741,24 @@ def generate_festive_cards(
     game: str = "vintage_christmas_films",
     win_at: int = 20,
     include_key: bool = True,
+    fonts: str = "google",
+    pdf_file: str | None = None,
+    chunk_size: int | None = None,
+    jobs: int = 0,
+    compress: bool = False,
+    cache: RenderCache | None = None,
+    seed: int | None = None,
+    unique: CardIndex | None = None,
+    win_schedule: Sequence[int] | None = None,
+    shape: CardShape = DEFAULT_SHAPE,
+    pdf_engine: str = "chromium",
+    n_up: int = 1,
+    paper: str = "letter",
 ) -> str:
     """Generate festive HTML bingo cards.
 
+    Card pages are streamed to `output_file` as they are rendered.
+
     Args:
         items: List of BingoItem objects.
         num_cards: Number of cards to generate.
@@ -526,80 +766,412 @@ def generate_festive_cards(
         game: Game name for styling.
         win_at: The number at which cards should win.
         include_key: Whether to include the key/cheat sheet.
+        fonts: Webfont source, see `webfont_links`.
+        pdf_file: Also write the deck to this PDF.
+        chunk_size: Print the PDF in shards of this many cards concurrently
+            (see `festive_pdf_chunked`) instead of from the single HTML file.
+        jobs: Number of shards printed at once (0 uses all CPUs).
+        compress: Whether to gzip the HTML (cannot be printed by Chromium unless `chunk_size` is set).
+        cache: Render cache for card page fragments.
+        seed: Seed for the deck and its decorations; the same seed gives the
+            same HTML and PDF (random if None).
+        unique: Index of cards the deck must not duplicate (see `generate_cards_batch`).
+        win_schedule: Winning call of each card (see `bingo.planner`); replaces
+            `num_cards` and `win_at`, and the achieved wins are summarized.
+        shape: Card grid shape.
+        pdf_engine: How the PDF is made, one of `PDF_ENGINES`: ``chromium``
+            prints the HTML (requires playwright), ``native`` draws the same
+            design with ReportLab (see `bingo.festive_pdf.create_festive_pdf`).
+        n_up: Cards per sheet of the PDF, one of `bingo.imposition.N_UP_CHOICES`;
+            the key gets a sheet of its own.
+        paper: Paper size of the PDF, a key of `bingo.imposition.PAPER_SIZES`.
 
     Returns:
         Path to generated HTML file.
     """
-    # Generate cards
-    cards = []
-    for _ in range(num_cards):
-        card = generate_valid_card(win_at=win_at, total_items=len(items))
-        cards.append(card)
-
-    # Create HTML
-    html = create_festive_html(items, cards, game=game, include_key=include_key)
+    if pdf_engine not in PDF_ENGINES:
+        raise ValueError(f"Unknown PDF engine {pdf_engine!r}; choose from {', '.join(PDF_ENGINES)}")
+    if pdf_engine == "native" and chunk_size:
+        raise ValueError("chunk_size only applies to the chromium PDF engine")
+    if compress and pdf_file and pdf_engine == "chromium" and not chunk_size:
+        raise ValueError("A gzip-compressed HTML file cannot be printed; use chunk_size to print from shards")
+    if jobs < 0:
+        raise ValueError(f"Number of print jobs must not be negative, got {jobs}")
+    layout = sheet_layout(n_up, paper)
+
+    # Generate cards (BingoCard objects are created lazily while rendering)
+    if win_schedule is not None:
+        cards = generate_planned_batch(win_schedule, total_items=len(items), seed=seed, unique=unique, shape=shape)
+        num_cards = len(cards)
+    else:
+        cards = generate_cards_batch(
+            num_cards, win_at=win_at, total_items=len(items), seed=seed, unique=unique, shape=shape
+        )
 
-    # Write to file
+    # Stream HTML to file
     output_path = Path(output_file)
-    output_path.write_text(html, encoding="utf-8")
+    chunks = iter_festive_html(
+        items, cards, game=game, include_key=include_key, fonts=fonts, cache=cache, seed=seed, shape=shape
+    )
+    write_festive_html(chunks, str(output_path), compress=compress)
 
     print(f"Generated {num_cards} festive bingo cards: {output_file}")
     if include_key:
         print("Includes cheat sheet as final page")
-    print("\nTo create PDF: Open in browser and Print to PDF (Ctrl/Cmd+P)")
+    if win_schedule is not None:
+        print(win_summary(cards.completion_times()))
+
+    offline = fonts != "google"
+    if pdf_file is None:
+        print("\nTo create PDF: Open in browser and Print to PDF (Ctrl/Cmd+P)")
+    elif pdf_engine == "native":
+        from .festive_pdf import create_festive_pdf
+
+        create_festive_pdf(
+            items, cards, pdf_file, game=game, include_key=include_key, seed=seed, shape=shape, n_up=n_up, paper=paper
+        )
+    elif chunk_size:
+        festive_pdf_chunked(
+            items,
+            cards,
+            pdf_file,
+            game=game,
+            include_key=include_key,
+            fonts=fonts,
+            chunk_size=chunk_size,
+            jobs=jobs,
+            seed=seed,
+            shape=shape,
+        )
+    else:
+        html_to_pdf(str(output_path), pdf_file, offline=offline)
+    if pdf_file is not None and pdf_engine == "chromium" and not layout.identity:
+        sheets = impose_pdf(pdf_file, pdf_file, layout, key_page=include_key)
+        print(f"Imposed {pdf_file}: {sheets} {paper} sheets, {n_up} cards per sheet")
 
     return str(output_path)
 
 
-def html_to_pdf(html_file: str, pdf_file: str) -> str:
-    """Convert HTML file to PDF using Playwright.
+def create_festive_html_shards(
+    items: list[BingoItem],
+    cards: Sequence[BingoCard],
+    game: str = "vintage_christmas_films",
+    include_key: bool = True,
+    fonts: str = "google",
+    chunk_size: int = 50,
+    seed: int | None = None,
+    shape: CardShape = DEFAULT_SHAPE,
+) -> Iterator[str]:
+    """Create the festive deck as standalone HTML documents of `chunk_size` cards each.
 
     Args:
-        html_file: Path to input HTML file.
+        items: List of BingoItem objects.
+        cards: List of BingoCard objects to render.
+        game: Game name for styling and title.
+        include_key: Whether the last shard ends with the key/cheat sheet.
+        fonts: Webfont source, see `webfont_links`.
+        chunk_size: Maximum number of cards per shard.
+        seed: Seed for the snowflake decorations (random if None).
+        shape: Shape of the cards.
+
+    Yields:
+        Complete HTML strings, in deck order.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    renderer = FestiveRenderer(items, game=game, fonts=fonts, seed=seed, shape=shape)
+    starts = range(0, len(cards), chunk_size) or range(1)
+    for start in starts:
+        yield renderer.render(cards[start:start + chunk_size], include_key=include_key and start == starts[-1])
+
+
+def festive_pdf_chunked(
+    items: list[BingoItem],
+    cards: Sequence[BingoCard],
+    pdf_file: str,
+    game: str = "vintage_christmas_films",
+    include_key: bool = True,
+    fonts: str = "google",
+    chunk_size: int = 50,
+    jobs: int = 0,
+    seed: int | None = None,
+    shape: CardShape = DEFAULT_SHAPE,
+) -> str:
+    """Print a festive deck to one PDF by rendering shards concurrently.
+
+    Each shard of `chunk_size` cards is printed in its own browser context (a
+    separate Chromium renderer process), at most `jobs` at a time, so layout
+    memory stays bounded by the shard size and printing spreads over cores.
+    The shard PDFs are then concatenated in deck order.
+
+    Args:
+        items: List of BingoItem objects.
+        cards: List of BingoCard objects to render.
         pdf_file: Path for output PDF file.
+        game: Game name for styling and title.
+        include_key: Whether to end with the key/cheat sheet.
+        fonts: Webfont source, see `webfont_links`.
+        chunk_size: Maximum number of cards per shard.
+        jobs: Number of shards printed at once (0 uses all CPUs).
+        seed: Seed for the snowflake decorations (random if None).
+        shape: Shape of the cards.
 
     Returns:
         Path to generated PDF file.
     """
-    from playwright.sync_api import sync_playwright
+    import asyncio
+
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="bingo-shards-") as tmpdir:
+        html_files = []
+        shards = create_festive_html_shards(items, cards, game, include_key, fonts, chunk_size, seed, shape)
+        for i, html in enumerate(shards):
+            html_path = Path(tmpdir) / f"shard_{i:04d}.html"
+            html_path.write_text(html, encoding="utf-8")
+            html_files.append(html_path)
+        pdf_files = [path.with_suffix(".pdf") for path in html_files]
+
+        asyncio.run(_print_pdfs_async(html_files, pdf_files, jobs or os.cpu_count() or 1, offline=fonts != "google"))
+        merge_pdfs([str(path) for path in pdf_files], pdf_file)
+
+    elapsed = time.perf_counter() - start
+    print(f"Generated PDF: {pdf_file} ({len(html_files)} shards, {elapsed:.2f}s)")
+    return str(Path(pdf_file).absolute())
+
+
+async def _print_pdfs_async(
+    html_files: list[Path],
+    pdf_files: list[Path],
+    jobs: int,
+    offline: bool = False,
+    font_timeout: float = FONT_LOAD_TIMEOUT,
+) -> None:
+    """Print HTML files to PDF with one browser, up to `jobs` contexts at a time."""
+    import asyncio
+
+    from playwright.async_api import async_playwright
+
+    semaphore = asyncio.Semaphore(jobs)
+
+    async def print_one(browser, html_path: Path, pdf_path: Path) -> None:
+        async with semaphore:
+            context = await browser.new_context()
+            try:
+                page = await context.new_page()
+                if offline:
+                    await page.goto(html_path.absolute().as_uri(), wait_until="load")
+                    await page.wait_for_function("document.fonts.status === 'loaded'", timeout=font_timeout * 1000)
+                else:
+                    await page.goto(html_path.absolute().as_uri(), wait_until="networkidle")
+                    await page.wait_for_function("document.fonts.ready")
+                await page.pdf(path=str(pdf_path), format="Letter", print_background=True)
+            finally:
+                await context.close()
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        try:
+            await asyncio.gather(*(
+                print_one(browser, html_path, pdf_path)
+                for html_path, pdf_path in zip(html_files, pdf_files, strict=True)
+            ))
+        finally:
+            await browser.close()
+
+
+def merge_pdfs(pdf_files: list[str], output_file: str) -> str:
+    """Concatenate PDF files in order.
 
-    html_path = Path(html_file).absolute()
-    pdf_path = Path(pdf_file).absolute()
+    Args:
+        pdf_files: Paths of the PDFs to join.
+        output_file: Path for the combined PDF.
+
+    Returns:
+        Path to the combined PDF file.
+    """
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for pdf_file in pdf_files:
+        writer.append(pdf_file)
+    with open(output_file, "wb") as f:
+        writer.write(f)
+    writer.close()
+    return output_file
+
+
+class PdfRenderer:
+    """Convert HTML and markdown files to PDF with one reusable Chromium instance.
+
+    Launching Chromium dominates the cost of a single conversion, so the
+    renderer keeps the browser and a page open across conversions. Use it as
+    a context manager::
+
+        with PdfRenderer() as renderer:
+            renderer.html_to_pdf("cards.html", "cards.pdf")
+            renderer.markdown_to_pdf("intro.md", "intro.pdf")
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
-        page.goto(f"file://{html_path}", wait_until="networkidle")
-        # Wait for Google Fonts to load
-        page.wait_for_function("document.fonts.ready")
-        page.pdf(path=str(pdf_path), format="Letter", print_background=True)
-        browser.close()
+    Each conversion's wall time is recorded in `timings` as ``(pdf_file, seconds)``.
 
-    print(f"Generated PDF: {pdf_file}")
-    return str(pdf_path)
+    With ``offline=True`` pages are printed once loaded and their fonts are
+    ready (failing after `font_timeout` seconds) instead of waiting for the
+    network to go idle; use it for documents built with local fonts.
+    """
 
+    def __init__(self, offline: bool = False, font_timeout: float = FONT_LOAD_TIMEOUT) -> None:
+        self.offline = offline
+        self.font_timeout = font_timeout
+        self.timings: list[tuple[str, float]] = []
+        self.startup_time = 0.0
+        self._playwright = None
+        self._browser = None
+        self._page = None
+
+    def __enter__(self) -> "PdfRenderer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Launch the browser (no-op if already running)."""
+        if self._browser is not None:
+            return
+        from playwright.sync_api import sync_playwright
+
+        start = time.perf_counter()
+        self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.launch()
+        self._page = self._browser.new_page()
+        self.startup_time = time.perf_counter() - start
+
+    def close(self) -> None:
+        """Close the browser and stop Playwright."""
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+            self._page = None
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+    def html_to_pdf(self, html_file: str, pdf_file: str) -> str:
+        """Convert an HTML file to PDF.
+
+        Args:
+            html_file: Path to input HTML file.
+            pdf_file: Path for output PDF file.
+
+        Returns:
+            Path to generated PDF file.
+        """
+        self.start()
+        html_path = Path(html_file).absolute()
+        pdf_path = Path(pdf_file).absolute()
+
+        start = time.perf_counter()
+        if self.offline:
+            self._page.goto(f"file://{html_path}", wait_until="load")
+            self._page.wait_for_function(
+                "document.fonts.status === 'loaded'", timeout=self.font_timeout * 1000
+            )
+        else:
+            self._page.goto(f"file://{html_path}", wait_until="networkidle")
+            # Wait for Google Fonts to load
+            self._page.wait_for_function("document.fonts.ready")
+        self._page.pdf(path=str(pdf_path), format="Letter", print_background=True)
+        elapsed = time.perf_counter() - start
+        self.timings.append((pdf_file, elapsed))
+
+        print(f"Generated PDF: {pdf_file} ({elapsed:.2f}s)")
+        return str(pdf_path)
+
+    def markdown_to_pdf(self, md_file: str, pdf_file: str, game: str = "meet_me_in_st_louis") -> str:
+        """Convert a markdown file to PDF.
+
+        Args:
+            md_file: Path to input markdown file.
+            pdf_file: Path for output PDF file.
+            game: Game name for styling.
+
+        Returns:
+            Path to generated PDF file.
+        """
+        pdf_path = Path(pdf_file).absolute()
+        fonts = "file" if self.offline else "google"
+        html = markdown_to_html(Path(md_file).read_text(encoding="utf-8"), game=game, fonts=fonts)
+
+        # Write temporary HTML file
+        temp_html = pdf_path.with_suffix(".temp.html")
+        temp_html.write_text(html, encoding="utf-8")
+        try:
+            return self.html_to_pdf(str(temp_html), pdf_file)
+        finally:
+            temp_html.unlink()
+
+
+def html_to_pdf(
+    html_file: str,
+    pdf_file: str,
+    renderer: PdfRenderer | None = None,
+    offline: bool = False,
+) -> str:
+    """Convert HTML file to PDF using Playwright.
 
-def markdown_to_pdf(md_file: str, pdf_file: str, game: str = "meet_me_in_st_louis") -> str:
+    Args:
+        html_file: Path to input HTML file.
+        pdf_file: Path for output PDF file.
+        renderer: Running PdfRenderer to reuse (a browser is launched if None).
+        offline: Whether the document uses only local fonts (see PdfRenderer).
+
+    Returns:
+        Path to generated PDF file.
+    """
+    if renderer is not None:
+        return renderer.html_to_pdf(html_file, pdf_file)
+    with PdfRenderer(offline=offline) as renderer:
+        return renderer.html_to_pdf(html_file, pdf_file)
+
+
+def markdown_to_pdf(
+    md_file: str,
+    pdf_file: str,
+    game: str = "meet_me_in_st_louis",
+    renderer: PdfRenderer | None = None,
+    offline: bool = False,
+) -> str:
     """Convert markdown file to PDF using Playwright.
 
     Args:
         md_file: Path to input markdown file.
         pdf_file: Path for output PDF file.
         game: Game name for styling.
+        renderer: Running PdfRenderer to reuse (a browser is launched if None).
+        offline: Whether to style with local fonts and skip network waits.
 
     Returns:
         Path to generated PDF file.
     """
-    import re
+    if renderer is not None:
+        return renderer.markdown_to_pdf(md_file, pdf_file, game=game)
+    with PdfRenderer(offline=offline) as renderer:
+        return renderer.markdown_to_pdf(md_file, pdf_file, game=game)
 
-    from playwright.sync_api import sync_playwright
 
-    colors = FESTIVE_COLORS.get(game, FESTIVE_COLORS["meet_me_in_st_louis"])
-    md_path = Path(md_file)
-    pdf_path = Path(pdf_file).absolute()
+def markdown_to_html(md_content: str, game: str = "meet_me_in_st_louis", fonts: str = "google") -> str:
+    """Convert markdown text to a styled HTML document.
 
-    # Read markdown content
-    md_content = md_path.read_text(encoding="utf-8")
+    Args:
+        md_content: Markdown source.
+        game: Game name for styling.
+        fonts: Webfont source, see `webfont_links`.
+
+    Returns:
+        Complete HTML string.
+    """
+    pack = find_pack(game)
+    colors = pack.colors if pack else DEFAULT_COLORS
 
     # Simple markdown to HTML conversion
     html_content = md_content
@@ -637,16 +1209,13 @@ def markdown_to_pdf(md_file: str, pdf_file: str, game: str = "meet_me_in_st_loui
     html_content = "\n".join(processed_lines)
 
     # Create full HTML document
-    html = f"""<!DOCTYPE html>
+    return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Introduction</title>
-    <link href="https://fonts.googleapis.com/css2?family=Mountains+of+Christmas:wght@400;700&display=swap"
-          rel="stylesheet">
-    <link href="https://fonts.googleapis.com/css2?family=Cinzel+Decorative:wght@400;700&display=swap"
-          rel="stylesheet">
+{webfont_links(fonts)}
     <style>
         @page {{
             size: letter portrait;
@@ -705,22 +1274,3 @@ def markdown_to_pdf(md_file: str, pdf_file: str, game: str = "meet_me_in_st_loui
 {html_content}
 </body>
 </html>"""
-
-    # Write temporary HTML file
-    temp_html = pdf_path.with_suffix(".temp.html")
-    temp_html.write_text(html, encoding="utf-8")
-
-    # Convert to PDF
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
-        page.goto(f"file://{temp_html.absolute()}", wait_until="networkidle")
-        page.wait_for_function("document.fonts.ready")
-        page.pdf(path=str(pdf_path), format="Letter", print_background=True)
-        browser.close()
-
-    # Clean up temp file
-    temp_html.unlink()
-
-    print(f"Generated PDF: {pdf_file}")
-    return str(pdf_path)
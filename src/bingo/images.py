@@ -0,0 +1,289 @@
+"""PNG/WebP images of bingo cards for digital play, rendered with Pillow.
+
+Cards follow the layout of the PDF cards in `bingo.pdf` (titles above a grid
+whose longer side is `GRID_WIDTH` points), drawn at a chosen DPI. Emoji come
+from a `GlyphAtlas` that rasterizes each item's emoji, shaped by
+`bingo.glyphs`, once per pixel size from Noto Emoji; every card then only
+pastes those masks, so a deck is composited and encoded in a thread pool
+(Pillow releases the GIL while drawing and compressing).
+"""
+
+import os
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFont
+
+from .card import DEFAULT_SHAPE, FREE, FREE_LABEL, BingoCard, CardShape, generate_cards_batch
+from .data import BingoItem, game_title
+from .fonts import NOTO_EMOJI_PATH, NOTO_SANS_PATH
+from .glyphs import emoji_atlas
+
+IMAGE_FORMATS = ("png", "webp")
+DEFAULT_DPI = 150
+# Card layout in points, as in the PDF cards
+GRID_WIDTH = 400
+CARD_PADDING = 24
+TITLE_SIZE = 24
+TITLE_LEADING = 30
+TITLE_GAP = 20
+LINE_WIDTH = 2
+# Emoji and FREE label sizes for 80pt cells; emoji keep this much space from the cell edges
+EMOJI_SIZE = 28
+FREE_SIZE = 18
+CELL_PADDING = 8
+
+
+class GlyphAtlas:
+    """Emoji strings rasterized once per pixel size and shared by every card.
+
+    Glyphs are 8-bit masks cropped to their ink, pasted in any color. Lookups
+    are thread-safe; `CardImageRenderer` rasterizes a deck's emoji up front,
+    so its worker threads only read.
+
+    Args:
+        font_path: Emoji font (bundled Noto Emoji by default; Pillow's default
+            font if it is missing).
+    """
+
+    def __init__(self, font_path: str | Path = NOTO_EMOJI_PATH):
+        self.font_path = Path(font_path)
+        self._fonts: dict[int, ImageFont.FreeTypeFont] = {}
+        self._glyphs: dict[tuple[str, int], Image.Image] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._glyphs)
+
+    def font(self, size: int) -> ImageFont.FreeTypeFont:
+        """Get the emoji font at a pixel size."""
+        if size not in self._fonts:
+            if self.font_path.exists():
+                self._fonts[size] = ImageFont.truetype(str(self.font_path), size)
+            else:
+                self._fonts[size] = ImageFont.load_default(size)
+        return self._fonts[size]
+
+    def glyph(self, text: str, size: int) -> Image.Image:
+        """Get the mask of `text` at a pixel size, rasterizing it on first use."""
+        key = (text, size)
+        glyph = self._glyphs.get(key)
+        if glyph is None:
+            with self._lock:
+                glyph = self._glyphs.get(key)
+                if glyph is None:
+                    glyph = self._rasterize(text, self.font(size))
+                    self._glyphs[key] = glyph
+        return glyph
+
+    @staticmethod
+    def _rasterize(text: str, font: ImageFont.FreeTypeFont) -> Image.Image:
+        left, top, right, bottom = font.getbbox(text)
+        mask = Image.new("L", (max(right - left, 1), max(bottom - top, 1)))
+        ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+        return mask
+
+    def fit(self, text: str, size: int, width: int) -> Image.Image:
+        """Get the mask of `text` at `size`, or smaller if it is wider than `width` pixels."""
+        # Measuring is much cheaper than rasterizing, so only the size used is rasterized
+        left, _, right, _ = self.font(size).getbbox(text)
+        if right - left > width:
+            size = max(1, int(size * width / (right - left)))
+        return self.glyph(text, size)
+
+
+def _text_font(size: int) -> ImageFont.FreeTypeFont:
+    if NOTO_SANS_PATH and NOTO_SANS_PATH.exists():
+        return ImageFont.truetype(str(NOTO_SANS_PATH), size)
+    return ImageFont.load_default(size)
+
+
+class CardImageRenderer:
+    """Draws the cards of one game, shape and DPI as images.
+
+    The layout, fonts and the emoji masks of every item are prepared once;
+    `render` can then be called from several threads at a time.
+
+    Args:
+        items: List of BingoItem objects.
+        title1: First line of title.
+        title2: Second line of title.
+        shape: Shape of the cards.
+        dpi: Resolution in pixels per inch.
+        atlas: Emoji glyph atlas (a new one if None).
+    """
+
+    def __init__(
+        self,
+        items: Sequence[BingoItem],
+        title1: str = "Bingo Card:",
+        title2: str = "",
+        shape: CardShape = DEFAULT_SHAPE,
+        dpi: int = DEFAULT_DPI,
+        atlas: GlyphAtlas | None = None,
+    ):
+        if dpi <= 0:
+            raise ValueError(f"DPI must be positive, got {dpi}")
+        self.items = items
+        self.title1 = title1
+        self.title2 = title2
+        self.shape = shape
+        self.dpi = dpi
+        self.atlas = atlas if atlas is not None else GlyphAtlas()
+
+        def px(points: float) -> int:
+            return round(points * dpi / 72)
+
+        # The longer side of the grid spans GRID_WIDTH, as on the PDF cards
+        cell_points = GRID_WIDTH / max(shape.rows, shape.cols)
+        scale = cell_points / 80
+        self.cell = px(cell_points)
+        self.line_width = max(1, px(LINE_WIDTH))
+        self.padding = px(CARD_PADDING)
+        self.title_font = _text_font(px(TITLE_SIZE))
+        self.free_font = _text_font(px(FREE_SIZE * scale))
+        self.title_leading = px(TITLE_LEADING)
+        self.grid_left = self.padding
+        self.grid_top = self.padding + 2 * self.title_leading + px(TITLE_GAP)
+        self.size = (
+            2 * self.padding + shape.cols * self.cell,
+            self.grid_top + shape.rows * self.cell + self.padding,
+        )
+
+        # Every item's emoji, fitted to a cell, rasterized up front. Pillow's basic layout has no
+        # ligatures, so sequences are drawn from the characters of their shaped glyphs.
+        emoji_size = px(EMOJI_SIZE * scale)
+        emoji_width = self.cell - 2 * px(CELL_PADDING * scale)
+        chars = {}
+        if self.atlas.font_path.exists():
+            atlas = emoji_atlas((item.emoji for item in items), self.atlas.font_path)
+            chars = {text: shaped.chars for text, shaped in atlas.items()}
+        self._glyphs = {
+            item.order: self.atlas.fit(chars.get(item.emoji, item.emoji), emoji_size, emoji_width) for item in items
+        }
+
+        # Titles and grid lines are the same on every card
+        self._background = Image.new("L", self.size, 255)
+        draw = ImageDraw.Draw(self._background)
+        for i, title in enumerate((title1, title2)):
+            draw.text(
+                (self.size[0] / 2, self.padding + i * self.title_leading),
+                title,
+                font=self.title_font,
+                fill=0,
+                anchor="mt",
+            )
+        right = self.grid_left + shape.cols * self.cell
+        bottom = self.grid_top + shape.rows * self.cell
+        half = self.line_width // 2
+        for i in range(shape.rows + 1):
+            y = self.grid_top + i * self.cell
+            draw.rectangle((self.grid_left - half, y - half, right + half, y - half + self.line_width - 1), fill=0)
+        for j in range(shape.cols + 1):
+            x = self.grid_left + j * self.cell
+            draw.rectangle((x - half, self.grid_top - half, x - half + self.line_width - 1, bottom + half), fill=0)
+
+    def render(self, card: BingoCard) -> Image.Image:
+        """Draw one card as a grayscale image."""
+        if card.shape != self.shape:
+            raise ValueError(f"Card shape {card.shape} does not match the renderer's {self.shape}")
+        image = self._background.copy()
+        for row, values in enumerate(card.grid):
+            for col, value in enumerate(values):
+                left = self.grid_left + col * self.cell
+                top = self.grid_top + row * self.cell
+                if value == FREE:
+                    center = (left + self.cell / 2, top + self.cell / 2)
+                    ImageDraw.Draw(image).text(center, FREE_LABEL, font=self.free_font, fill=0, anchor="mm")
+                    continue
+                glyph = self._glyphs[value]
+                x = left + (self.cell - glyph.width) // 2
+                y = top + (self.cell - glyph.height) // 2
+                image.paste(0, (x, y, x + glyph.width, y + glyph.height), glyph)
+        return image
+
+    def save(self, card: BingoCard, filename: str, fmt: str = "png") -> str:
+        """Draw one card and write it as PNG or WebP."""
+        image = self.render(card)
+        if fmt == "png":
+            image.save(filename, "PNG", dpi=(self.dpi, self.dpi))
+        elif fmt == "webp":
+            # Lossless keeps lines and glyph edges crisp and is a third smaller than PNG; method 1 is
+            # nearly as small as the default and a third faster
+            image.save(filename, "WEBP", lossless=True, method=1)
+        else:
+            raise ValueError(f"Unknown image format {fmt!r}; choose from {', '.join(IMAGE_FORMATS)}")
+        return filename
+
+
+def generate_images(
+    items: list[BingoItem],
+    num_cards: int = 10,
+    output_dir: str = ".",
+    prefix: str = "BingoCard",
+    title1: str = "Bingo Card:",
+    title2: str | None = None,
+    win_at: int = 20,
+    game: str = "meet_me_in_st_louis",
+    seed: int | None = None,
+    start: int = 0,
+    shape: CardShape = DEFAULT_SHAPE,
+    fmt: str = "png",
+    dpi: int = DEFAULT_DPI,
+    workers: int = 0,
+) -> list[str]:
+    """Generate bingo cards as PNG or WebP images.
+
+    The deck is the same as `bingo.pdf.generate_cards` gives for the same
+    seed, and files are numbered the same way. Cards are drawn and encoded
+    in a pool of `workers` threads sharing one glyph atlas; the throughput in
+    cards per second is printed.
+
+    Args:
+        items: List of BingoItem objects.
+        num_cards: Number of cards to generate.
+        output_dir: Directory for output files.
+        prefix: Filename prefix.
+        title1: First line of title.
+        title2: Second line of title (defaults to game title).
+        win_at: The number at which cards should win.
+        game: Game name for title lookup.
+        seed: Seed for card generation (random if None).
+        start: Deck index of the first card.
+        shape: Card grid shape.
+        fmt: Image format, one of `IMAGE_FORMATS`.
+        dpi: Resolution in pixels per inch.
+        workers: Number of rendering threads (0 uses all CPUs).
+
+    Returns:
+        List of generated filenames.
+    """
+    if fmt not in IMAGE_FORMATS:
+        raise ValueError(f"Unknown image format {fmt!r}; choose from {', '.join(IMAGE_FORMATS)}")
+    if workers < 0:
+        raise ValueError(f"Number of workers must not be negative, got {workers}")
+    if title2 is None:
+        title2 = game_title(game)
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    cards = list(
+        generate_cards_batch(num_cards, win_at=win_at, total_items=len(items), seed=seed, start=start, shape=shape)
+    )
+    filenames = [str(output_path / f"{prefix}_{i:02d}.{fmt}") for i in range(start + 1, start + num_cards + 1)]
+
+    started = time.perf_counter()
+    renderer = CardImageRenderer(items, title1, title2, shape=shape, dpi=dpi)
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+        list(executor.map(renderer.save, cards, filenames, [fmt] * len(cards)))
+    elapsed = time.perf_counter() - started
+
+    width, height = renderer.size
+    print(
+        f"Rendered {len(filenames)} {width}x{height} {fmt.upper()} cards in {elapsed:.2f}s "
+        f"({len(filenames) / elapsed:.1f} cards/s)"
+    )
+    return filenames
@@ -0,0 +1,268 @@
+"""N-up imposition: several card pages on each print sheet, with cut marks.
+
+A `SheetLayout` places scaled copies of a card page on a sheet of paper. It is
+computed once per (cards per sheet, paper, page size) and reused for every
+sheet. ReportLab renderers draw their pages straight onto the sheets with
+`impose_pages`, and PDFs printed by Chromium are packed afterwards with
+`impose_pdf`. This module needs no rendering dependencies until one of those
+is called.
+"""
+
+import io
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from reportlab.pdfgen.canvas import Canvas
+
+# Sheet sizes in points, portrait
+PAPER_SIZES = {
+    "letter": (612.0, 792.0),
+    "a4": (595.2756, 841.8898),
+    "tabloid": (792.0, 1224.0),
+}
+# Cards per sheet
+N_UP_CHOICES = (1, 2, 4, 6)
+# Every renderer draws its card pages on Letter paper
+PAGE_SIZE = PAPER_SIZES["letter"]
+# White space around the sheet and between cards, where the cut marks go
+SHEET_MARGIN = 0.25 * 72
+SLOT_GAP = 0.25 * 72
+# Cut marks start this far outside a card's corner, so the blade never shows them
+CUT_MARK_OFFSET = 2.0
+CUT_MARK_LENGTH = 6.0
+CUT_MARK_WIDTH = 0.5
+
+
+@dataclass(frozen=True)
+class Slot:
+    """Where one page goes on a sheet.
+
+    Attributes:
+        x: Left edge of the scaled page on the sheet.
+        y: Bottom edge of the scaled page on the sheet.
+        scale: Scale factor of the page.
+    """
+    x: float
+    y: float
+    scale: float
+
+
+@dataclass(frozen=True)
+class SheetLayout:
+    """Positions of the pages and cut marks on a print sheet.
+
+    Attributes:
+        n_up: Pages per sheet.
+        paper: Paper name, a key of `PAPER_SIZES`.
+        sheet_size: Sheet width and height in points (landscape if that fits larger pages).
+        page_size: Size of the pages being placed.
+        slots: Page positions in reading order, top left first.
+        cut_marks: Cut mark line segments ``(x0, y0, x1, y1)``.
+    """
+    n_up: int
+    paper: str
+    sheet_size: tuple[float, float]
+    page_size: tuple[float, float]
+    slots: tuple[Slot, ...]
+    cut_marks: tuple[tuple[float, float, float, float], ...] = ()
+
+    @property
+    def identity(self) -> bool:
+        """Whether each page is its own sheet, unchanged."""
+        return self.n_up == 1 and self.sheet_size == self.page_size
+
+    def sheets(self, num_pages: int) -> int:
+        """Number of sheets `num_pages` pages take up."""
+        return -(-num_pages // self.n_up)
+
+
+def _cut_marks(slots: Iterable[Slot], page_size: tuple[float, float]) -> tuple[tuple[float, float, float, float], ...]:
+    """Short lines continuing each slot's edges outwards from its four corners."""
+    marks = []
+    start, end = CUT_MARK_OFFSET, CUT_MARK_OFFSET + CUT_MARK_LENGTH
+    for slot in slots:
+        width, height = page_size[0] * slot.scale, page_size[1] * slot.scale
+        for x, dx in ((slot.x, -1), (slot.x + width, 1)):
+            for y, dy in ((slot.y, -1), (slot.y + height, 1)):
+                marks.append((x + dx * start, y, x + dx * end, y))
+                marks.append((x, y + dy * start, x, y + dy * end))
+    return tuple(marks)
+
+
+@cache
+def sheet_layout(n_up: int = 1, paper: str = "letter", page_size: tuple[float, float] = PAGE_SIZE) -> SheetLayout:
+    """Lay out `n_up` pages per sheet as large as the paper allows.
+
+    Every rows x columns grid on portrait and landscape paper is tried, and the
+    one giving the largest pages wins; pages are never enlarged. One page per
+    sheet is fitted to the paper without margins or cut marks.
+
+    Args:
+        n_up: Pages per sheet, one of `N_UP_CHOICES`.
+        paper: Paper name, a key of `PAPER_SIZES`.
+        page_size: Size of the pages being placed.
+
+    Returns:
+        The sheet layout (cached, so each template is computed once).
+
+    Raises:
+        ValueError: If `n_up` or `paper` is not supported.
+    """
+    if n_up not in N_UP_CHOICES:
+        raise ValueError(f"Cannot put {n_up} cards on a sheet; choose from {', '.join(map(str, N_UP_CHOICES))}")
+    if paper not in PAPER_SIZES:
+        raise ValueError(f"Unknown paper size {paper!r}; choose from {', '.join(PAPER_SIZES)}")
+    width, height = PAPER_SIZES[paper]
+    page_width, page_height = page_size
+    margin, gap = (0.0, 0.0) if n_up == 1 else (SHEET_MARGIN, SLOT_GAP)
+
+    best = None
+    for cols in (c for c in range(1, n_up + 1) if n_up % c == 0):
+        rows = n_up // cols
+        for sheet_width, sheet_height in ((width, height), (height, width)):
+            cell_width = (sheet_width - 2 * margin - (cols - 1) * gap) / cols
+            cell_height = (sheet_height - 2 * margin - (rows - 1) * gap) / rows
+            scale = min(cell_width / page_width, cell_height / page_height, 1.0)
+            if best is None or scale > best[0]:
+                best = (scale, (sheet_width, sheet_height), rows, cols, cell_width, cell_height)
+    scale, sheet_size, rows, cols, cell_width, cell_height = best
+
+    # Centre each page in its cell, filling rows from the top of the sheet
+    slots = tuple(
+        Slot(
+            margin + col * (cell_width + gap) + (cell_width - page_width * scale) / 2,
+            sheet_size[1] - margin - (row + 1) * cell_height - row * gap + (cell_height - page_height * scale) / 2,
+            scale,
+        )
+        for row in range(rows)
+        for col in range(cols)
+    )
+    cut_marks = _cut_marks(slots, page_size) if n_up > 1 else ()
+    return SheetLayout(n_up, paper, sheet_size, page_size, slots, cut_marks)
+
+
+def draw_cut_marks(c: "Canvas", layout: SheetLayout) -> None:
+    """Draw a layout's cut marks on the current page of a ReportLab canvas."""
+    c.saveState()
+    c.setLineWidth(CUT_MARK_WIDTH)
+    c.setStrokeColorRGB(0, 0, 0)
+    for x0, y0, x1, y1 in layout.cut_marks:
+        c.line(x0, y0, x1, y1)
+    c.restoreState()
+
+
+def _cut_marks_form(c: "Canvas", layout: SheetLayout) -> str | None:
+    """Define the layout's cut marks once per canvas as a form that every sheet reuses."""
+    if not layout.cut_marks:
+        return None
+    name = f"CutMarks{layout.n_up}_{layout.paper}_{round(layout.page_size[0])}x{round(layout.page_size[1])}"
+    if not c.hasForm(name):
+        c.beginForm(name, 0, 0, *layout.sheet_size)
+        draw_cut_marks(c, layout)
+        c.endForm()
+    return name
+
+
+def impose_pages(c: "Canvas", layout: SheetLayout, pages: Iterable[Callable[["Canvas"], None]]) -> int:
+    """Draw pages onto the sheets of a ReportLab canvas, `layout.n_up` per sheet.
+
+    Each page is a function drawing one `layout.page_size` page on the canvas
+    it is given, e.g. ``partial(draw_card_page, card=card, ...)``. The
+    functions run in order with the canvas moved and scaled into the next
+    slot. Each sheet is finished with ``showPage``.
+
+    Args:
+        c: ReportLab canvas; its page size is set to the sheet size.
+        layout: Sheet layout from `sheet_layout`.
+        pages: Page drawing functions.
+
+    Returns:
+        Number of sheets drawn.
+    """
+    form = _cut_marks_form(c, layout)
+    page_width, page_height = layout.page_size
+    sheets = 0
+    for index, draw in enumerate(pages):
+        slot = layout.slots[index % layout.n_up]
+        if index % layout.n_up == 0:
+            if sheets:
+                c.showPage()
+            c.setPageSize(layout.sheet_size)
+            if form is not None:
+                c.doForm(form)
+            sheets += 1
+        if layout.identity:
+            draw(c)
+            continue
+        c.saveState()
+        c.translate(slot.x, slot.y)
+        c.scale(slot.scale, slot.scale)
+        clip = c.beginPath()
+        clip.rect(0, 0, page_width, page_height)
+        c.clipPath(clip, stroke=0, fill=0)
+        draw(c)
+        c.restoreState()
+    if sheets:
+        c.showPage()
+    return sheets
+
+
+@cache
+def _cut_marks_pdf(layout: SheetLayout) -> bytes:
+    """A sheet holding only the layout's cut marks, to stamp onto imposed PDF sheets."""
+    from reportlab.pdfgen import canvas
+
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=layout.sheet_size, invariant=1)
+    draw_cut_marks(c, layout)
+    c.save()
+    return buffer.getvalue()
+
+
+def impose_pdf(input_pdf: str, output_pdf: str, layout: SheetLayout, key_page: bool = False) -> int:
+    """Pack the pages of a PDF onto sheets, e.g. the festive cards printed by Chromium.
+
+    Args:
+        input_pdf: PDF of `layout.page_size` pages.
+        output_pdf: Path for the imposed PDF (may be `input_pdf`).
+        layout: Sheet layout from `sheet_layout`.
+        key_page: Whether the last page is a key, put on a sheet of its own.
+
+    Returns:
+        Number of sheets written.
+    """
+    from pypdf import PdfReader, PdfWriter, Transformation
+
+    pages = list(PdfReader(input_pdf).pages)
+    groups = [(layout, pages)]
+    if key_page and pages:
+        groups = [(layout, pages[:-1]), (sheet_layout(1, layout.paper, layout.page_size), pages[-1:])]
+
+    writer = PdfWriter()
+    sheets = 0
+    for group_layout, group in groups:
+        marks = PdfReader(io.BytesIO(_cut_marks_pdf(group_layout))).pages[0] if group_layout.cut_marks else None
+        for start in range(0, len(group), group_layout.n_up):
+            sheet = writer.add_blank_page(*group_layout.sheet_size)
+            sheets += 1
+            for slot, page in zip(group_layout.slots, group[start:start + group_layout.n_up], strict=False):
+                box = page.mediabox
+                # Chromium's page boxes can be a fraction of a point off the nominal page size
+                scale = slot.scale * min(
+                    group_layout.page_size[0] / float(box.width), group_layout.page_size[1] / float(box.height)
+                )
+                transform = Transformation().translate(-box.left, -box.bottom).scale(scale).translate(slot.x, slot.y)
+                sheet.merge_transformed_page(page, transform)
+            if marks is not None:
+                sheet.merge_page(marks)
+
+    # Write through memory, since the reader may still be reading `input_pdf`
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    writer.close()
+    Path(output_pdf).write_bytes(buffer.getvalue())
+    return sheets
@@ -1,5 +1,11 @@
 """PDF generation for bingo cards and keys."""
 
+import hashlib
+import io
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache, partial
 from pathlib import Path
 
 from reportlab.lib import colors
@@ -8,37 +14,30 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.pdfgen import canvas
 
-from .card import BingoCard
-from .data import BingoItem
+from .cache import RenderCache
+from .card import DEFAULT_SHAPE, FREE, FREE_LABEL, BingoCard, CardIndex, CardShape
+from .data import BingoItem, game_title
+from .fonts import NOTO_EMOJI_PATH, NOTO_SANS_PATH, emoji_codepoints, subset_font
+from .glyphs import ShapedEmoji, emoji_atlas
+from .imposition import impose_pages, sheet_layout
 
-# Game titles for PDF headers
-GAME_TITLES = {
-    "meet_me_in_st_louis": "Meet Me In St. Louis",
-    "vintage_christmas_films": "Vintage Christmas Films",
-}
+# Embed emoji from a per-game subset of Noto Emoji rather than the full font
+SUBSET_EMOJI_FONT = True
 
-# Font paths - can be overridden
-FONT_DIR = Path(__file__).parent.parent.parent / "fonts"
-NOTO_EMOJI_PATH = FONT_DIR / "NotoEmoji-VariableFont.ttf"
-# Cross-platform font search: check common locations, fallback to Helvetica
-_NOTO_SANS_CANDIDATES = [
-    FONT_DIR / "NotoSans-Regular.ttf",  # Bundled (preferred)
-    Path.home() / "Library/Fonts/NotoSans-Regular.ttf",  # macOS user
-    Path("/usr/share/fonts/truetype/noto/NotoSans-Regular.ttf"),  # Linux
-    Path("/usr/share/fonts/noto/NotoSans-Regular.ttf"),  # Linux alt
-    Path("C:/Windows/Fonts/NotoSans-Regular.ttf"),  # Windows
-]
-NOTO_SANS_PATH = next((p for p in _NOTO_SANS_CANDIDATES if p.exists()), None)
+# Version of the card PDF drawing code, part of its render cache keys: bump it whenever the output changes
+CARD_PDF_RENDER_VERSION = 4
 
-_fonts_registered = False
+# Width in points of the longer side of a card grid (80pt cells on a 5x5 card)
+GRID_WIDTH = 400
 
 
+@cache
 def register_fonts() -> None:
-    """Register fonts with ReportLab."""
-    global _fonts_registered
-    if _fonts_registered:
-        return
+    """Register fonts with ReportLab.
 
+    Registration happens once per process; `generate_cards` also runs it as the
+    initializer of each worker process.
+    """
     # Register Noto Emoji for emoji characters
     if NOTO_EMOJI_PATH.exists():
         pdfmetrics.registerFont(TTFont("NotoEmoji", str(NOTO_EMOJI_PATH)))
@@ -47,8 +46,6 @@ def register_fonts() -> None:
     if NOTO_SANS_PATH and NOTO_SANS_PATH.exists():
         pdfmetrics.registerFont(TTFont("NotoSans", str(NOTO_SANS_PATH)))
 
-    _fonts_registered = True
-
 
 def get_text_font() -> str:
     """Get the font name for regular text."""
@@ -57,11 +54,78 @@ def get_text_font() -> str:
     return "Helvetica"
 
 
-def get_emoji_font() -> str:
-    """Get the font name for emoji."""
-    if NOTO_EMOJI_PATH.exists():
+def get_emoji_font(items: Sequence[BingoItem] | None = None, extra: str = "") -> str:
+    """Get the font name for emoji.
+
+    With `items`, a subset of Noto Emoji holding just their emoji is
+    registered once per process and game (see `bingo.fonts.subset_font`), so
+    each canvas subsets and embeds from a small font instead of the full one.
+
+    Args:
+        items: Items whose emoji will be drawn (the full font if None).
+        extra: Further characters drawn in the emoji font, e.g. decorations.
+
+    Returns:
+        Registered font name.
+    """
+    if not NOTO_EMOJI_PATH.exists():
+        return "Helvetica"
+    if items is None or not SUBSET_EMOJI_FONT:
         return "NotoEmoji"
-    return "Helvetica"
+    return _register_emoji_subset(emoji_codepoints([*(item.emoji for item in items), extra]))
+
+
+@cache
+def _register_emoji_subset(codepoints: frozenset[int]) -> str:
+    """Register the Noto Emoji subset for a set of code points and get its font name."""
+    try:
+        path = subset_font(NOTO_EMOJI_PATH, codepoints)
+    except OSError:
+        return "NotoEmoji"  # Subset cache not writable: embed from the full font
+    name = f"NotoEmoji-{path.stem[:16]}"
+    pdfmetrics.registerFont(TTFont(name, str(path)))
+    return name
+
+
+def get_emoji_atlas(items: Sequence[BingoItem]) -> dict[str, ShapedEmoji] | None:
+    """Get the shaped emoji of a game (see `bingo.glyphs.emoji_atlas`), or None without Noto Emoji."""
+    if not NOTO_EMOJI_PATH.exists():
+        return None
+    return emoji_atlas(item.emoji for item in items)
+
+
+def draw_emoji(
+    c: canvas.Canvas,
+    emoji: str,
+    x: float,
+    y: float,
+    size: float,
+    font: str,
+    atlas: dict[str, ShapedEmoji] | None,
+) -> None:
+    """Draw an emoji string with the centre of its ink at (x, y).
+
+    The string's shaped characters are placed from the atlas's ink box, so
+    nothing is shaped or measured per card. Without an atlas entry the string
+    is drawn as is, centred on its advance.
+
+    Args:
+        c: Canvas to draw on.
+        emoji: Emoji string.
+        x: Horizontal centre.
+        y: Vertical centre.
+        size: Font size.
+        font: Registered emoji font name.
+        atlas: Shaped emoji from `get_emoji_atlas`.
+    """
+    c.setFont(font, size)
+    shaped = atlas.get(emoji) if atlas is not None else None
+    if shaped is None:
+        c.drawCentredString(x, y - 0.35 * size, emoji)
+        return
+    cx, cy = shaped.center
+    # Hundredths of a point keep the page streams as short as centring on the advance did
+    c.drawString(round(x - cx * size, 2), round(y - cy * size, 2), shaped.chars)
 
 
 def create_key_pdf(
@@ -81,14 +145,30 @@ def create_key_pdf(
         game: Game name for title lookup.
     """
     if title2 is None:
-        title2 = GAME_TITLES.get(game, game)
+        title2 = game_title(game)
     register_fonts()
-    text_font = get_text_font()
-    emoji_font = get_emoji_font()
 
-    c = canvas.Canvas(filename, pagesize=letter)
-    width, height = letter
+    # invariant: no timestamps or random document IDs, so the same input gives identical bytes
+    c = canvas.Canvas(filename, pagesize=letter, invariant=1)
     c.setTitle(f"{title1} {title2}")
+    draw_key_page(c, items, title1, title2)
+    c.save()
+    print(f"Saved to {filename}")
+
+
+def draw_key_page(c: canvas.Canvas, items: list[BingoItem], title1: str, title2: str) -> None:
+    """Draw the bingo key table on the current page of a canvas.
+
+    Args:
+        c: Canvas to draw on (fonts must already be registered).
+        items: List of BingoItem objects.
+        title1: First line of title.
+        title2: Second line of title.
+    """
+    text_font = get_text_font()
+    emoji_font = get_emoji_font(items)
+    atlas = get_emoji_atlas(items)
+    width, height = letter
 
     # Draw title
     c.setFont(text_font, 24)
@@ -115,9 +195,13 @@ def create_key_pdf(
     # Draw table rows
     c.setFillColor(colors.black)
     for item in items:
-        # Emoji column
-        c.setFont(emoji_font, 10)
-        c.drawString(x_offset + 5, y_offset - row_height + 5, item.emoji)
+        # Emoji column, left aligned
+        shaped = atlas.get(item.emoji) if atlas is not None else None
+        if shaped is not None:
+            draw_emoji(c, item.emoji, x_offset + 5 + 5 * shaped.width, y_offset - row_height / 2, 10, emoji_font, atlas)
+        else:
+            c.setFont(emoji_font, 10)
+            c.drawString(x_offset + 5, y_offset - row_height + 5, item.emoji)
 
         # Description column
         c.setFont(text_font, 9)
@@ -142,9 +226,6 @@ def create_key_pdf(
         x_pos += w
     c.line(x_pos, y_offset_init, x_pos, y_offset_init - row_height * (len(items) + 1))
 
-    c.save()
-    print(f"Saved to {filename}")
-
 
 def create_card_pdf(
     card: BingoCard,
@@ -153,6 +234,7 @@ def create_card_pdf(
     title1: str = "Bingo Card:",
     title2: str | None = None,
     game: str = "meet_me_in_st_louis",
+    cache: RenderCache | None = None,
 ) -> None:
     """Create a PDF with a bingo card.
 
@@ -163,52 +245,191 @@ def create_card_pdf(
         title1: First line of title.
         title2: Second line of title (defaults to game title).
         game: Game name for title lookup.
+        cache: Render cache to reuse identical PDFs from.
     """
     if title2 is None:
-        title2 = GAME_TITLES.get(game, game)
+        title2 = game_title(game)
+
+    if cache is not None:
+        key = card_pdf_cache_key(card, items, title1, title2)
+        data = cache.get(key)
+        if data is None:
+            data = _render_card_pdf_bytes(card, items, title1, title2)
+            cache.put(key, data)
+        Path(filename).write_bytes(data)
+        print(f"Saved to {filename}")
+        return
+
     register_fonts()
+    c = canvas.Canvas(filename, pagesize=letter, invariant=1)
+    c.setTitle(f"{title1} {title2}")
+    draw_card_page(c, card, items, title1, title2)
+    c.save()
+    print(f"Saved to {filename}")
+
+
+def card_pdf_cache_key(card: BingoCard, items: list[BingoItem], title1: str, title2: str) -> str:
+    """Get the render cache key of a card PDF."""
+    return RenderCache.key(
+        "card_pdf",
+        CARD_PDF_RENDER_VERSION,
+        card.grid,
+        [item.emoji for item in items],
+        title1,
+        title2,
+        get_text_font(),
+        get_emoji_font(items),
+    )
+
+
+def _render_card_pdf_bytes(card: BingoCard, items: list[BingoItem], title1: str, title2: str) -> bytes:
+    """Render a single-card PDF in memory."""
+    register_fonts()
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=letter, invariant=1)
+    c.setTitle(f"{title1} {title2}")
+    draw_card_page(c, card, items, title1, title2)
+    c.save()
+    return buffer.getvalue()
+
+
+def _grid_geometry(shape: CardShape) -> tuple[float, float, float, float]:
+    """Cell size, font scale and bottom-left corner of a card grid on a Letter page."""
+    page_width, page_height = letter
+    # The longer side spans GRID_WIDTH, so cells grow on smaller grids
+    cell_size = GRID_WIDTH / max(shape.rows, shape.cols)
+    scale = cell_size / 80  # Font sizes and offsets are for 80pt cells
+    margin_x = (page_width - (shape.cols * cell_size)) / 2
+    margin_y = (page_height - (shape.rows * cell_size)) / 2 - 20  # Offset for title
+    return cell_size, scale, margin_x, margin_y
+
+
+def _card_chrome_form(c: canvas.Canvas, shape: CardShape, title1: str, title2: str) -> str:
+    """Define the parts of a card page that every card shares once per canvas, as a form.
+
+    The titles, grid lines and free space label depend only on the titles and
+    the card shape, so each card page of a deck places the same form and only
+    draws its own emoji.
+
+    Returns:
+        Form name.
+    """
     text_font = get_text_font()
-    emoji_font = get_emoji_font()
+    key = hashlib.sha256(f"{text_font}\0{title1}\0{title2}".encode()).hexdigest()[:16]
+    name = f"CardChrome{shape.rows}x{shape.cols}{'F' if shape.free_center else ''}_{key}"
+    if c.hasForm(name):
+        return name
 
-    c = canvas.Canvas(filename, pagesize=letter)
     page_width, page_height = letter
-    c.setTitle(f"{title1} {title2}")
+    cell_size, scale, margin_x, margin_y = _grid_geometry(shape)
+    rows, cols = shape.rows, shape.cols
+    c.saveState()  # Keep the canvas's font and colors out of the page after the form
+    c.beginForm(name, 0, 0, page_width, page_height)
 
     # Draw title
     c.setFont(text_font, 24)
     c.drawCentredString(page_width / 2, page_height - 100, title1)
     c.drawCentredString(page_width / 2, page_height - 125, title2)
 
-    # Grid settings
-    grid_size = 5
-    cell_size = 80
-    margin_x = (page_width - (grid_size * cell_size)) / 2
-    margin_y = (page_height - (grid_size * cell_size)) / 2 - 20  # Offset for title
-
     # Draw grid lines
     c.setLineWidth(2)
     c.setStrokeColor(colors.black)
-    for i in range(grid_size + 1):
-        # Horizontal lines
-        c.line(margin_x, margin_y + i * cell_size, margin_x + grid_size * cell_size, margin_y + i * cell_size)
-        # Vertical lines
-        c.line(margin_x + i * cell_size, margin_y, margin_x + i * cell_size, margin_y + grid_size * cell_size)
-
-    # Get emoji grid
-    emoji_grid = card.get_emoji_grid(items)
-
-    # Fill grid cells with emoji
-    c.setFont(emoji_font, 28)
-    for row in range(grid_size):
-        for col in range(grid_size):
-            emoji = emoji_grid[row][col]
+    for i in range(rows + 1):
+        c.line(margin_x, margin_y + i * cell_size, margin_x + cols * cell_size, margin_y + i * cell_size)
+    for j in range(cols + 1):
+        c.line(margin_x + j * cell_size, margin_y, margin_x + j * cell_size, margin_y + rows * cell_size)
+
+    if shape.free_cell is not None:
+        row, col = shape.free_cell
+        x = margin_x + col * cell_size + cell_size / 2
+        y = margin_y + (rows - row - 1) * cell_size + cell_size / 2
+        c.setFont(text_font, 18 * scale)
+        c.drawCentredString(x, y - 6 * scale, FREE_LABEL)
+
+    c.endForm()
+    c.restoreState()
+    return name
+
+
+def draw_card_page(c: canvas.Canvas, card: BingoCard, items: list[BingoItem], title1: str, title2: str) -> None:
+    """Draw a bingo card on the current page of a canvas.
+
+    The titles and grid are a form defined once per canvas for each title and
+    shape (see `_card_chrome_form`); the page itself only places it and draws
+    the card's emoji.
+
+    Args:
+        c: Canvas to draw on (fonts must already be registered).
+        card: The BingoCard to render.
+        items: List of BingoItem objects for emoji mapping.
+        title1: First line of title.
+        title2: Second line of title.
+    """
+    emoji_font = get_emoji_font(items)
+    atlas = get_emoji_atlas(items)
+    c.doForm(_card_chrome_form(c, card.shape, title1, title2))
+
+    # Fill grid cells with emoji, each centred on its ink
+    rows = card.shape.rows
+    cell_size, scale, margin_x, margin_y = _grid_geometry(card.shape)
+    order_to_emoji = {item.order: item.emoji for item in items}
+    for row, values in enumerate(card.grid):
+        for col, value in enumerate(values):
+            if value == FREE:
+                continue
             x = margin_x + col * cell_size + cell_size / 2
             # Invert row for PDF coordinates (0,0 is bottom-left)
-            y = margin_y + (grid_size - row - 1) * cell_size + cell_size / 2 - 10
-            c.drawCentredString(x, y, emoji)
+            y = margin_y + (rows - row - 1) * cell_size + cell_size / 2
+            draw_emoji(c, order_to_emoji[value], x, y, 28 * scale, emoji_font, atlas)
 
+
+def create_cards_pdf(
+    cards: Sequence[BingoCard],
+    items: list[BingoItem],
+    filename: str = "BingoCards.pdf",
+    title1: str = "Bingo Card:",
+    title2: str | None = None,
+    game: str = "meet_me_in_st_louis",
+    include_key: bool = False,
+    n_up: int = 1,
+    paper: str = "letter",
+) -> None:
+    """Create a single multi-page PDF with one bingo card per page.
+
+    All pages share one canvas, so fonts are embedded once for the whole deck.
+    With `n_up` or `paper`, the card pages are imposed onto print sheets (see
+    `bingo.imposition`) and the key gets a sheet of its own.
+
+    Args:
+        cards: The BingoCards to render.
+        items: List of BingoItem objects for emoji mapping.
+        filename: Output filename.
+        title1: First line of card titles.
+        title2: Second line of title (defaults to game title).
+        game: Game name for title lookup.
+        include_key: Whether to append the bingo key as the last page.
+        n_up: Cards per sheet, one of `bingo.imposition.N_UP_CHOICES`.
+        paper: Paper size, a key of `bingo.imposition.PAPER_SIZES`.
+    """
+    if title2 is None:
+        title2 = game_title(game)
+    layout = sheet_layout(n_up, paper)
+    register_fonts()
+
+    c = canvas.Canvas(filename, pagesize=letter, invariant=1)
+    c.setTitle(f"{title1} {title2}")
+    sheets = impose_pages(
+        c, layout, (partial(draw_card_page, card=card, items=items, title1=title1, title2=title2) for card in cards)
+    )
+    if include_key:
+        sheets += impose_pages(
+            c, sheet_layout(1, paper), [partial(draw_key_page, items=items, title1="Bingo Key:", title2=title2)]
+        )
     c.save()
-    print(f"Saved to {filename}")
+    if layout.identity:
+        print(f"Saved to {filename}")
+    else:
+        print(f"Saved to {filename} ({sheets} {paper} sheets, {n_up} cards per sheet)")
 
 
 def generate_cards(
@@ -220,9 +441,32 @@ def generate_cards(
     title2: str | None = None,
     win_at: int = 20,
     game: str = "meet_me_in_st_louis",
+    seed: int | None = None,
+    start: int = 0,
+    workers: int = 1,
+    single_file: bool = False,
+    include_key: bool = False,
+    cache: RenderCache | None = None,
+    unique: CardIndex | None = None,
+    win_schedule: Sequence[int] | None = None,
+    shape: CardShape = DEFAULT_SHAPE,
+    n_up: int = 1,
+    paper: str = "letter",
 ) -> list[str]:
     """Generate multiple bingo cards as PDFs.
 
+    Cards are generated up front in this process, so the deck depends only on
+    `seed`; rendering is then spread over `workers` processes. Filenames are
+    numbered in deck order regardless of the worker count, and the PDFs are
+    byte-identical for the same seed.
+
+    With `single_file`, the whole deck is written to ``{prefix}.pdf`` in this
+    process instead (one page per card, fonts embedded once).
+
+    With a `cache`, cards already rendered by an earlier run are copied from
+    the cache (looked up in this process, so its hit/miss counters cover the
+    whole run) and only the others are rendered.
+
     Args:
         items: List of BingoItem objects.
         num_cards: Number of cards to generate.
@@ -232,23 +476,90 @@ def generate_cards(
         title2: Second line of title (defaults to game title).
         win_at: The number at which cards should win.
         game: Game name for title lookup.
+        seed: Seed for card generation (random if None).
+        start: Deck index of the first card; with a seed, generates cards
+            ``start + 1 .. start + num_cards`` of that deck.
+        workers: Number of rendering processes (0 uses all CPUs).
+        single_file: Whether to write all cards to one multi-page PDF.
+        include_key: Whether to add the bingo key page (single-file mode only).
+        cache: Render cache for individual card PDFs.
+        unique: Index of cards the deck must not duplicate (see `generate_cards_batch`).
+        win_schedule: Winning call of each card (see `bingo.planner`); replaces
+            `num_cards` and `win_at`, and the achieved wins are summarized.
+        shape: Card grid shape.
+        n_up: Cards per print sheet (single-file mode only, see `create_cards_pdf`).
+        paper: Paper size of the print sheets (single-file mode only).
 
     Returns:
         List of generated filenames.
     """
-    from .card import generate_valid_card
+    from .card import generate_cards_batch
+    from .planner import generate_planned_batch, win_summary
 
+    if workers < 0:
+        raise ValueError(f"Number of workers must not be negative, got {workers}")
     if title2 is None:
-        title2 = GAME_TITLES.get(game, game)
+        title2 = game_title(game)
+    if not single_file and not sheet_layout(n_up, paper).identity:
+        raise ValueError("Cards are imposed onto print sheets only in single-file mode")
 
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    filenames = []
-    for i in range(1, num_cards + 1):
-        card = generate_valid_card(win_at=win_at, total_items=len(items))
-        filename = str(output_path / f"{prefix}_{i:02d}.pdf")
-        create_card_pdf(card, items, filename, title1, title2, game=game)
-        filenames.append(filename)
+    if win_schedule is not None:
+        batch = generate_planned_batch(win_schedule, total_items=len(items), seed=seed, unique=unique, shape=shape)
+        num_cards = len(batch)
+        print(win_summary(batch.completion_times()))
+    else:
+        batch = generate_cards_batch(
+            num_cards, win_at=win_at, total_items=len(items), seed=seed, start=start, unique=unique,
+            shape=shape,
+        )
+    cards = list(batch)
+
+    if single_file:
+        filename = str(output_path / f"{prefix}.pdf")
+        create_cards_pdf(
+            cards, items, filename, title1, title2, game=game, include_key=include_key, n_up=n_up, paper=paper
+        )
+        return [filename]
+
+    filenames = [str(output_path / f"{prefix}_{i:02d}.pdf") for i in range(start + 1, start + num_cards + 1)]
+
+    # Cards still to render, with their cache keys
+    pending = []
+    for card, filename in zip(cards, filenames, strict=True):
+        key = card_pdf_cache_key(card, items, title1, title2) if cache is not None else None
+        data = cache.get(key) if cache is not None else None
+        if data is None:
+            pending.append((card, filename, key))
+        else:
+            Path(filename).write_bytes(data)
+            print(f"Saved to {filename}")
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(pending) <= 1:
+        for card, filename, _ in pending:
+            create_card_pdf(card, items, filename, title1, title2, game=game)
+    else:
+        # Build the emoji subset and atlas here, so workers only load them
+        get_emoji_font(items)
+        get_emoji_atlas(items)
+        with ProcessPoolExecutor(max_workers=workers, initializer=register_fonts) as executor:
+            # map() yields in submission order, so any worker failure surfaces here
+            list(executor.map(
+                create_card_pdf,
+                [card for card, _, _ in pending],
+                [items] * len(pending),
+                [filename for _, filename, _ in pending],
+                [title1] * len(pending),
+                [title2] * len(pending),
+                [game] * len(pending),
+                chunksize=max(1, len(pending) // (4 * workers)),
+            ))
+
+    if cache is not None:
+        for _, filename, key in pending:
+            cache.put(key, Path(filename).read_bytes())
 
     return filenames
@@ -0,0 +1,158 @@
+"""Winner schedules: how many cards of a deck win at each call."""
+
+import random
+import re
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from .card import DEFAULT_SHAPE, CardBatch, CardIndex, CardShape, feasible_win_range, generate_cards_batch, new_seed
+
+# COUNT@CALLS, e.g. "2@18", "5@20-22" or "rest@24+"
+_TARGET_PATTERN = re.compile(r"^\s*(?P<count>\d+|rest)\s*@\s*(?P<first>\d+)\s*(?:(?P<plus>\+)|-\s*(?P<last>\d+))?\s*$")
+
+
+@dataclass
+class WinTarget:
+    """Cards that should win somewhere within a range of calls.
+
+    Attributes:
+        count: Number of cards, or None for the cards not claimed by other targets.
+        calls: Calls the cards win at, spread as evenly as possible.
+    """
+    count: int | None
+    calls: range
+
+
+def parse_win_distribution(spec: str, total_items: int, shape: CardShape = DEFAULT_SHAPE) -> list[WinTarget]:
+    """Parse a win distribution such as ``"2@18,5@20,rest@24+"``.
+
+    Each comma-separated entry is ``COUNT@CALLS``: COUNT is a number of cards
+    or ``rest`` (every card not claimed by another entry, at most once), and
+    CALLS is one call (``20``), an inclusive range (``20-22``) or a call and
+    everything after it that a card can win at (``24+``).
+
+    Args:
+        spec: Distribution string.
+        total_items: Total number of items in the game.
+        shape: Card shape.
+
+    Returns:
+        Parsed targets in the order given.
+
+    Raises:
+        ValueError: If the string is malformed or names a call no card can win at.
+    """
+    feasible = feasible_win_range(total_items, shape)
+    targets = []
+    for entry in spec.split(","):
+        match = _TARGET_PATTERN.match(entry)
+        if match is None:
+            raise ValueError(f"Invalid win distribution entry {entry.strip()!r}, expected COUNT@CALL[-LAST|+]")
+        first = int(match["first"])
+        last = feasible.stop - 1 if match["plus"] else int(match["last"] or first)
+        calls = range(first, last + 1)
+        if not calls or calls.start not in feasible or calls[-1] not in feasible:
+            raise ValueError(
+                f"Cannot win at {entry.strip().partition('@')[2]} with {total_items} items "
+                f"(feasible: {feasible.start}-{feasible.stop - 1})"
+            )
+        count = None if match["count"] == "rest" else int(match["count"])
+        targets.append(WinTarget(count, calls))
+    if sum(target.count is None for target in targets) > 1:
+        raise ValueError("Only one win distribution entry can use 'rest'")
+    return targets
+
+
+def plan_wins(targets: Sequence[WinTarget], num_cards: int, seed: int | None = None) -> list[int]:
+    """Assign a winning call to every card of a deck.
+
+    Args:
+        targets: Parsed targets (see `parse_win_distribution`).
+        num_cards: Number of cards in the deck.
+        seed: Seed for shuffling the schedule, so early and late winners are
+            spread through the deck (random if None).
+
+    Returns:
+        The winning call of each card, in deck order.
+
+    Raises:
+        ValueError: If the targets claim more or fewer than `num_cards` cards.
+    """
+    claimed = sum(target.count for target in targets if target.count is not None)
+    rest = num_cards - claimed
+    if rest < 0:
+        raise ValueError(f"Win distribution asks for {claimed} cards but the deck has {num_cards}")
+    if rest and all(target.count is not None for target in targets):
+        raise ValueError(f"Win distribution covers {claimed} of {num_cards} cards; add a 'rest@...' entry")
+
+    schedule = []
+    for target in targets:
+        count = rest if target.count is None else target.count
+        # Round-robin over the calls, so a range gets an even spread
+        schedule.extend(target.calls[i % len(target.calls)] for i in range(count))
+    random.Random(seed).shuffle(schedule)
+    return schedule
+
+
+def generate_planned_batch(
+    schedule: Sequence[int],
+    total_items: int = 30,
+    seed: int | None = None,
+    unique: CardIndex | None = None,
+    shape: CardShape = DEFAULT_SHAPE,
+) -> CardBatch:
+    """Generate a deck whose card ``i`` wins exactly at call ``schedule[i]``.
+
+    Cards winning at the same call are generated together with
+    `generate_cards_batch`, each group from its own stream seeded by
+    ``(seed, call)``, and the achieved completion times are checked against
+    the schedule.
+
+    Args:
+        schedule: Winning call of each card (see `plan_wins`).
+        total_items: Total number of items in the game.
+        seed: Deck seed (a fresh one if None).
+        unique: Index of cards to avoid duplicating.
+        shape: Card shape.
+
+    Returns:
+        A CardBatch in schedule order.
+
+    Raises:
+        ValueError: If a call is outside `feasible_win_range(total_items, shape)`
+            or `seed` is negative.
+    """
+    import numpy as np
+
+    if seed is not None and seed < 0:
+        raise ValueError(f"Seed must not be negative, got {seed}")
+    if seed is None:
+        seed = new_seed()
+    win_ats = np.asarray(schedule, dtype=np.int64)
+    grids = np.empty((len(win_ats), shape.rows, shape.cols), dtype=np.int64)
+    for win_at in np.unique(win_ats):
+        positions = np.flatnonzero(win_ats == win_at)
+        group_seed = int(np.random.SeedSequence([seed, int(win_at)]).generate_state(1, dtype=np.uint64)[0])
+        grids[positions] = generate_cards_batch(
+            len(positions), int(win_at), total_items, seed=group_seed, unique=unique, shape=shape
+        ).grids
+
+    if len(win_ats) and not (CardBatch(grids).completion_times() == win_ats).all():
+        raise RuntimeError("Generated cards do not match the win schedule")
+    return CardBatch(grids)
+
+
+def win_summary(win_calls: Iterable[int]) -> str:
+    """Describe how many cards win at each call.
+
+    Args:
+        win_calls: Winning call of each card, e.g. `CardBatch.completion_times()`.
+
+    Returns:
+        A line such as ``"Wins by call: 18: 2 cards, 20: 5 cards"``.
+    """
+    counts = sorted(Counter(int(call) for call in win_calls).items())
+    return "Wins by call: " + ", ".join(
+        f"{call}: {count} card{'s' if count != 1 else ''}" for call, count in counts
+    )
@@ -0,0 +1,246 @@
+"""Monte Carlo simulation of bingo games with randomized call orders."""
+
+import os
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .card import CardShape, line_indices, new_seed
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# How events are called: in a random order, or in film order perturbed by jitter and skips
+CALL_ORDERS = ("shuffle", "film")
+
+# Upper bound on the (games, cards, line cells) array built per chunk of games
+_CHUNK_ELEMENTS = 4_000_000
+
+# Number of most and least likely winning cards listed for large decks
+_LISTED_CARDS = 10
+
+
+@dataclass
+class SimulationResult:
+    """Aggregated outcome of many simulated games against one deck.
+
+    Attributes:
+        games: Number of games played.
+        total_items: Number of events that can be called.
+        first_win: Games by the call at which the first bingo happened; index
+            ``total_items + 1`` counts games nobody won.
+        winners: Games by the number of cards that won on that first call.
+        card_wins: Games each card won (ties count for every winner).
+        elapsed: Wall-clock seconds spent simulating.
+    """
+    games: int
+    total_items: int
+    first_win: "np.ndarray"
+    winners: "np.ndarray"
+    card_wins: "np.ndarray"
+    elapsed: float
+
+    @property
+    def games_per_second(self) -> float:
+        """Simulation throughput."""
+        return self.games / self.elapsed if self.elapsed else float("inf")
+
+    @property
+    def no_winner(self) -> int:
+        """Number of games in which no card got bingo."""
+        return int(self.first_win[self.total_items + 1])
+
+    def card_win_probability(self) -> "np.ndarray":
+        """Get each card's probability of being among the first winners."""
+        return self.card_wins / self.games
+
+    def summary(self) -> str:
+        """Describe the first-win, simultaneous-winner and per-card distributions."""
+        import numpy as np
+
+        won = self.games - self.no_winner
+        lines = [f"Simulated {self.games:,} games in {self.elapsed:.2f}s ({self.games_per_second:,.0f} games/s)"]
+        if won:
+            calls = np.arange(self.total_items + 1)
+            counts = self.first_win[: self.total_items + 1]
+            mean = (calls * counts).sum() / won
+            median = int(np.searchsorted(np.cumsum(counts), (won + 1) / 2))
+            lines.append(f"First win: mean call {mean:.1f}, median {median}")
+            lines.extend(
+                f"  call {call:3d}: {count / self.games:6.2%}" for call, count in enumerate(counts) if count
+            )
+        if self.no_winner:
+            lines.append(f"  no winner: {self.no_winner / self.games:6.2%}")
+        lines.append("Simultaneous winners:")
+        lines.extend(
+            f"  {n:3d} card{'s' if n != 1 else ' '}: {count / self.games:6.2%}"
+            for n, count in enumerate(self.winners) if n and count
+        )
+        probabilities = self.card_win_probability()
+        lines.append(
+            f"Per-card win probability: min {probabilities.min():.2%}, "
+            f"max {probabilities.max():.2%}, mean {probabilities.mean():.2%}"
+        )
+        ranked = np.argsort(-probabilities, kind="stable")
+        if len(ranked) > 2 * _LISTED_CARDS:
+            # Only the extremes of large decks
+            ranked = np.concatenate([ranked[:_LISTED_CARDS], ranked[-_LISTED_CARDS:]])
+        lines.extend(f"  card {i + 1:3d}: {probabilities[i]:6.2%}" for i in sorted(ranked))
+        return "\n".join(lines)
+
+
+def call_ranks(
+    rng: "np.random.Generator",
+    games: int,
+    total_items: int,
+    order: str = "shuffle",
+    jitter: float = 0.0,
+    skip: float = 0.0,
+) -> "np.ndarray":
+    """Draw when each event is called in a number of games.
+
+    Args:
+        rng: NumPy random generator.
+        games: Number of games.
+        total_items: Number of events.
+        order: ``"shuffle"`` for a uniformly random order, or ``"film"`` for
+            event order ``1..total_items`` with each event moved by normally
+            distributed noise of standard deviation `jitter` positions.
+        jitter: Perturbation of the film order (ignored for ``"shuffle"``).
+        skip: Probability that an event is never called (missed or not watched).
+
+    Returns:
+        Array of shape ``(games, total_items + 1)`` where column ``v`` is the
+        call (1-based) at which event ``v`` is called, or ``total_items + 1``
+        if it is skipped. Column 0 is 0, so a free space (`FREE`) counts as
+        called before the game starts.
+
+    Raises:
+        ValueError: If `order` is not in `CALL_ORDERS`.
+    """
+    import numpy as np
+
+    film_order = np.broadcast_to(np.arange(1, total_items + 1, dtype=np.int16), (games, total_items))
+    if order == "shuffle":
+        calls = rng.permuted(film_order, axis=1)
+    elif order == "film":
+        calls = film_order
+        if jitter:
+            keys = np.arange(total_items) + rng.normal(0.0, jitter, size=(games, total_items))
+            calls = (np.argsort(np.argsort(keys, axis=1), axis=1) + 1).astype(np.int16)
+    else:
+        raise ValueError(f"Unknown call order {order!r}, expected one of {', '.join(CALL_ORDERS)}")
+
+    ranks = np.empty((games, total_items + 1), dtype=np.int16)
+    ranks[:, 0] = 0
+    ranks[:, 1:] = calls
+    if skip:
+        ranks[:, 1:][rng.random((games, total_items)) < skip] = total_items + 1
+    return ranks
+
+
+def _simulate_chunk(
+    grids: "np.ndarray",
+    total_items: int,
+    games: int,
+    order: str,
+    jitter: float,
+    skip: float,
+    seed: int,
+    chunk: int,
+) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Play one chunk of games; returns first-win, winner-count and per-card win counts."""
+    import numpy as np
+
+    rng = np.random.default_rng(np.random.SeedSequence([seed, chunk]))
+    ranks = call_ranks(rng, games, total_items, order=order, jitter=jitter, skip=skip)
+    # Cell values of every line of every card: (cards, lines, cells)
+    rows, cols = grids.shape[1:]
+    line_values = grids.reshape(len(grids), rows * cols)[:, line_indices(CardShape(rows, cols))]
+    # A card wins when the last cell of its first complete line is called
+    times = ranks[:, line_values].max(axis=3).min(axis=2)
+    first = times.min(axis=1)
+    winners = times == first[:, None]
+    winners[first > total_items] = False
+    return (
+        np.bincount(first, minlength=total_items + 2),
+        np.bincount(winners.sum(axis=1), minlength=len(grids) + 1),
+        winners.sum(axis=0),
+    )
+
+
+def simulate_deck(
+    grids: "np.ndarray",
+    total_items: int,
+    games: int = 100_000,
+    order: str = "shuffle",
+    jitter: float = 0.0,
+    skip: float = 0.0,
+    seed: int | None = None,
+    workers: int = 1,
+) -> SimulationResult:
+    """Play many games against a deck with vectorized completion times.
+
+    Games are split into fixed-size chunks, each with its own random stream
+    seeded by ``(seed, chunk)``, so results depend only on the seed and not
+    on the worker count. Each chunk computes every card's completion time in
+    every game at once: the call of each cell, the latest call of each line
+    and the earliest completed line.
+
+    Args:
+        grids: Deck as an integer array of shape ``(cards, rows, cols)``.
+        total_items: Number of events that can be called.
+        games: Number of games to play.
+        order: Call order, see `call_ranks`.
+        jitter: Film-order perturbation, see `call_ranks`.
+        skip: Probability that an event is never called.
+        seed: Seed for the call orders (random if None).
+        workers: Number of processes (0 uses all CPUs).
+
+    Returns:
+        Aggregated SimulationResult.
+
+    Raises:
+        ValueError: If `order` is unknown, `skip` is not a probability, `workers`
+            or `seed` is negative, the deck is empty or `games` is less than 1.
+    """
+    import numpy as np
+
+    if order not in CALL_ORDERS:
+        raise ValueError(f"Unknown call order {order!r}, expected one of {', '.join(CALL_ORDERS)}")
+    if not 0.0 <= skip <= 1.0:
+        raise ValueError(f"skip must be between 0 and 1, got {skip}")
+    if workers < 0:
+        raise ValueError(f"Number of workers must not be negative, got {workers}")
+    if games < 1:
+        raise ValueError(f"Need at least one game to simulate, got {games}")
+    if seed is not None and seed < 0:
+        raise ValueError(f"Seed must not be negative, got {seed}")
+    if seed is None:
+        seed = new_seed()
+    grids = np.asarray(grids)
+    if not len(grids):
+        raise ValueError("Cannot simulate an empty deck")
+
+    chunk_games = max(1, _CHUNK_ELEMENTS // (len(grids) * line_indices(CardShape(*grids.shape[1:])).size))
+    sizes = [min(chunk_games, games - start) for start in range(0, games, chunk_games)]
+    args = [(grids, total_items, size, order, jitter, skip, seed, chunk) for chunk, size in enumerate(sizes)]
+
+    start = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(args) <= 1:
+        parts = [_simulate_chunk(*chunk_args) for chunk_args in args]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(_simulate_chunk, *zip(*args, strict=True)))
+
+    first_win = np.zeros(total_items + 2, dtype=np.int64)
+    winners = np.zeros(len(grids) + 1, dtype=np.int64)
+    card_wins = np.zeros(len(grids), dtype=np.int64)
+    for part_first, part_winners, part_cards in parts:
+        first_win += part_first
+        winners += part_winners
+        card_wins += part_cards
+    return SimulationResult(games, total_items, first_win, winners, card_wins, time.perf_counter() - start)
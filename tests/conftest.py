@@ -0,0 +1,17 @@
+"""Shared fixtures for the bingo tests."""
+
+import pytest
+
+from bingo import fonts, glyphs
+
+
+@pytest.fixture(autouse=True, scope="session")
+def font_cache_dir(tmp_path_factory):
+    """Build font subsets and emoji atlases in a temporary directory instead of the user's cache."""
+    directory = tmp_path_factory.mktemp("fonts")
+    with pytest.MonkeyPatch.context() as mp:
+        # Child processes, e.g. the CLI started by the startup profiler, read the environment
+        mp.setenv("BINGO_FONT_CACHE", str(directory))
+        mp.setattr(fonts, "FONT_CACHE_DIR", directory)
+        mp.setattr(glyphs, "FONT_CACHE_DIR", directory)
+        yield directory
@@ -0,0 +1,134 @@
+"""Tests for bingo.bench module."""
+
+import json
+
+import pytest
+
+from bingo.bench import (
+    RESULTS_VERSION,
+    BenchCase,
+    BenchmarkUnavailableError,
+    BenchReport,
+    BenchResult,
+    bench_cases,
+    environment_warning,
+    find_regressions,
+    format_result,
+    read_report,
+    run_benchmarks,
+    run_case,
+    select_cases,
+    write_report,
+)
+
+
+def result(name, median, skipped=None):
+    """Make a benchmark result with the given median."""
+    return BenchResult(name, name, rounds=3, loops=1, min=median, median=median, mean=median, skipped=skipped)
+
+
+def test_bench_cases():
+    """Test that the suite covers every win_at and the festive deck sizes."""
+    names = [case.name for case in bench_cases()]
+    assert len(names) == len(set(names))
+    assert "generate_valid_card[win_at=5]" in names
+    assert "generate_valid_card[win_at=26]" in names
+    assert {"simulate_game", "create_card_pdf", "create_festive_pdf[cards=10]", "html_to_pdf"} <= set(names)
+    assert {"save_card_image[png]", "save_card_image[webp]"} <= set(names)
+    assert [name for name in names if name.startswith("create_festive_html")] == [
+        "create_festive_html[cards=10]",
+        "create_festive_html[cards=1000]",
+        "create_festive_html[cards=10000]",
+    ]
+
+
+def test_select_cases():
+    """Test selecting cases by substrings of their names."""
+    cases = bench_cases()
+    assert select_cases(cases, []) == cases
+    assert [case.name for case in select_cases(cases, ["win_at=2", "simulate"])] == [
+        "generate_valid_card[win_at=20]",
+        "generate_valid_card[win_at=21]",
+        "generate_valid_card[win_at=22]",
+        "generate_valid_card[win_at=23]",
+        "generate_valid_card[win_at=24]",
+        "generate_valid_card[win_at=25]",
+        "generate_valid_card[win_at=26]",
+        "simulate_game",
+    ]
+
+
+def test_run_case(tmp_path):
+    """Test timing a case over calibrated loops."""
+    [case] = select_cases(bench_cases(), ["simulate_game"])
+    timed = run_case(case, tmp_path, rounds=2)
+    assert timed.skipped is None
+    assert timed.rounds == 2
+    assert timed.loops > 1
+    assert 0 < timed.min <= timed.median <= timed.mean + timed.stdev
+
+
+def test_run_case_skipped(tmp_path):
+    """Test that a case that cannot run here is reported as skipped."""
+    def setup(scratch, stack):
+        raise BenchmarkUnavailableError("no browser")
+
+    timed = run_case(BenchCase("browser", "browser", setup), tmp_path)
+    assert timed.skipped == "no browser"
+
+
+def test_run_benchmarks_quiet(capsys):
+    """Test that output of the timed calls stays out of the progress output."""
+    progress = []
+    report = run_benchmarks(select_cases(bench_cases(), ["create_card_pdf"]), rounds=1, progress=progress.append)
+    assert progress == report.results
+    assert capsys.readouterr().out == ""
+
+
+def test_report_round_trip(tmp_path):
+    """Test writing and reading a results file."""
+    report = BenchReport([result("a", 0.5), result("b", 0.0, skipped="no browser")])
+    path = tmp_path / "bench.json"
+    write_report(report, path)
+    assert json.loads(path.read_text())["version"] == RESULTS_VERSION
+    assert read_report(path) == report
+
+
+@pytest.mark.parametrize("content", ["not json", '{"version": 99, "results": []}', '{"version": 1}'])
+def test_read_report_invalid(tmp_path, content):
+    """Test that malformed results files raise ValueError."""
+    path = tmp_path / "bench.json"
+    path.write_text(content)
+    with pytest.raises(ValueError):
+        read_report(path)
+
+
+def test_find_regressions():
+    """Test that only cases slower than the threshold are regressions."""
+    baseline = BenchReport([result("fast", 1.0), result("slow", 1.0), result("skipped", 1.0), result("gone", 1.0)])
+    report = BenchReport([
+        result("fast", 1.1),
+        result("slow", 1.5),
+        result("skipped", 0.0, skipped="no browser"),
+        result("new", 9.0),
+    ])
+    [regression] = find_regressions(report, baseline, threshold=0.2)
+    assert (regression.name, regression.baseline, regression.current) == ("slow", 1.0, 1.5)
+    assert regression.ratio == 1.5
+    assert [r.name for r in find_regressions(report, baseline, threshold=0.05)] == ["fast", "slow"]
+
+
+def test_format_result():
+    """Test result rows with units and the change from a baseline."""
+    baseline = BenchReport([result("a", 0.002)])
+    assert format_result(result("a", 0.0025)).split()[1:3] == ["2.5", "ms"]
+    assert format_result(result("a", 0.003), baseline).endswith("+50.0%")
+    assert format_result(result("b", 0.0, skipped="no browser")).endswith("skipped: no browser")
+
+
+def test_environment_warning():
+    """Test warning when the baseline ran with another Python."""
+    report = BenchReport([])
+    assert environment_warning(report, BenchReport([])) is None
+    other = BenchReport([], environment={**report.environment, "python": "3.0.0"})
+    assert "python 3.0.0 ->" in environment_warning(report, other)
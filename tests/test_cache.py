@@ -0,0 +1,90 @@
+"""Tests for bingo.cache module."""
+
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from bingo.cache import RenderCache
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for test output."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+def test_key_is_deterministic():
+    """Test that keys depend only on the inputs."""
+    assert RenderCache.key("card", [[1, 2], [3, 4]]) == RenderCache.key("card", [[1, 2], [3, 4]])
+    assert RenderCache.key("card", [[1, 2], [3, 4]]) != RenderCache.key("card", [[1, 2], [4, 3]])
+    assert len(RenderCache.key("card")) == 64
+
+
+def test_get_put(temp_dir):
+    """Test storing and reading back an entry."""
+    cache = RenderCache(temp_dir)
+    key = RenderCache.key("entry")
+
+    assert cache.get(key) is None
+    cache.put(key, b"rendered")
+    assert cache.get(key) == b"rendered"
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.size == len(b"rendered")
+    assert os.path.exists(os.path.join(temp_dir, key[:2], key))
+
+
+def test_size_persists(temp_dir):
+    """Test that a new cache object picks up existing entries."""
+    RenderCache(temp_dir).put(RenderCache.key("entry"), b"12345")
+    cache = RenderCache(temp_dir)
+    assert cache.size == 5
+    assert cache.get(RenderCache.key("entry")) == b"12345"
+
+
+def test_overwrite_updates_size(temp_dir):
+    """Test that replacing an entry does not count its old size."""
+    cache = RenderCache(temp_dir)
+    key = RenderCache.key("entry")
+    cache.put(key, b"12345")
+    cache.put(key, b"123")
+    assert cache.size == 3
+
+
+def test_evicts_least_recently_used(temp_dir):
+    """Test that the oldest unused entries are evicted past the size limit."""
+    cache = RenderCache(temp_dir, max_bytes=20)
+    keys = [RenderCache.key(i) for i in range(3)]
+    for i, key in enumerate(keys[:2]):
+        cache.put(key, b"x" * 8)
+        # Make the access order unambiguous regardless of filesystem timestamp resolution
+        os.utime(cache._path(key), (1000 + i, 1000 + i))
+    os.utime(cache._path(keys[0]), (2000, 2000))
+
+    cache.put(keys[2], b"x" * 8)
+
+    assert cache.size == 16
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+
+
+def test_eviction_leaves_headroom(temp_dir):
+    """Test that eviction trims below the limit, so the next writes do not rescan the cache."""
+    cache = RenderCache(temp_dir, max_bytes=100)
+    for i in range(11):
+        cache.put(RenderCache.key(i), b"x" * 10)
+    assert cache.size <= 90
+
+    with patch.object(RenderCache, "evict") as evict:
+        cache.put(RenderCache.key("next"), b"x" * 5)
+    evict.assert_not_called()
+
+
+def test_summary(temp_dir):
+    """Test the hit/miss summary line."""
+    cache = RenderCache(temp_dir)
+    cache.get(RenderCache.key("missing"))
+    assert cache.summary().startswith("Render cache: 0 hits, 1 misses")
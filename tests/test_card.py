@@ -1,11 +1,24 @@
 """Tests for bingo.card module."""
 
+import random
+
+import pytest
 
 from bingo.card import (
+    FREE,
     BingoCard,
+    CardBatch,
+    CardIndex,
+    CardShape,
+    card_fingerprints,
+    card_streams,
     check_bingo,
+    completion_times,
+    feasible_win_range,
     generate_card,
+    generate_cards_batch,
     generate_valid_card,
+    line_table,
     simulate_game,
 )
 from bingo.data import MEET_ME_IN_ST_LOUIS
@@ -95,6 +108,77 @@ def test_check_bingo_anti_diagonal():
     assert check_bingo(card, {5, 9, 13, 17, 21})
 
 
+def test_check_bingo_ignores_numbers_not_on_card():
+    """Test check_bingo with called numbers that are not on the card."""
+    card = BingoCard(grid=[
+        [1, 2, 3, 4, 5],
+        [6, 7, 8, 9, 10],
+        [11, 12, 13, 14, 15],
+        [16, 17, 18, 19, 20],
+        [21, 22, 23, 24, 25],
+    ])
+    assert not check_bingo(card, {26, 27, 28, 29, 30, 1, 2, 3, 4})
+    assert check_bingo(card, {26, 27, 28, 29, 30, 1, 2, 3, 4, 5})
+
+
+def test_check_bingo_matches_mark():
+    """Test that check_bingo agrees with marking the calls one by one, for small and large call sets."""
+    rng = random.Random(7)
+    for _ in range(50):
+        card = generate_card(win_at=rng.randint(5, 26), rng=rng)
+        called = set(rng.sample(range(1, 61), rng.randint(0, 60)))
+        card.reset()
+        expected = any([card.mark(number) for number in called])
+        card.reset()
+        assert check_bingo(card, called) == expected
+
+
+def test_bingo_card_mask():
+    """Test the bitmask of called numbers."""
+    card = BingoCard(grid=[
+        [1, 2, 3, 4, 5],
+        [6, 7, 8, 9, 10],
+        [11, 12, 13, 14, 15],
+        [16, 17, 18, 19, 20],
+        [21, 22, 23, 24, 25],
+    ])
+    assert card.mask([]) == 0
+    assert card.mask([1, 30]) == 0b1
+    assert card.mask([5, 25]) == (1 << 4) | (1 << 24)
+
+
+def test_bingo_card_mark_detects_bingo():
+    """Test incremental marking detects bingo on the completing call."""
+    card = BingoCard(grid=[
+        [1, 2, 3, 4, 5],
+        [6, 7, 8, 9, 10],
+        [11, 12, 13, 14, 15],
+        [16, 17, 18, 19, 20],
+        [21, 22, 23, 24, 25],
+    ])
+    # Anti-diagonal
+    for number in (5, 9, 13, 17):
+        assert not card.mark(number)
+    assert not card.mark(30)
+    # Marking a number twice does not count twice
+    assert not card.mark(17)
+    assert not card.has_bingo
+    assert card.mark(21)
+    assert card.has_bingo
+
+    card.reset()
+    assert card.marked == 0
+    assert not card.has_bingo
+
+
+def test_bingo_card_equality_ignores_marks():
+    """Test that cards compare by grid only."""
+    grid = [[i * 5 + j + 1 for j in range(5)] for i in range(5)]
+    card = BingoCard(grid=grid)
+    card.mark(1)
+    assert card == BingoCard(grid=[row[:] for row in grid])
+
+
 def test_simulate_game():
     """Test simulate_game returns winning number."""
     card = BingoCard(grid=[
@@ -106,6 +190,8 @@ def test_simulate_game():
     ])
     # Should win when 5 is called (completes first row)
     assert simulate_game(card, total_items=30) == 5
+    # Simulating leaves no marks behind
+    assert card.marked == 0
 
 
 def test_generate_valid_card_wins_at_20():
@@ -121,6 +207,34 @@ def test_generate_valid_card_multiple():
         assert simulate_game(card, total_items=30) == 20
 
 
+def test_feasible_win_range():
+    """Test the feasible win_at range for a game."""
+    assert feasible_win_range(30) == range(5, 27)
+    assert feasible_win_range(25) == range(5, 22)
+    assert not feasible_win_range(24)
+
+
+def test_generate_valid_card_every_feasible_win_at():
+    """Test that every feasible win_at produces a card winning exactly there."""
+    for total_items in (25, 30, 40):
+        for win_at in feasible_win_range(total_items):
+            card = generate_valid_card(win_at=win_at, total_items=total_items)
+            values = [value for row in card.grid for value in row]
+            assert len(set(values)) == 25
+            assert all(1 <= value <= total_items for value in values)
+            assert simulate_game(card, total_items=total_items) == win_at
+
+
+def test_generate_valid_card_infeasible_win_at():
+    """Test that impossible win_at values fail immediately."""
+    with pytest.raises(ValueError, match="feasible: 5-26"):
+        generate_valid_card(win_at=27, total_items=30)
+    with pytest.raises(ValueError, match="feasible"):
+        generate_valid_card(win_at=4, total_items=30)
+    with pytest.raises(ValueError, match="at least 25 items"):
+        generate_valid_card(win_at=10, total_items=20)
+
+
 def test_bingo_card_get_emoji_grid():
     """Test emoji grid conversion."""
     card = BingoCard(grid=[
@@ -139,3 +253,224 @@ def test_bingo_card_get_emoji_grid():
 
     # Check first item maps correctly
     assert emoji_grid[0][0] == MEET_ME_IN_ST_LOUIS[0].emoji
+
+
+def test_generate_cards_batch_shape():
+    """Test that a batch holds an (n, 5, 5) grid array."""
+    batch = generate_cards_batch(50, win_at=20, total_items=30, seed=1)
+    assert isinstance(batch, CardBatch)
+    assert len(batch) == 50
+    assert batch.grids.shape == (50, 5, 5)
+    for grid in batch.grids:
+        values = grid.ravel().tolist()
+        assert len(set(values)) == 25
+        assert all(1 <= value <= 30 for value in values)
+
+
+def test_generate_cards_batch_wins_at():
+    """Test that every batch card wins exactly at win_at."""
+    for win_at in feasible_win_range(30):
+        batch = generate_cards_batch(20, win_at=win_at, total_items=30, seed=win_at)
+        assert (batch.completion_times() == win_at).all()
+        for card in batch:
+            assert isinstance(card, BingoCard)
+            assert simulate_game(card, total_items=30) == win_at
+
+
+def test_generate_cards_batch_seed_reproducible():
+    """Test that the same seed produces the same batch."""
+    first = generate_cards_batch(10, seed=42)
+    second = generate_cards_batch(10, seed=42)
+    assert (first.grids == second.grids).all()
+    assert first[3] == second[3]
+    assert len(first[2:5]) == 3
+
+
+def test_generate_cards_batch_cards_independent_of_batch():
+    """Test that card i depends only on (seed, i), not on the batch it is generated in."""
+    deck = generate_cards_batch(12, seed=42)
+    assert (generate_cards_batch(5, seed=42, start=7).grids == deck.grids[7:]).all()
+    assert generate_cards_batch(1, seed=42, start=3)[0] == deck[3]
+    assert (generate_cards_batch(12, seed=43).grids != deck.grids).any()
+
+
+def test_card_fingerprints_symmetric():
+    """Test that rotated and reflected copies share a symmetric fingerprint only."""
+    import numpy as np
+
+    grids = generate_cards_batch(4, seed=1).grids
+    rotated = np.rot90(grids, 1, axes=(1, 2))
+    mirrored = grids[:, :, ::-1]
+
+    fingerprints = card_fingerprints(grids)
+    assert all(len(fingerprint) == 25 for fingerprint in fingerprints)
+    assert card_fingerprints(rotated) != fingerprints
+    assert card_fingerprints(rotated, symmetric=True) == card_fingerprints(grids, symmetric=True)
+    assert card_fingerprints(mirrored, symmetric=True) == card_fingerprints(grids, symmetric=True)
+    assert len(set(card_fingerprints(grids, symmetric=True))) == 4
+
+
+def test_card_fingerprints_rejects_large_values():
+    """Test that fingerprints need byte-sized item numbers."""
+    with pytest.raises(ValueError, match="below 256"):
+        card_fingerprints([[[300] * 5] * 5])
+
+
+def test_card_index_add():
+    """Test adding cards to a duplicate index."""
+    card = generate_valid_card(win_at=20, total_items=30)
+    mirrored = BingoCard(grid=[row[::-1] for row in card.grid])
+
+    index = CardIndex()
+    assert index.add(card)
+    assert not index.add(BingoCard(grid=[row[:] for row in card.grid]))
+    assert index.add(mirrored)
+    assert (len(index), index.discarded) == (2, 1)
+
+    symmetric = CardIndex(symmetric=True)
+    assert symmetric.add(card)
+    assert mirrored in symmetric
+    assert not symmetric.add(mirrored)
+
+
+def test_generate_cards_batch_unique():
+    """Test that a unique batch replaces cards already in the index."""
+    deck = generate_cards_batch(10, seed=42)
+    index = CardIndex()
+    index.add(deck[0])
+    index.add(deck[5])
+
+    batch = generate_cards_batch(10, seed=42, unique=index)
+    assert index.discarded == 2
+    assert len(index) == 12
+    assert len(set(card_fingerprints(batch.grids))) == 10
+    assert deck[0] not in list(batch)
+    assert (batch.completion_times() == 20).all()
+    # Accepted cards keep deck order, followed by replacements from later in the stream
+    assert (batch.grids[:8] == deck.grids[[1, 2, 3, 4, 6, 7, 8, 9]]).all()
+    assert (batch.grids[8:] == generate_cards_batch(2, seed=42, start=10).grids).all()
+
+
+def test_generate_cards_batch_unique_tight_shape():
+    """Test that a round without a new card does not end a unique batch early."""
+    index = CardIndex()
+    batch = generate_cards_batch(200, win_at=5, total_items=9, seed=4, unique=index, shape=CardShape(3, 3))
+    assert len(index) == 200
+    assert len(set(card_fingerprints(batch.grids))) == 200
+    assert (batch.completion_times() == 5).all()
+
+
+def test_card_index_filter_limit():
+    """Test that filtering stops adding cards at the limit."""
+    deck = generate_cards_batch(6, seed=42)
+    index = CardIndex()
+    index.add(deck[1])
+    keep = index.filter(deck.grids, limit=2)
+    assert keep.tolist() == [True, False, True, False, False, False]
+    assert (len(index), index.discarded) == (3, 1)
+
+
+def test_generate_card_rng_reproducible():
+    """Test that generate_card draws only from the given generator."""
+    first = generate_card(win_at=20, total_items=30, rng=random.Random(5))
+    second = generate_valid_card(win_at=20, total_items=30, rng=random.Random(5))
+    assert first == second
+
+
+def test_generate_cards_batch_infeasible_win_at():
+    """Test that batches reject impossible win_at values."""
+    with pytest.raises(ValueError, match="feasible"):
+        generate_cards_batch(10, win_at=28, total_items=30)
+
+
+@pytest.mark.parametrize("n,start", [(-3, 0), (1, -1)])
+def test_generate_cards_batch_negative(n, start):
+    """Test that negative card counts and deck indices raise ValueError."""
+    with pytest.raises(ValueError, match="negative"):
+        generate_cards_batch(n, start=start)
+
+
+def test_generate_cards_batch_negative_seed():
+    """Test that negative seeds raise ValueError instead of a NumPy error."""
+    with pytest.raises(ValueError, match="Seed must not be negative"):
+        generate_cards_batch(2, seed=-1)
+    with pytest.raises(ValueError, match="Seed must not be negative"):
+        card_streams(-1, 0, 2, 4)
+
+
+def test_generate_cards_batch_empty():
+    """Test that an empty batch is allowed."""
+    assert len(generate_cards_batch(0, seed=1)) == 0
+
+
+def test_completion_times_matches_simulate_game():
+    """Test vectorized completion times against simulate_game."""
+    cards = [generate_card(win_at=win_at) for win_at in (5, 12, 20, 26)]
+    times = completion_times([card.grid for card in cards])
+    assert times.tolist() == [simulate_game(card) for card in cards]
+
+
+def test_card_shape_parse():
+    """Test parsing and validating card shapes."""
+    assert CardShape.parse("5x5-free") == CardShape(5, 5, free_center=True)
+    assert str(CardShape.parse(" 4X6 ")) == "4x6"
+    with pytest.raises(ValueError, match="Invalid card shape"):
+        CardShape.parse("5by5")
+    with pytest.raises(ValueError, match="must be 3-7"):
+        CardShape(8, 8)
+    with pytest.raises(ValueError, match="no center cell"):
+        CardShape(4, 4, free_center=True)
+
+
+def test_line_table_shapes():
+    """Test that only square grids have diagonal lines."""
+    assert len(line_table(CardShape(3, 3)).lines) == 8
+    table = line_table(CardShape(4, 6))
+    assert len(table.lines) == 10
+    assert sorted(set(table.sizes)) == [4, 6]
+    free = line_table(CardShape(5, 5, free_center=True))
+    assert free.free_mask == 1 << 12
+    assert sorted(free.initial_counts) == [0] * 8 + [1] * 4
+
+
+def test_free_center_card():
+    """Test that a free center counts as marked from the start."""
+    shape = CardShape(5, 5, free_center=True)
+    card = generate_valid_card(win_at=16, total_items=30, shape=shape)
+    assert card.grid[2][2] == FREE
+    assert card.shape == shape
+    assert len(card.cells) == 24
+    assert "FREE" in card.get_emoji_grid(MEET_ME_IN_ST_LOUIS)[2]
+    assert simulate_game(card) == 16
+    assert check_bingo(card, set(range(1, 17)))
+    assert not check_bingo(card, set(range(1, 16)))
+
+
+@pytest.mark.parametrize("spec", ["3x3", "4x4", "5x5-free", "6x6", "3x5", "7x7-free"])
+def test_generate_cards_batch_shapes(spec):
+    """Test that batches of every shape win at the requested call."""
+    shape = CardShape.parse(spec)
+    total_items = shape.values + 10
+    feasible = feasible_win_range(total_items, shape)
+    win_at = (feasible.start + feasible.stop) // 2
+    batch = generate_cards_batch(50, win_at=win_at, total_items=total_items, seed=3, shape=shape)
+    assert batch.grids.shape == (50, shape.rows, shape.cols)
+    assert (batch.completion_times() == win_at).all()
+    assert [simulate_game(card, total_items) for card in batch[:5]] == [win_at] * 5
+
+
+@pytest.mark.parametrize("spec", ["4x4", "5x5-free"])
+def test_generate_cards_batch_every_feasible_win_at(spec):
+    """Test that batches win at each call of the feasible range, including its ends."""
+    shape = CardShape.parse(spec)
+    for win_at in feasible_win_range(30, shape):
+        batch = generate_cards_batch(20, win_at=win_at, total_items=30, seed=win_at, shape=shape)
+        assert (batch.completion_times() == win_at).all()
+
+
+def test_free_3x3_cannot_win_at_exact_call():
+    """Test that a 3x3 free card has no layout that wins at an exact call."""
+    shape = CardShape(3, 3, free_center=True)
+    assert not feasible_win_range(30, shape)
+    with pytest.raises(ValueError, match="cannot be made to win"):
+        generate_cards_batch(1, win_at=10, total_items=30, shape=shape)
@@ -1,13 +1,17 @@
 """Tests for bingo.cli module."""
 
+import json
 import os
+import subprocess
 import sys
 import tempfile
-from unittest.mock import patch
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from bingo.cli import GAME_CHOICES, GAME_FILE_PREFIXES, main
+from bingo.cli import HEAVY_PACKAGES, IMAGE_FORMATS, PDF_ENGINES, import_times, main
+from bingo.data import GAME_PATH_ENV, reload_games
 
 
 @pytest.fixture
@@ -17,18 +21,22 @@ def temp_dir():
         yield tmpdir
 
 
-def test_game_choices_defined():
-    """Test that game choices are properly defined."""
-    assert len(GAME_CHOICES) >= 2
-    assert "meet_me_in_st_louis" in GAME_CHOICES
-    assert "vintage_christmas_films" in GAME_CHOICES
-
-
-def test_game_file_prefixes_match_choices():
-    """Test that file prefixes exist for all game choices."""
-    for game in GAME_CHOICES:
-        assert game in GAME_FILE_PREFIXES
-        assert "-" in GAME_FILE_PREFIXES[game]  # Hyphenated format
+def test_main_game_from_pack_directory(temp_dir, monkeypatch):
+    """Test that games from BINGO_GAME_PATH are offered and used for filenames."""
+    pack_dir = Path(temp_dir) / "packs"
+    pack_dir.mkdir()
+    items = "\n".join(f'[[items]]\norder = {i}\nemoji = "\U0001F3B2"\ndescription = "Event {i}"' for i in range(1, 31))
+    (pack_dir / "dice_night.toml").write_text(f'title = "Dice Night"\n{items}\n', encoding="utf-8")
+    monkeypatch.setenv(GAME_PATH_ENV, str(pack_dir))
+    reload_games()
+    try:
+        with patch.object(sys, "argv", ["bingo", "cards", "-n", "1", "-o", temp_dir, "-g", "dice_night"]):
+            result = main()
+    finally:
+        monkeypatch.delenv(GAME_PATH_ENV)
+        reload_games()
+    assert result == 0
+    assert os.path.exists(os.path.join(temp_dir, "dice-night_card_01.pdf"))
 
 
 def test_main_no_args_returns_1():
@@ -68,6 +76,81 @@ def test_main_cards_command(temp_dir):
     assert len(card_files) == 3
 
 
+def test_main_cards_command_jobs(temp_dir):
+    """Test the cards command with multiple rendering processes."""
+    with patch.object(sys, "argv", ["bingo", "cards", "-n", "3", "-o", temp_dir, "-j", "2"]):
+        result = main()
+    assert result == 0
+    files = sorted(os.listdir(temp_dir))
+    assert files == [f"meet-me-in-st-louis_card_{i:02d}.pdf" for i in range(1, 4)]
+
+
+def test_main_cards_command_single_file(temp_dir):
+    """Test the cards command writing one multi-page PDF."""
+    with patch.object(sys, "argv", ["bingo", "cards", "-n", "3", "-o", temp_dir, "--single-file", "--key"]):
+        result = main()
+    assert result == 0
+    assert os.listdir(temp_dir) == ["meet-me-in-st-louis_card.pdf"]
+
+
+def test_main_cards_command_n_up(temp_dir, capsys):
+    """Test that --n-up writes one imposed PDF."""
+    with patch.object(sys, "argv", ["bingo", "cards", "-n", "5", "-o", temp_dir, "--n-up", "2"]):
+        result = main()
+    assert result == 0
+    assert os.listdir(temp_dir) == ["meet-me-in-st-louis_card.pdf"]
+    assert "3 letter sheets, 2 cards per sheet" in capsys.readouterr().out
+
+
+def test_main_festive_command_n_up_requires_pdf(temp_dir):
+    """Test that imposing festive cards without a PDF is a usage error."""
+    with patch.object(sys, "argv", ["bingo", "festive", "-o", os.path.join(temp_dir, "f.html"), "--n-up", "4"]):
+        with pytest.raises(SystemExit):
+            main()
+
+
+def test_main_images_command(temp_dir, capsys):
+    """Test the images command writing one WebP file per card."""
+    argv = ["bingo", "images", "-n", "2", "-o", temp_dir, "-f", "webp", "--dpi", "72", "-s", "3"]
+    with patch.object(sys, "argv", argv):
+        result = main()
+    assert result == 0
+    assert sorted(os.listdir(temp_dir)) == ["meet-me-in-st-louis_card_01.webp", "meet-me-in-st-louis_card_02.webp"]
+    assert "cards/s" in capsys.readouterr().out
+
+
+def test_image_formats_match_images():
+    """Test that the CLI offers the formats bingo.images writes."""
+    from bingo import images
+
+    assert IMAGE_FORMATS == images.IMAGE_FORMATS
+
+
+def test_main_cards_command_cache_dir(temp_dir, capsys):
+    """Test the cards command with a render cache."""
+    cache_dir = os.path.join(temp_dir, "cache")
+    output_dir = os.path.join(temp_dir, "cards")
+    with patch.object(sys, "argv", ["bingo", "cards", "-n", "2", "-o", output_dir, "--cache-dir", cache_dir]):
+        result = main()
+    assert result == 0
+    assert "Render cache: 0 hits, 2 misses" in capsys.readouterr().out
+    assert len(os.listdir(cache_dir)) > 0
+
+
+def test_main_cards_command_seed(temp_dir, capsys):
+    """Test that a printed seed reproduces the same deck."""
+    first_dir = os.path.join(temp_dir, "first")
+    with patch.object(sys, "argv", ["bingo", "cards", "-n", "2", "-o", first_dir]):
+        assert main() == 0
+    seed = capsys.readouterr().out.splitlines()[0].removeprefix("Seed: ")
+
+    second_dir = os.path.join(temp_dir, "second")
+    with patch.object(sys, "argv", ["bingo", "cards", "-n", "2", "-o", second_dir, "--seed", seed]):
+        assert main() == 0
+    for name in os.listdir(first_dir):
+        assert Path(first_dir, name).read_bytes() == Path(second_dir, name).read_bytes()
+
+
 def test_main_cards_command_with_prefix(temp_dir):
     """Test the cards command with custom prefix."""
     with patch.object(sys, "argv", ["bingo", "cards", "-n", "2", "-o", temp_dir, "-p", "custom_card"]):
@@ -102,6 +185,146 @@ def test_main_festive_command(temp_dir):
     assert "bingo-grid" in content
 
 
+def test_main_festive_command_gzip(temp_dir):
+    """Test the festive command writing gzip-compressed HTML."""
+    import gzip
+
+    output_file = os.path.join(temp_dir, "test_festive.html")
+    with patch.object(sys, "argv", ["bingo", "festive", "-n", "2", "-o", output_file, "--gzip"]):
+        result = main()
+    assert result == 0
+    with gzip.open(output_file + ".gz", "rt", encoding="utf-8") as f:
+        assert "bingo-grid" in f.read()
+
+
+def test_main_festive_command_native_pdf(temp_dir, capsys):
+    """Test that --pdf-engine native writes the PDF without a browser."""
+    output_file = os.path.join(temp_dir, "test_festive.html")
+    with patch.object(sys, "argv", ["bingo", "festive", "-n", "2", "-o", output_file, "--pdf-engine", "native"]):
+        result = main()
+    assert result == 0
+    assert os.path.exists(os.path.join(temp_dir, "test_festive.pdf"))
+    assert "Generated PDF:" in capsys.readouterr().out
+
+
+def test_main_festive_command_native_pdf_chunks(temp_dir):
+    """Test that shards are a usage error with the native PDF engine."""
+    argv = ["bingo", "festive", "-o", os.path.join(temp_dir, "f.html"), "--pdf-engine", "native", "--chunk-size", "2"]
+    with patch.object(sys, "argv", argv):
+        with pytest.raises(SystemExit):
+            main()
+
+
+def test_pdf_engines_match_html_pdf():
+    """Test that the CLI offers the engines bingo.html_pdf implements."""
+    from bingo import html_pdf
+
+    assert PDF_ENGINES == html_pdf.PDF_ENGINES
+
+
+def test_main_festive_command_cache_dir(temp_dir, capsys):
+    """Test the festive command with a render cache."""
+    output_file = os.path.join(temp_dir, "test_festive.html")
+    cache_dir = os.path.join(temp_dir, "cache")
+    with patch.object(sys, "argv", ["bingo", "festive", "-n", "2", "-o", output_file, "--cache-dir", cache_dir]):
+        result = main()
+    assert result == 0
+    assert "Render cache: 0 hits, 2 misses" in capsys.readouterr().out
+
+
+def test_main_festive_command_seed(temp_dir):
+    """Test that the festive command is reproducible with --seed."""
+    outputs = []
+    for name in ("a.html", "b.html"):
+        output_file = os.path.join(temp_dir, name)
+        with patch.object(sys, "argv", ["bingo", "festive", "-n", "3", "-o", output_file, "--seed", "9"]):
+            assert main() == 0
+        outputs.append(Path(output_file).read_text(encoding="utf-8"))
+    assert outputs[0] == outputs[1]
+
+
+def test_main_festive_command_unique(temp_dir, capsys):
+    """Test the festive command in uniqueness mode."""
+    output_file = os.path.join(temp_dir, "test_festive.html")
+    with patch.object(sys, "argv", ["bingo", "festive", "-n", "5", "-o", output_file, "--unique", "symmetric"]):
+        result = main()
+    assert result == 0
+    assert "Unique deck: discarded 0 duplicate candidates" in capsys.readouterr().out
+
+
+def test_main_festive_command_win_distribution(temp_dir, capsys):
+    """Test the festive command with a win distribution."""
+    output_file = os.path.join(temp_dir, "test_festive.html")
+    argv = ["bingo", "festive", "-n", "6", "-o", output_file, "--win-distribution", "2@18,rest@20-21"]
+    with patch.object(sys, "argv", argv):
+        result = main()
+    assert result == 0
+    assert "Wins by call: 18: 2 cards, 20: 2 cards, 21: 2 cards" in capsys.readouterr().out
+
+
+def test_main_cards_command_invalid_win_distribution(temp_dir):
+    """Test that a distribution not covering the deck is a usage error."""
+    with patch.object(sys, "argv", ["bingo", "cards", "-n", "3", "-o", temp_dir, "--win-distribution", "5@20"]):
+        with pytest.raises(SystemExit):
+            main()
+
+
+def test_main_festive_command_shape(temp_dir):
+    """Test the festive command with a free-center card shape."""
+    output_file = os.path.join(temp_dir, "test_festive.html")
+    argv = ["bingo", "festive", "-n", "2", "-o", output_file, "--shape", "5x5-free", "-w", "16"]
+    with patch.object(sys, "argv", argv):
+        result = main()
+    assert result == 0
+    with open(output_file) as f:
+        assert f.read().count("free-space\">FREE<") == 2
+
+
+@pytest.mark.parametrize("shape", ["4x4-free", "9x9", "3x3-free"])
+def test_main_cards_command_invalid_shape(temp_dir, shape):
+    """Test that unsupported shapes and shapes without exact wins are usage errors."""
+    with patch.object(sys, "argv", ["bingo", "cards", "-n", "1", "-o", temp_dir, "--shape", shape]):
+        with pytest.raises(SystemExit):
+            main()
+
+
+@pytest.mark.parametrize("command,option", [
+    ("cards", "-n"), ("cards", "--start"), ("images", "--start"), ("festive", "-n"), ("simulate", "-n"),
+    ("cards", "-j"), ("images", "-j"), ("festive", "-j"), ("simulate", "-j"),
+    ("cards", "-s"), ("images", "-s"), ("festive", "-s"), ("simulate", "-s"),
+])
+def test_main_negative_counts(temp_dir, capsys, command, option):
+    """Test that negative card counts and deck indices are usage errors."""
+    with patch.object(sys, "argv", ["bingo", command, option, "-3"]):
+        with pytest.raises(SystemExit):
+            main()
+    assert "must not be negative" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("option,value", [("-n", "0"), ("--games", "0"), ("--games", "-5")])
+def test_main_simulate_command_nothing_to_simulate(capsys, option, value):
+    """Test that simulating no cards or no games is a usage error."""
+    with patch.object(sys, "argv", ["bingo", "simulate", option, value]):
+        with pytest.raises(SystemExit):
+            main()
+    assert "must be at least 1" in capsys.readouterr().err
+
+
+def test_main_images_command_infeasible_win_at(capsys):
+    """Test that an infeasible --win-at for images is a usage error."""
+    with patch.object(sys, "argv", ["bingo", "images", "-n", "1", "-w", "40"]):
+        with pytest.raises(SystemExit):
+            main()
+    assert "--win-at must be between" in capsys.readouterr().err
+
+
+def test_main_simulate_command_infeasible_win_at():
+    """Test that a win call the card shape cannot reach is a usage error."""
+    with patch.object(sys, "argv", ["bingo", "simulate", "--shape", "3x3", "-w", "2", "--games", "10"]):
+        with pytest.raises(SystemExit):
+            main()
+
+
 def test_main_festive_command_no_key(temp_dir):
     """Test the festive command without key."""
     output_file = os.path.join(temp_dir, "test_festive_nokey.html")
@@ -125,3 +348,139 @@ def test_main_festive_command_meet_me(temp_dir):
     with open(output_file) as f:
         content = f.read()
     assert "Meet Me In St. Louis" in content
+
+
+def test_main_simulate_command(capsys):
+    """Test the simulate command."""
+    with patch.object(sys, "argv", ["bingo", "simulate", "-n", "5", "--games", "500", "-s", "1", "-j", "1"]):
+        result = main()
+    assert result == 0
+    out = capsys.readouterr().out
+    assert "Simulated 500 games" in out
+    assert "Per-card win probability" in out
+
+
+def test_main_simulate_command_invalid_skip():
+    """Test that an invalid skip probability is a usage error."""
+    with patch.object(sys, "argv", ["bingo", "simulate", "--games", "10", "--skip", "2"]):
+        with pytest.raises(SystemExit):
+            main()
+
+
+def test_main_pdf_command(temp_dir, capsys):
+    """Test converting several files with one browser."""
+    html_file = os.path.join(temp_dir, "cards.html")
+    md_file = os.path.join(temp_dir, "intro.md")
+    Path(html_file).write_text("<html></html>", encoding="utf-8")
+    Path(md_file).write_text("# Intro", encoding="utf-8")
+    output_dir = os.path.join(temp_dir, "pdf")
+
+    playwright = MagicMock()
+    page = playwright.chromium.launch.return_value.new_page.return_value
+    page.pdf.side_effect = lambda path, **kwargs: Path(path).write_bytes(b"%PDF-1.4 stub")
+    with patch("playwright.sync_api.sync_playwright") as sync_playwright:
+        sync_playwright.return_value.start.return_value = playwright
+        with patch.object(sys, "argv", ["bingo", "pdf", html_file, md_file, "-o", output_dir]):
+            result = main()
+
+    assert result == 0
+    assert sorted(os.listdir(output_dir)) == ["cards.pdf", "intro.pdf"]
+    playwright.chromium.launch.assert_called_once()
+    assert "Converted 2 files" in capsys.readouterr().out
+
+
+def test_main_bench_command(temp_dir, capsys):
+    """Test benchmarking, writing JSON and failing on a regression against a baseline."""
+    output = os.path.join(temp_dir, "bench.json")
+    with patch.object(sys, "argv", ["bingo", "bench", "-k", "simulate_game", "--rounds", "2", "-o", output]):
+        result = main()
+    assert result == 0
+    [timed] = json.loads(Path(output).read_text())["results"]
+    assert timed["name"] == "simulate_game"
+    assert f"Results written to {output}" in capsys.readouterr().out
+
+    # A baseline 1000x faster than this run
+    baseline = os.path.join(temp_dir, "baseline.json")
+    data = json.loads(Path(output).read_text())
+    data["results"][0]["median"] /= 1000
+    Path(baseline).write_text(json.dumps(data))
+    argv = ["bingo", "bench", "-k", "simulate_game", "--rounds", "1", "-o", output, "--compare", baseline]
+    with patch.object(sys, "argv", argv):
+        result = main()
+    assert result == 1
+    assert "REGRESSION simulate_game" in capsys.readouterr().out
+
+    with patch.object(sys, "argv", [*argv, "--threshold", "1e9"]):
+        result = main()
+    assert result == 0
+
+
+def test_main_bench_command_list(capsys):
+    """Test listing benchmark cases without running them."""
+    with patch.object(sys, "argv", ["bingo", "bench", "--list", "-k", "festive"]):
+        result = main()
+    assert result == 0
+    assert capsys.readouterr().out.split() == [
+        "create_festive_html[cards=10]",
+        "create_festive_html[cards=1000]",
+        "create_festive_html[cards=10000]",
+        "create_festive_pdf[cards=10]",
+    ]
+
+
+@pytest.mark.parametrize("argv", [
+    ["-k", "no_such_case"],
+    ["-k", "simulate_game", "--compare", "missing.json"],
+    ["-k", "simulate_game", "--rounds", "0"],
+])
+def test_main_bench_command_invalid(temp_dir, argv):
+    """Test that bench usage errors exit with status 2."""
+    with patch.object(sys, "argv", ["bingo", "bench", "-o", os.path.join(temp_dir, "bench.json"), *argv]):
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+    assert exc_info.value.code == 2
+
+
+def _imported_packages(argv, cwd):
+    """Run the CLI in a fresh interpreter and return the top-level packages it imported."""
+    code = (
+        "import sys\n"
+        "from bingo.cli import main\n"
+        f"sys.argv = {['bingo', *argv]!r}\n"
+        "try:\n    main()\nexcept SystemExit:\n    pass\n"
+        "print(' '.join(sorted({name.partition('.')[0] for name in sys.modules})))\n"
+    )
+    src = str(Path(__file__).parent.parent / "src")
+    env = {**os.environ, "PYTHONPATH": src}
+    result = subprocess.run([sys.executable, "-c", code], cwd=cwd, env=env, capture_output=True, text=True, check=True)
+    return set(result.stdout.splitlines()[-1].split())
+
+
+@pytest.mark.parametrize("argv", [["--help"], ["festive", "-n", "2", "-o", "deck.html", "-s", "1"]])
+def test_cli_does_not_import_renderers(temp_dir, argv):
+    """Test that help and HTML-only festive runs never import ReportLab or Playwright."""
+    packages = _imported_packages(argv, temp_dir)
+    assert "bingo" in packages
+    assert not packages & set(HEAVY_PACKAGES)
+
+
+def test_import_times():
+    """Test parsing -X importtime output."""
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   json.decoder\n"
+        "import time:       300 |        420 | json\n"
+        "Traceback (most recent call last):\n"
+    )
+    assert import_times(stderr) == [("json.decoder", 120, 120, 1), ("json", 300, 420, 0)]
+
+
+def test_main_profile_startup(capfd):
+    """Test that --profile-startup runs the command and reports its imports."""
+    with patch.object(sys, "argv", ["bingo", "--profile-startup"]):
+        result = main()
+    assert result == 1  # No command: help is printed
+    out = capfd.readouterr().out
+    assert "Startup profile of 'bingo '" in out
+    assert "bingo.cli" in out
+    assert "Renderers imported: none" in out
@@ -1,15 +1,45 @@
 """Tests for bingo.data module."""
 
+import json
+from importlib.metadata import EntryPoint
+
 import pytest
 
+from bingo import data
 from bingo.data import (
+    ENTRY_POINT_GROUP,
+    GAME_PATH_ENV,
     MEET_ME_IN_ST_LOUIS,
     VINTAGE_CHRISTMAS_FILMS,
     BingoItem,
+    available_games,
     get_game_data,
+    get_pack,
+    parse_pack,
+    read_pack,
+    reload_games,
 )
 
 
+@pytest.fixture
+def pack_data():
+    """Get the contents of a minimal valid game pack."""
+    return {
+        "title": "Dice Night",
+        "items": [{"order": i, "emoji": "\U0001F3B2", "description": f"Roll {i}"} for i in range(1, 31)],
+        "key_sections": [{"name": "Opening", "first": 1, "last": 10}],
+    }
+
+
+@pytest.fixture
+def fresh_registry(monkeypatch):
+    """Rediscover game packs for one test, and again afterwards."""
+    reload_games()
+    yield monkeypatch
+    monkeypatch.undo()
+    reload_games()
+
+
 def test_bingo_item_dataclass():
     """Test BingoItem dataclass creation."""
     item = BingoItem(order=1, emoji="🎵", description="Test song")
@@ -91,3 +121,98 @@ def test_get_game_data_vintage_christmas_films():
     assert len(items) == 30
     assert items[0].order == 1
     assert items[0].description == "Maid puts children to bed"
+
+
+# Tests for game packs
+
+def test_available_games_bundled():
+    """Test that the bundled packs are discovered."""
+    assert {"meet_me_in_st_louis", "vintage_christmas_films"} <= set(available_games())
+
+
+def test_get_pack_bundled():
+    """Test the theme, titles and key sections of a bundled pack."""
+    pack = get_pack("meet_me_in_st_louis")
+    assert pack.title == "Meet Me In St. Louis"
+    assert pack.file_prefix == "meet-me-in-st-louis"
+    assert pack.key_sections[0] == ("Summer 1903", 1, 8)
+    assert pack.items is get_game_data("meet_me_in_st_louis")
+    assert MEET_ME_IN_ST_LOUIS == pack.items
+
+
+def test_module_getattr_unknown():
+    """Test that other missing module attributes still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        data.NOT_A_GAME  # noqa: B018
+
+
+def test_parse_pack_defaults(pack_data):
+    """Test the defaults of optional pack fields."""
+    pack = parse_pack("dice_night", pack_data)
+    assert pack.file_prefix == "dice-night"
+    assert pack.subtitle == ""
+    assert pack.colors == data.DEFAULT_COLORS
+
+
+@pytest.mark.parametrize(
+    ("change", "message"),
+    [
+        (lambda d: d.pop("title"), "missing"),
+        (lambda d: d["items"].pop(3), "numbered"),
+        (lambda d: d["items"][0].update(emoji=""), "needs an emoji"),
+        (lambda d: d["key_sections"].append({"name": "Late", "first": 25, "last": 31}), "outside"),
+    ],
+)
+def test_parse_pack_invalid(pack_data, change, message):
+    """Test that inconsistent packs are rejected."""
+    change(pack_data)
+    with pytest.raises(ValueError, match=message):
+        parse_pack("dice_night", pack_data)
+
+
+def test_read_pack_toml(tmp_path):
+    """Test loading a TOML pack named after its file."""
+    items = "\n".join(f'[[items]]\norder = {i}\nemoji = "x"\ndescription = "Event {i}"' for i in range(1, 4))
+    path = tmp_path / "tiny.toml"
+    path.write_text(f'title = "Tiny"\nsubtitle = "Three events"\n{items}\n', encoding="utf-8")
+    pack = read_pack(path)
+    assert (pack.name, pack.subtitle, len(pack.items)) == ("tiny", "Three events", 3)
+
+
+def test_read_pack_malformed(tmp_path):
+    """Test that unparsable pack files raise ValueError."""
+    path = tmp_path / "broken.json"
+    path.write_text("{", encoding="utf-8")
+    with pytest.raises(ValueError, match="Cannot parse"):
+        read_pack(path)
+
+
+def test_game_path_discovery_is_lazy(tmp_path, pack_data, fresh_registry):
+    """Test that packs from BINGO_GAME_PATH are listed without being parsed."""
+    (tmp_path / "dice_night.json").write_text(json.dumps(pack_data), encoding="utf-8")
+    (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+    fresh_registry.setenv(GAME_PATH_ENV, str(tmp_path))
+    reload_games()
+
+    assert {"dice_night", "broken"} <= set(available_games())
+    assert get_game_data("dice_night")[4].description == "Roll 5"
+    with pytest.raises(ValueError, match="Cannot parse"):
+        get_pack("broken")
+
+
+def test_entry_point_pack(tmp_path, pack_data, fresh_registry):
+    """Test packs provided by bingo.games entry points."""
+    (tmp_path / "dice_plugin.py").write_text(
+        "from bingo.data import parse_pack\n"
+        f"def pack():\n    return parse_pack('dice', {pack_data!r})\n",
+        encoding="utf-8",
+    )
+    fresh_registry.syspath_prepend(str(tmp_path))
+    entry_point = EntryPoint(name="dice", value="dice_plugin:pack", group=ENTRY_POINT_GROUP)
+    fresh_registry.setattr(
+        "importlib.metadata.entry_points", lambda group: [entry_point] if group == ENTRY_POINT_GROUP else []
+    )
+    reload_games()
+
+    assert "dice" in available_games()
+    assert get_pack("dice").title == "Dice Night"
@@ -0,0 +1,108 @@
+"""Tests for bingo.festive_pdf module."""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from bingo.card import CardShape, feasible_win_range, generate_cards_batch
+from bingo.data import get_game_data, get_pack
+from bingo.festive_pdf import NativeFestiveRenderer, create_festive_pdf
+
+
+@pytest.fixture
+def items():
+    """Get vintage Christmas films items for testing."""
+    return get_game_data("vintage_christmas_films")
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for test output."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+def test_create_festive_pdf(items, temp_dir):
+    """Test drawing a deck and its key as one PDF."""
+    from pypdf import PdfReader
+
+    cards = generate_cards_batch(3, total_items=len(items), seed=1)
+    pdf_file = os.path.join(temp_dir, "deck.pdf")
+    assert create_festive_pdf(items, cards, pdf_file, seed=1) == pdf_file
+
+    pages = PdfReader(pdf_file).pages
+    assert len(pages) == 4
+    # The titles and grid are one form that every card page places
+    assert Path(pdf_file).read_bytes().count(b"/Subtype /Form") == 1
+    assert "BINGO" in pages[0].extract_text()
+    key_text = pages[3].extract_text()
+    assert "BINGO KEY" in key_text
+    assert "Reference guide for all 30 events" in key_text
+    for section in get_pack("vintage_christmas_films").key_sections:
+        assert section[0] in key_text
+
+
+def test_create_festive_pdf_no_key(items, temp_dir):
+    """Test leaving out the key page."""
+    from pypdf import PdfReader
+
+    cards = generate_cards_batch(2, total_items=len(items), seed=1)
+    pdf_file = os.path.join(temp_dir, "deck.pdf")
+    create_festive_pdf(items, cards, pdf_file, include_key=False, seed=1)
+    assert len(PdfReader(pdf_file).pages) == 2
+
+
+def test_create_festive_pdf_reproducible(items, temp_dir):
+    """Test that the same seed gives byte-identical PDFs."""
+    outputs = []
+    for name in ("a.pdf", "b.pdf"):
+        pdf_file = os.path.join(temp_dir, name)
+        create_festive_pdf(items, generate_cards_batch(2, total_items=len(items), seed=5), pdf_file, seed=5)
+        outputs.append(Path(pdf_file).read_bytes())
+    assert outputs[0] == outputs[1]
+
+
+@pytest.mark.parametrize("spec", ["3x3", "4x6", "5x5-free", "3x5-free"])
+def test_create_festive_pdf_shapes(items, temp_dir, spec):
+    """Test drawing cards of other shapes, including a free center."""
+    from pypdf import PdfReader
+
+    shape = CardShape.parse(spec)
+    win_at = feasible_win_range(len(items), shape)[0]
+    cards = generate_cards_batch(1, win_at=win_at, total_items=len(items), seed=2, shape=shape)
+    pdf_file = os.path.join(temp_dir, "deck.pdf")
+    create_festive_pdf(items, cards, pdf_file, include_key=False, seed=2, shape=shape)
+
+    text = PdfReader(pdf_file).pages[0].extract_text()
+    assert ("FREE" in text) == shape.free_center
+
+
+def test_create_festive_pdf_n_up(items, temp_dir):
+    """Test drawing the deck onto tabloid sheets, six cards per sheet."""
+    from pypdf import PdfReader
+
+    cards = generate_cards_batch(7, total_items=len(items), seed=1)
+    pdf_file = os.path.join(temp_dir, "deck.pdf")
+    create_festive_pdf(items, cards, pdf_file, seed=1, n_up=6, paper="tabloid")
+
+    pages = PdfReader(pdf_file).pages
+    assert len(pages) == 3
+    assert pages[0].extract_text().count("BINGO") == 6
+    assert "BINGO KEY" in pages[2].extract_text()
+
+
+def test_native_renderer_unknown_game(items):
+    """Test that games without a pack fall back to the default theme."""
+    renderer = NativeFestiveRenderer(items, game="unknown_game", seed=0)
+    assert renderer.game_title == "Unknown Game"
+
+
+def test_native_renderer_wraps_titles(items):
+    """Test that a long subtitle wraps onto more lines and moves the grid down."""
+    renderer = NativeFestiveRenderer(items, seed=0)
+    short = NativeFestiveRenderer(items, game="meet_me_in_st_louis", seed=0)
+    subtitle_lines = [line for line in renderer._titles if line[1] == "text"]
+    assert len(subtitle_lines) > 1
+    assert renderer._grid_top > short._grid_top
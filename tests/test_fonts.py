@@ -0,0 +1,68 @@
+"""Tests for bingo.fonts module."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from bingo.fonts import FONT_DIR, LOCAL_WEBFONTS, emoji_codepoints, missing_webfonts, subset_font
+
+NOTO_EMOJI = FONT_DIR / "NotoEmoji-VariableFont.ttf"
+
+pytestmark = pytest.mark.skipif(not NOTO_EMOJI.exists(), reason="Noto Emoji font not bundled")
+
+
+def test_emoji_codepoints():
+    """Test collecting the code points of emoji, including variation selectors."""
+    assert emoji_codepoints(["🎄", "☃️", "🎄"]) == {0x1F384, 0x2603, 0xFE0F}
+    assert emoji_codepoints([]) == frozenset()
+
+
+def test_font_cache_dir_override(tmp_path):
+    """Test that BINGO_FONT_CACHE takes precedence over XDG_CACHE_HOME."""
+    src = str(Path(__file__).resolve().parent.parent / "src")
+    code = "from bingo.fonts import FONT_CACHE_DIR; print(FONT_CACHE_DIR)"
+    env = {**os.environ, "PYTHONPATH": src, "XDG_CACHE_HOME": str(tmp_path / "xdg")}
+
+    env["BINGO_FONT_CACHE"] = str(tmp_path / "fonts")
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == str(tmp_path / "fonts")
+
+    del env["BINGO_FONT_CACHE"]
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == str(tmp_path / "xdg" / "bingo" / "fonts")
+
+
+def test_missing_webfonts():
+    """Test that missing webfont faces are listed with their files."""
+    missing = missing_webfonts()
+    for faces in LOCAL_WEBFONTS.values():
+        for _, filename in faces:
+            assert any(filename in face for face in missing) != (FONT_DIR / filename).exists()
+
+
+def test_subset_font(tmp_path):
+    """Test that a subset keeps only the requested glyphs and drops variations."""
+    from fontTools.ttLib import TTFont
+
+    path = subset_font(NOTO_EMOJI, emoji_codepoints(["🎄", "🚋"]), cache_dir=tmp_path)
+    font = TTFont(path)
+    assert set(font.getBestCmap()) == {0x1F384, 0x1F68B}
+    assert "fvar" not in font
+    assert font["name"].getDebugName(6) == f"NotoEmoji-Regular-{path.stem[:16]}"
+    assert path.stat().st_size < NOTO_EMOJI.stat().st_size / 10
+
+
+def test_subset_font_cached(tmp_path):
+    """Test that a subset is built once and keyed by its code points."""
+    first = subset_font(NOTO_EMOJI, [0x1F384, 0x1F68B], cache_dir=tmp_path)
+    mtime = first.stat().st_mtime_ns
+    again = subset_font(NOTO_EMOJI, [0x1F68B, 0x1F384, 0x1F384], cache_dir=tmp_path)
+    other = subset_font(NOTO_EMOJI, [0x1F384], cache_dir=tmp_path)
+
+    assert again == first
+    assert again.stat().st_mtime_ns == mtime
+    assert other != first
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([first.name, other.name])
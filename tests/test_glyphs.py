@@ -0,0 +1,59 @@
+"""Tests for bingo.glyphs module."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from bingo.data import get_game_data
+from bingo.glyphs import _emoji_atlas, emoji_atlas, shape_emoji
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for test output."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+def test_shape_emoji_ligature():
+    """Test that a ZWJ sequence becomes the single glyph the font draws for it."""
+    shaped = shape_emoji("🏃‍♀️")
+    assert len(shaped.glyphs) == 1
+    assert shaped.chars == "🏃"
+    assert shape_emoji("🏃").glyphs == shaped.glyphs
+
+
+def test_shape_emoji_variation_selector():
+    """Test that variation selectors are dropped without changing the measurements."""
+    shaped = shape_emoji("🌙🏔️")
+    plain = shape_emoji("🌙🏔")
+    assert shaped.chars == "🌙🏔"
+    assert (shaped.advance, shaped.bounds) == (plain.advance, plain.bounds)
+
+
+def test_shape_emoji_bounds():
+    """Test that the ink box lies within the advance of a two-emoji string."""
+    single = shape_emoji("🎄")
+    double = shape_emoji("🎄🎄")
+    assert double.advance == pytest.approx(2 * single.advance)
+    assert 0 <= double.bounds[0] < double.bounds[2] <= double.advance
+    assert double.height == pytest.approx(single.height)
+    assert double.center[0] == pytest.approx(double.advance / 2, abs=0.1)
+
+
+def test_emoji_atlas_stored(temp_dir, monkeypatch):
+    """Test that a game's atlas is stored once and loaded by later processes without shaping."""
+    import bingo.glyphs
+
+    emoji = [item.emoji for item in get_game_data("vintage_christmas_films")]
+    atlas = emoji_atlas(emoji, cache_dir=temp_dir)
+    assert set(atlas) == set(emoji)
+    assert atlas["🛷🏃‍♀️"] == shape_emoji("🛷🏃‍♀️")
+
+    [path] = Path(temp_dir).glob("*.json")
+    assert len(json.loads(path.read_text(encoding="utf-8"))) == len(atlas)
+    _emoji_atlas.cache_clear()
+    monkeypatch.setattr(bingo.glyphs, "shape_emoji", None)
+    assert emoji_atlas(reversed(emoji), cache_dir=temp_dir) == atlas
@@ -1,17 +1,32 @@
 """Tests for bingo.html_pdf module."""
 
+import gzip
 import os
+import re
 import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from bingo.card import generate_valid_card
-from bingo.data import get_game_data
+from bingo.cache import RenderCache
+from bingo.card import CardShape, generate_valid_card
+from bingo.data import DEFAULT_COLORS, get_game_data, get_pack
 from bingo.html_pdf import (
-    FESTIVE_COLORS,
+    FestiveRenderer,
+    PdfRenderer,
     create_festive_html,
+    create_festive_html_shards,
+    festive_pdf_chunked,
     generate_festive_cards,
     generate_snowflakes,
+    html_to_pdf,
+    iter_festive_html,
+    markdown_to_html,
+    markdown_to_pdf,
+    merge_pdfs,
+    webfont_links,
+    write_festive_html,
 )
 
 
@@ -34,16 +49,48 @@ def temp_dir():
         yield tmpdir
 
 
+@pytest.fixture
+def fake_playwright():
+    """Replace Playwright with a fake browser whose pages write stub PDFs."""
+    playwright = MagicMock()
+    page = playwright.chromium.launch.return_value.new_page.return_value
+    page.pdf.side_effect = lambda path, **kwargs: Path(path).write_bytes(b"%PDF-1.4 stub")
+    with patch("playwright.sync_api.sync_playwright") as sync_playwright:
+        sync_playwright.return_value.start.return_value = playwright
+        yield playwright
+
+
+def write_stub_pdf(path, **kwargs):
+    """Write a one-page PDF, standing in for Chromium's page.pdf()."""
+    from reportlab.pdfgen import canvas
+
+    c = canvas.Canvas(str(path))
+    c.drawString(100, 100, Path(path).stem)
+    c.save()
+
+
+@pytest.fixture
+def fake_async_playwright():
+    """Replace async Playwright with a fake browser whose pages write one-page PDFs."""
+    page = AsyncMock()
+    page.pdf.side_effect = write_stub_pdf
+    browser = AsyncMock()
+    browser.new_context.return_value.new_page.return_value = page
+    playwright = MagicMock()
+    playwright.chromium.launch = AsyncMock(return_value=browser)
+    manager = MagicMock()
+    manager.__aenter__ = AsyncMock(return_value=playwright)
+    manager.__aexit__ = AsyncMock(return_value=False)
+    with patch("playwright.async_api.async_playwright", return_value=manager):
+        yield browser
+
+
 def test_festive_colors_defined():
-    """Test that festive colors are defined for all games."""
-    assert "vintage_christmas_films" in FESTIVE_COLORS
-    assert "meet_me_in_st_louis" in FESTIVE_COLORS
-    # Check required color keys
-    for _game, colors in FESTIVE_COLORS.items():
-        assert "primary" in colors
-        assert "secondary" in colors
-        assert "bg" in colors
-        assert "text" in colors
+    """Test that the bundled game packs define their festive colors."""
+    for game in ("vintage_christmas_films", "meet_me_in_st_louis"):
+        colors = get_pack(game).colors
+        assert colors.keys() == DEFAULT_COLORS.keys()
+        assert colors["bg"] in FestiveRenderer(get_game_data(game), game=game).head
 
 
 def test_generate_snowflakes():
@@ -61,6 +108,46 @@ def test_generate_snowflakes_default_count():
     assert snowflakes.count("snowflake") >= 15
 
 
+def test_festive_renderer_card(items):
+    """Test rendering a single card page from the compiled templates."""
+    card = generate_valid_card(win_at=20, total_items=len(items))
+    renderer = FestiveRenderer(items, game="meet_me_in_st_louis")
+    page = renderer.render_card(card)
+
+    assert page.count('<div class="bingo-cell">') == 25
+    assert page.count('class="snowflake"') == 12
+    assert "Meet Me In St. Louis" in page
+    # Cells follow the grid in row-major order
+    order_to_emoji = {item.order: item.emoji for item in items}
+    first_cell = f'<div class="bingo-cell">{order_to_emoji[card.grid[0][0]]}</div>'
+    last_cell = f'<div class="bingo-cell">{order_to_emoji[card.grid[4][4]]}</div>'
+    assert page.index(first_cell) <= page.index(last_cell)
+
+
+def test_festive_renderer_shape(items):
+    """Test that the grid layout follows the card shape."""
+    shape = CardShape(3, 5, free_center=True)
+    card = generate_valid_card(win_at=10, total_items=len(items), shape=shape)
+    page = FestiveRenderer(items, game="meet_me_in_st_louis", shape=shape).render_card(card)
+
+    assert 'style="--cols: 5; --span: 5"' in page
+    assert page.count('<div class="bingo-cell">') == 14
+    assert page.count('<div class="bingo-cell free-space">FREE</div>') == 1
+
+
+def test_festive_renderer_document(items):
+    """Test that a compiled document matches create_festive_html's structure."""
+    cards = [generate_valid_card(win_at=20, total_items=len(items)) for _ in range(3)]
+    renderer = FestiveRenderer(items, game="meet_me_in_st_louis")
+    html = renderer.render(cards)
+
+    assert html.startswith("<!DOCTYPE html>")
+    assert html.rstrip().endswith("</html>")
+    assert html.count('<div class="card-page">') == 3
+    assert html.count('<div class="key-page">') == 1
+    assert "{" not in renderer.head.split("<style>")[0]
+
+
 def test_create_festive_html(items):
     """Test creating festive HTML content."""
     cards = [generate_valid_card(win_at=20, total_items=len(items)) for _ in range(3)]
@@ -185,3 +272,324 @@ def test_festive_html_has_proper_structure(items):
     # Check for card structure
     assert "card-page" in html
     assert "bingo-cell" in html
+
+
+def test_markdown_to_html():
+    """Test the simple markdown conversion."""
+    html = markdown_to_html("# Title\n\nSome **bold** text\n\n- one\n- two\n\n---\n")
+
+    assert "<h1>Title</h1>" in html
+    assert "<p>Some <strong>bold</strong> text</p>" in html
+    assert "<ul><li>one</li>" in html
+    assert "<hr>" in html
+
+
+def test_pdf_renderer_reuses_browser(fake_playwright, temp_dir):
+    """Test that a PdfRenderer launches one browser for many conversions."""
+    html_file = os.path.join(temp_dir, "page.html")
+    md_file = os.path.join(temp_dir, "intro.md")
+    Path(html_file).write_text("<html></html>", encoding="utf-8")
+    Path(md_file).write_text("# Intro", encoding="utf-8")
+
+    with PdfRenderer() as renderer:
+        for i in range(3):
+            renderer.html_to_pdf(html_file, os.path.join(temp_dir, f"page{i}.pdf"))
+        markdown_to_pdf(md_file, os.path.join(temp_dir, "intro.pdf"), renderer=renderer)
+
+    fake_playwright.chromium.launch.assert_called_once()
+    fake_playwright.chromium.launch.return_value.close.assert_called_once()
+    fake_playwright.stop.assert_called_once()
+    assert [Path(pdf).name for pdf, _ in renderer.timings] == ["page0.pdf", "page1.pdf", "page2.pdf", "intro.pdf"]
+    assert all(seconds >= 0 for _, seconds in renderer.timings)
+    # Temporary HTML for markdown is cleaned up
+    assert sorted(os.listdir(temp_dir)) == [
+        "intro.md", "intro.pdf", "page.html", "page0.pdf", "page1.pdf", "page2.pdf",
+    ]
+
+
+def test_html_to_pdf_without_renderer(fake_playwright, temp_dir):
+    """Test that html_to_pdf launches and closes its own browser."""
+    html_file = os.path.join(temp_dir, "page.html")
+    Path(html_file).write_text("<html></html>", encoding="utf-8")
+
+    result = html_to_pdf(html_file, os.path.join(temp_dir, "page.pdf"))
+
+    assert os.path.exists(result)
+    fake_playwright.chromium.launch.assert_called_once()
+    fake_playwright.stop.assert_called_once()
+
+
+def test_webfont_links_google():
+    """Test that the default font mode links Google Fonts."""
+    assert "fonts.googleapis.com" in webfont_links()
+
+
+def test_webfont_links_local_modes():
+    """Test that local font modes declare bundled fonts without network URLs."""
+    file_css = webfont_links("file")
+    assert "fonts.googleapis.com" not in file_css
+    assert "@font-face { font-family: 'Noto Emoji'" in file_css
+    assert "file://" in file_css
+    assert "NotoEmoji-VariableFont.ttf" in file_css
+
+    data_css = webfont_links("data")
+    assert "data:font/ttf;base64," in data_css
+    assert "file://" not in data_css
+
+
+MISSING_FACE = "Cinzel Decorative 400 (CinzelDecorative-Regular.ttf)"
+
+
+def test_webfont_links_missing_faces():
+    """Test that local font modes warn about faces missing from FONT_DIR."""
+    with patch("bingo.html_pdf.missing_webfonts", return_value=[MISSING_FACE]):
+        with pytest.warns(UserWarning, match="CinzelDecorative-Regular.ttf"):
+            webfont_links("file")
+
+
+def test_missing_faces_warn_in_festive_and_markdown(items):
+    """Test that festive and markdown documents treat missing bundled fonts alike."""
+    with patch("bingo.html_pdf.missing_webfonts", return_value=[MISSING_FACE]):
+        with pytest.warns(UserWarning, match="CinzelDecorative-Regular.ttf"):
+            festive = create_festive_html(items, [], fonts="file")
+        with pytest.warns(UserWarning, match="CinzelDecorative-Regular.ttf"):
+            markdown = markdown_to_html("# Rules", fonts="file")
+    assert "@font-face" in festive
+    assert "@font-face" in markdown
+
+
+def test_webfont_links_invalid():
+    """Test that unknown font modes are rejected."""
+    with pytest.raises(ValueError, match="Unknown font mode"):
+        webfont_links("cdn")
+
+
+def test_create_festive_html_offline_fonts(items):
+    """Test festive HTML built with bundled fonts needs no network."""
+    cards = [generate_valid_card(win_at=20, total_items=len(items))]
+    html = create_festive_html(items, cards, game="meet_me_in_st_louis", fonts="file")
+
+    assert "fonts.googleapis.com" not in html
+    assert "@font-face" in html
+    # Font stacks are unchanged
+    assert "font-family: 'Mountains of Christmas', cursive;" in html
+
+
+def test_pdf_renderer_offline_waits_for_fonts(fake_playwright, temp_dir):
+    """Test that offline rendering skips networkidle and bounds the font wait."""
+    html_file = os.path.join(temp_dir, "page.html")
+    Path(html_file).write_text("<html></html>", encoding="utf-8")
+
+    with PdfRenderer(offline=True, font_timeout=2) as renderer:
+        renderer.html_to_pdf(html_file, os.path.join(temp_dir, "page.pdf"))
+
+    page = fake_playwright.chromium.launch.return_value.new_page.return_value
+    assert page.goto.call_args.kwargs["wait_until"] == "load"
+    page.wait_for_function.assert_called_once_with("document.fonts.status === 'loaded'", timeout=2000)
+
+
+def test_create_festive_html_shards(items):
+    """Test splitting a deck into standalone HTML shards."""
+    cards = [generate_valid_card(win_at=20, total_items=len(items)) for _ in range(5)]
+    shards = list(create_festive_html_shards(items, cards, game="meet_me_in_st_louis", chunk_size=2))
+
+    assert len(shards) == 3
+    assert [shard.count('<div class="card-page">') for shard in shards] == [2, 2, 1]
+    assert all(shard.startswith("<!DOCTYPE html>") for shard in shards)
+    # Only the last shard carries the key
+    assert ["BINGO KEY" in shard for shard in shards] == [False, False, True]
+
+
+def test_create_festive_html_shards_key_only(items):
+    """Test that an empty deck still yields the key page."""
+    shards = list(create_festive_html_shards(items, [], game="meet_me_in_st_louis"))
+    assert len(shards) == 1
+    assert "BINGO KEY" in shards[0]
+
+    with pytest.raises(ValueError, match="chunk_size"):
+        list(create_festive_html_shards(items, [], chunk_size=0))
+
+
+def test_merge_pdfs(temp_dir):
+    """Test concatenating PDFs in order."""
+    from pypdf import PdfReader
+
+    pdf_files = [os.path.join(temp_dir, f"part{i}.pdf") for i in range(3)]
+    for pdf_file in pdf_files:
+        write_stub_pdf(pdf_file)
+    output_file = os.path.join(temp_dir, "merged.pdf")
+    merge_pdfs(pdf_files, output_file)
+
+    pages = PdfReader(output_file).pages
+    assert [page.extract_text().strip() for page in pages] == ["part0", "part1", "part2"]
+
+
+def test_festive_pdf_chunked(items, temp_dir, fake_async_playwright):
+    """Test printing shards concurrently and joining them."""
+    from pypdf import PdfReader
+
+    cards = [generate_valid_card(win_at=20, total_items=len(items)) for _ in range(7)]
+    pdf_file = os.path.join(temp_dir, "deck.pdf")
+    festive_pdf_chunked(items, cards, pdf_file, game="meet_me_in_st_louis", chunk_size=3, jobs=2)
+
+    pages = PdfReader(pdf_file).pages
+    assert [page.extract_text().strip() for page in pages] == ["shard_0000", "shard_0001", "shard_0002"]
+    # One isolated context per shard, all closed afterwards
+    assert fake_async_playwright.new_context.call_count == 3
+    assert fake_async_playwright.new_context.return_value.close.await_count == 3
+    fake_async_playwright.close.assert_awaited_once()
+
+
+def test_generate_festive_cards_chunked_pdf(items, temp_dir, fake_async_playwright):
+    """Test generate_festive_cards writing the HTML and a chunked PDF."""
+    output_file = os.path.join(temp_dir, "deck.html")
+    pdf_file = os.path.join(temp_dir, "deck.pdf")
+    generate_festive_cards(items, num_cards=4, output_file=output_file, pdf_file=pdf_file, chunk_size=2)
+
+    assert os.path.exists(output_file)
+    assert os.path.exists(pdf_file)
+
+
+def test_iter_festive_html_is_lazy(items):
+    """Test that streaming renders each card only when requested."""
+    consumed = []
+
+    def cards():
+        for i in range(3):
+            consumed.append(i)
+            yield generate_valid_card(win_at=20, total_items=len(items))
+
+    chunks = iter_festive_html(items, cards(), game="meet_me_in_st_louis")
+    assert next(chunks).startswith("<!DOCTYPE html>")
+    assert consumed == []
+    assert '<div class="card-page">' in next(chunks)
+    assert consumed == [0]
+
+    rest = list(chunks)
+    assert consumed == [0, 1, 2]
+    assert "BINGO KEY" in rest[-2]
+    assert rest[-1].rstrip().endswith("</html>")
+
+
+def test_iter_festive_html_matches_create_festive_html(items):
+    """Test that the streamed document has the same structure as the joined one."""
+    cards = [generate_valid_card(win_at=20, total_items=len(items)) for _ in range(2)]
+    streamed = "".join(iter_festive_html(items, cards, game="meet_me_in_st_louis"))
+    joined = create_festive_html(items, cards, game="meet_me_in_st_louis")
+
+    snowflakes = re.compile(r'<div class="snowflakes">.*?</div>')
+    assert snowflakes.sub("", streamed) == snowflakes.sub("", joined)
+
+
+def test_festive_renderer_seed(items):
+    """Test that a seeded renderer gives each card the same snowflakes every time."""
+    cards = [generate_valid_card(win_at=20, total_items=len(items)) for _ in range(3)]
+    first = FestiveRenderer(items, game="meet_me_in_st_louis", seed=3).render(cards)
+    assert first == FestiveRenderer(items, game="meet_me_in_st_louis", seed=3).render(cards)
+    # Snowflakes follow the card, not its position in the deck
+    reordered = FestiveRenderer(items, game="meet_me_in_st_louis", seed=3)
+    assert reordered.render_card(cards[2]) in first
+    assert first != FestiveRenderer(items, game="meet_me_in_st_louis", seed=4).render(cards)
+
+
+def test_festive_renderer_cache(items, temp_dir):
+    """Test that cached card pages are reused, snowflakes included."""
+    card = generate_valid_card(win_at=20, total_items=len(items))
+    cache = RenderCache(temp_dir)
+
+    first = FestiveRenderer(items, game="meet_me_in_st_louis", cache=cache).render_card(card)
+    second = FestiveRenderer(items, game="meet_me_in_st_louis", cache=cache).render_card(card)
+    assert first == second
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    FestiveRenderer(items, game="vintage_christmas_films", cache=cache).render_card(card)
+    assert cache.misses == 2
+
+    FestiveRenderer(items, game="meet_me_in_st_louis", fonts="data", cache=cache).render_card(card)
+    assert cache.misses == 3
+
+    with patch("bingo.html_pdf.FESTIVE_CARD_RENDER_VERSION", -1):
+        FestiveRenderer(items, game="meet_me_in_st_louis", cache=cache).render_card(card)
+    assert cache.misses == 4
+
+
+def test_write_festive_html_gzip(items, temp_dir):
+    """Test streaming HTML into a gzip file."""
+    cards = [generate_valid_card(win_at=20, total_items=len(items)) for _ in range(2)]
+    output_file = os.path.join(temp_dir, "deck.html.gz")
+    written = write_festive_html(iter_festive_html(items, cards), output_file, compress=True)
+
+    with gzip.open(output_file, "rt", encoding="utf-8") as f:
+        content = f.read()
+    assert len(content) == written
+    assert content.count('<div class="card-page">') == 2
+
+
+def test_generate_festive_cards_gzip_pdf_requires_chunks(items, temp_dir):
+    """Test that a gzip HTML file is not handed to the browser."""
+    with pytest.raises(ValueError, match="chunk_size"):
+        generate_festive_cards(
+            items,
+            num_cards=1,
+            output_file=os.path.join(temp_dir, "deck.html.gz"),
+            pdf_file=os.path.join(temp_dir, "deck.pdf"),
+            compress=True,
+        )
+
+
+def test_generate_festive_cards_negative_jobs(items, temp_dir):
+    """Test that a negative number of print jobs raises ValueError."""
+    with pytest.raises(ValueError, match="must not be negative"):
+        generate_festive_cards(items, num_cards=1, output_file=os.path.join(temp_dir, "deck.html"), jobs=-2)
+
+
+def test_generate_festive_cards_native_pdf(items, temp_dir):
+    """Test the native PDF engine, which can follow a gzip-compressed HTML file."""
+    from pypdf import PdfReader
+
+    pdf_file = os.path.join(temp_dir, "deck.pdf")
+    generate_festive_cards(
+        items,
+        num_cards=2,
+        output_file=os.path.join(temp_dir, "deck.html.gz"),
+        game="meet_me_in_st_louis",
+        pdf_file=pdf_file,
+        compress=True,
+        seed=3,
+        pdf_engine="native",
+    )
+    assert len(PdfReader(pdf_file).pages) == 3
+
+
+@pytest.mark.parametrize("kwargs", [{"pdf_engine": "webkit"}, {"pdf_engine": "native", "chunk_size": 2}])
+def test_generate_festive_cards_invalid_pdf_engine(items, temp_dir, kwargs):
+    """Test rejecting unknown engines and shards with the native engine."""
+    with pytest.raises(ValueError):
+        generate_festive_cards(
+            items,
+            num_cards=1,
+            output_file=os.path.join(temp_dir, "deck.html"),
+            pdf_file=os.path.join(temp_dir, "deck.pdf"),
+            **kwargs,
+        )
+
+
+def test_generate_festive_cards_imposed_pdf(items, temp_dir):
+    """Test that the printed deck is packed onto print sheets afterwards."""
+    from pypdf import PdfReader
+
+    def print_pages(html_file, pdf_file, **kwargs):
+        from reportlab.pdfgen import canvas
+
+        c = canvas.Canvas(pdf_file, pagesize=(612, 792))
+        for _ in range(4):
+            c.showPage()
+        c.save()
+
+    pdf_file = os.path.join(temp_dir, "deck.pdf")
+    with patch("bingo.html_pdf.html_to_pdf", side_effect=print_pages):
+        generate_festive_cards(
+            items, num_cards=3, output_file=os.path.join(temp_dir, "deck.html"), pdf_file=pdf_file, n_up=4
+        )
+    # Three cards on one sheet, the key on another
+    assert len(PdfReader(pdf_file).pages) == 2
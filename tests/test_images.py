@@ -0,0 +1,115 @@
+"""Tests for bingo.images module."""
+
+import os
+import random
+import tempfile
+
+import pytest
+from PIL import Image
+
+from bingo.card import CardShape, generate_cards_batch, generate_valid_card
+from bingo.data import get_game_data
+from bingo.images import CardImageRenderer, GlyphAtlas, generate_images
+
+
+@pytest.fixture
+def items():
+    """Get bingo items for testing."""
+    return get_game_data("meet_me_in_st_louis")
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for test output."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+def test_glyph_atlas_rasterizes_once():
+    """Test that each emoji is rasterized once per size."""
+    atlas = GlyphAtlas()
+    glyph = atlas.glyph("🎄", 40)
+    assert glyph.mode == "L"
+    assert glyph.getbbox() is not None
+    assert atlas.glyph("🎄", 40) is glyph
+    atlas.glyph("🎄", 20)
+    assert len(atlas) == 2
+
+
+def test_glyph_atlas_fit():
+    """Test that emoji wider than a cell are rasterized smaller."""
+    atlas = GlyphAtlas()
+    wide = atlas.glyph("🎄🎄🎄", 40)
+    fitted = atlas.fit("🎄🎄🎄", 40, wide.width // 2)
+    assert fitted.width <= wide.width // 2
+    assert atlas.fit("🎄", 40, 1000) is atlas.glyph("🎄", 40)
+
+
+def test_card_image_renderer(items):
+    """Test that card images scale with DPI and share the atlas glyphs."""
+    card = generate_valid_card(win_at=20, total_items=len(items), rng=random.Random(0))
+    atlas = GlyphAtlas()
+    small = CardImageRenderer(items, title2="Test", dpi=72, atlas=atlas)
+    large = CardImageRenderer(items, title2="Test", dpi=144, atlas=atlas)
+
+    image = small.render(card)
+    assert image.size == small.size
+    assert large.size == (2 * small.size[0], 2 * small.size[1])
+    # One size per renderer for each distinct emoji string
+    assert len(atlas) == 2 * len({item.emoji for item in items})
+    # Every cell has some ink
+    for row in range(5):
+        for col in range(5):
+            left, top = small.grid_left + col * small.cell, small.grid_top + row * small.cell
+            cell = image.crop((left + 4, top + 4, left + small.cell - 4, top + small.cell - 4))
+            assert cell.getextrema()[0] < 128
+
+
+def test_card_image_renderer_shape_mismatch(items):
+    """Test that a renderer only draws cards of its shape."""
+    card = generate_valid_card(win_at=20, total_items=len(items))
+    renderer = CardImageRenderer(items, shape=CardShape(3, 3))
+    with pytest.raises(ValueError):
+        renderer.render(card)
+
+
+@pytest.mark.parametrize("fmt", ["png", "webp"])
+def test_generate_images(items, temp_dir, capsys, fmt):
+    """Test rendering a deck to image files in a thread pool."""
+    filenames = generate_images(items, num_cards=3, output_dir=temp_dir, prefix="Test", seed=4, fmt=fmt, workers=2)
+
+    assert filenames == [os.path.join(temp_dir, f"Test_{i:02d}.{fmt}") for i in (1, 2, 3)]
+    with Image.open(filenames[0]) as image:
+        assert image.format == fmt.upper()
+    assert "cards/s" in capsys.readouterr().out
+
+
+def test_generate_images_reproducible(items, temp_dir):
+    """Test that a seed gives the same images for any number of threads."""
+    first = generate_images(items, num_cards=4, output_dir=os.path.join(temp_dir, "a"), seed=4, workers=1)
+    second = generate_images(items, num_cards=4, output_dir=os.path.join(temp_dir, "b"), seed=4, workers=3)
+    for a, b in zip(first, second, strict=True):
+        with open(a, "rb") as fa, open(b, "rb") as fb:
+            assert fa.read() == fb.read()
+
+
+def test_card_image_renderer_free_center(items):
+    """Test that the free center space is labelled."""
+    shape = CardShape(5, 5, free_center=True)
+    [card] = generate_cards_batch(1, win_at=16, total_items=len(items), seed=4, shape=shape)
+    renderer = CardImageRenderer(items, shape=shape, dpi=72)
+    left, top = renderer.grid_left + 2 * renderer.cell, renderer.grid_top + 2 * renderer.cell
+    center = renderer.render(card).crop((left + 4, top + 4, left + renderer.cell - 4, top + renderer.cell - 4))
+    assert center.getextrema()[0] < 128
+
+
+def test_generate_images_invalid_format(items, temp_dir):
+    """Test that unknown image formats raise ValueError."""
+    with pytest.raises(ValueError):
+        generate_images(items, num_cards=1, output_dir=temp_dir, fmt="gif")
+
+
+def test_generate_images_negative_workers(items, temp_dir):
+    """Test that a negative number of threads raises ValueError."""
+    with pytest.raises(ValueError, match="must not be negative"):
+        generate_images(items, num_cards=1, output_dir=temp_dir, workers=-2)
@@ -0,0 +1,119 @@
+"""Tests for bingo.imposition module."""
+
+import io
+import os
+import tempfile
+
+import pytest
+from reportlab.pdfgen import canvas
+
+from bingo.imposition import (
+    PAGE_SIZE,
+    PAPER_SIZES,
+    SHEET_MARGIN,
+    impose_pages,
+    impose_pdf,
+    sheet_layout,
+)
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for test output."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+def write_pages(filename, num_pages):
+    """Write a Letter PDF whose pages show their number."""
+    c = canvas.Canvas(filename, pagesize=PAGE_SIZE, invariant=1)
+    for i in range(num_pages):
+        c.drawString(100, 700, f"page{i}")
+        c.showPage()
+    c.save()
+
+
+@pytest.mark.parametrize("n_up,paper,sheet_size,scale", [
+    (1, "letter", (612.0, 792.0), 1.0),
+    (2, "letter", (792.0, 612.0), (792 - 3 * SHEET_MARGIN) / 2 / 612),
+    (4, "letter", (612.0, 792.0), (612 - 3 * SHEET_MARGIN) / 2 / 612),
+    (6, "letter", (792.0, 612.0), (612 - 3 * SHEET_MARGIN) / 2 / 792),
+    (1, "a4", PAPER_SIZES["a4"], PAPER_SIZES["a4"][0] / 612),
+    (1, "tabloid", (792.0, 1224.0), 1.0),
+])
+def test_sheet_layout(n_up, paper, sheet_size, scale):
+    """Test choosing the sheet orientation and grid with the largest pages."""
+    layout = sheet_layout(n_up, paper)
+    assert layout.sheet_size == sheet_size
+    assert len(layout.slots) == n_up
+    assert all(slot.scale == pytest.approx(scale) for slot in layout.slots)
+    assert layout.identity == (n_up == 1 and paper == "letter")
+
+
+def test_sheet_layout_slots_fit():
+    """Test that slots lie on the sheet without overlapping, in reading order."""
+    layout = sheet_layout(6, "a4")
+    width, height = PAGE_SIZE
+    boxes = [(s.x, s.y, s.x + width * s.scale, s.y + height * s.scale) for s in layout.slots]
+    for x0, y0, x1, y1 in boxes:
+        assert 0 <= x0 < x1 <= layout.sheet_size[0]
+        assert 0 <= y0 < y1 <= layout.sheet_size[1]
+    for i, a in enumerate(boxes):
+        for b in boxes[i + 1:]:
+            assert a[2] <= b[0] or b[2] <= a[0] or a[3] <= b[1] or b[3] <= a[1]
+    # Top row first, left to right
+    assert [(round(s.y), round(s.x)) for s in layout.slots] == sorted(
+        ((round(s.y), round(s.x)) for s in layout.slots), key=lambda p: (-p[0], p[1])
+    )
+    # Eight cut marks per slot, none of them on a page
+    assert len(layout.cut_marks) == 8 * 6
+    for x0, y0, x1, y1 in layout.cut_marks:
+        for bx0, by0, bx1, by1 in boxes:
+            assert not (bx0 < (x0 + x1) / 2 < bx1 and by0 < (y0 + y1) / 2 < by1)
+
+
+def test_sheet_layout_cached():
+    """Test that each sheet template is computed once."""
+    assert sheet_layout(4, "tabloid") is sheet_layout(4, "tabloid")
+
+
+@pytest.mark.parametrize("n_up,paper", [(3, "letter"), (2, "legal")])
+def test_sheet_layout_invalid(n_up, paper):
+    """Test that unsupported layouts raise ValueError."""
+    with pytest.raises(ValueError):
+        sheet_layout(n_up, paper)
+
+
+def test_impose_pages():
+    """Test drawing pages onto sheets, with one cut mark form for all of them."""
+    from pypdf import PdfReader
+
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=PAGE_SIZE, invariant=1)
+    layout = sheet_layout(4, "letter")
+    drawn = []
+    sheets = impose_pages(c, layout, [lambda c, i=i: drawn.append(i) for i in range(5)])
+    c.save()
+
+    assert sheets == 2
+    assert drawn == list(range(5))
+    pages = PdfReader(buffer).pages
+    assert len(pages) == 2
+    assert [float(x) for x in pages[0].mediabox[2:]] == list(layout.sheet_size)
+    assert buffer.getvalue().count(b"/Subtype /Form") == 1
+
+
+def test_impose_pdf(temp_dir):
+    """Test packing the pages of a PDF onto sheets, with the key alone at the end."""
+    from pypdf import PdfReader
+
+    pdf_file = os.path.join(temp_dir, "deck.pdf")
+    write_pages(pdf_file, 6)
+    assert impose_pdf(pdf_file, pdf_file, sheet_layout(2, "a4"), key_page=True) == 4
+
+    pages = PdfReader(pdf_file).pages
+    assert len(pages) == 4
+    assert pages[0].extract_text().split() == ["page0", "page1"]
+    assert pages[2].extract_text().split() == ["page4"]
+    assert pages[3].extract_text().split() == ["page5"]
+    assert float(pages[3].mediabox.width) == pytest.approx(PAPER_SIZES["a4"][0])
@@ -2,12 +2,24 @@
 
 import os
 import tempfile
+from unittest.mock import patch
 
 import pytest
 
-from bingo.card import generate_valid_card
+from bingo.cache import RenderCache
+from bingo.card import CardShape, generate_valid_card
 from bingo.data import get_game_data
-from bingo.pdf import create_card_pdf, create_key_pdf, generate_cards
+from bingo.pdf import (
+    NOTO_EMOJI_PATH,
+    card_pdf_cache_key,
+    create_card_pdf,
+    create_cards_pdf,
+    create_key_pdf,
+    draw_emoji,
+    generate_cards,
+    get_emoji_atlas,
+    get_emoji_font,
+)
 
 
 @pytest.fixture
@@ -57,6 +69,144 @@ def test_generate_cards(items, temp_dir):
         assert os.path.getsize(filename) > 0
 
 
+def test_generate_cards_workers(items, temp_dir):
+    """Test rendering cards across worker processes."""
+    filenames = generate_cards(
+        items,
+        num_cards=4,
+        output_dir=temp_dir,
+        prefix="TestCard",
+        seed=7,
+        workers=2,
+    )
+
+    assert filenames == [os.path.join(temp_dir, f"TestCard_{i:02d}.pdf") for i in range(1, 5)]
+    for filename in filenames:
+        assert os.path.exists(filename)
+        assert os.path.getsize(filename) > 0
+
+
+def test_generate_cards_reproducible(items, temp_dir):
+    """Test that a seed gives byte-identical PDFs for any worker count."""
+    serial = generate_cards(items, 3, os.path.join(temp_dir, "serial"), seed=11, workers=1)
+    parallel = generate_cards(items, 3, os.path.join(temp_dir, "parallel"), seed=11, workers=2)
+    for a, b in zip(serial, parallel, strict=True):
+        with open(a, "rb") as fa, open(b, "rb") as fb:
+            assert fa.read() == fb.read()
+
+
+def test_generate_cards_start(items, temp_dir):
+    """Test regenerating one card of a seeded deck."""
+    deck = generate_cards(items, 3, os.path.join(temp_dir, "deck"), prefix="Card", seed=11)
+    [single] = generate_cards(items, 1, os.path.join(temp_dir, "single"), prefix="Card", seed=11, start=2)
+    assert os.path.basename(single) == "Card_03.pdf"
+    with open(deck[2], "rb") as fa, open(single, "rb") as fb:
+        assert fa.read() == fb.read()
+
+
+def test_create_cards_pdf(items, temp_dir):
+    """Test creating one PDF with a page per card plus the key."""
+    cards = [generate_valid_card(win_at=20, total_items=len(items)) for _ in range(3)]
+    filename = os.path.join(temp_dir, "test_cards.pdf")
+    create_cards_pdf(cards, items, filename, include_key=True)
+
+    with open(filename, "rb") as f:
+        content = f.read()
+    assert content.count(b"/Type /Page\n") == 4
+    # The emoji font is embedded once for the whole deck
+    assert content.count(b"/FontFile2") == 1
+    # The titles and grid are one form that every card page places
+    assert content.count(b"/Subtype /Form") == 1
+
+
+def test_create_cards_pdf_n_up(items, temp_dir, capsys):
+    """Test imposing cards onto print sheets, with the key on a sheet of its own."""
+    from pypdf import PdfReader
+
+    cards = [generate_valid_card(win_at=20, total_items=len(items)) for _ in range(5)]
+    filename = os.path.join(temp_dir, "test_cards.pdf")
+    create_cards_pdf(cards, items, filename, include_key=True, n_up=4, paper="a4")
+
+    pages = PdfReader(filename).pages
+    assert len(pages) == 3
+    assert round(float(pages[2].mediabox.width)) == 595
+    assert "(3 a4 sheets, 4 cards per sheet)" in capsys.readouterr().out
+
+
+def test_generate_cards_n_up_requires_single_file(items, temp_dir):
+    """Test that separate card files cannot be imposed."""
+    with pytest.raises(ValueError, match="single-file"):
+        generate_cards(items, num_cards=2, output_dir=temp_dir, n_up=2)
+
+
+def test_generate_cards_negative_workers(items, temp_dir):
+    """Test that a negative number of processes raises ValueError."""
+    with pytest.raises(ValueError, match="must not be negative"):
+        generate_cards(items, num_cards=2, output_dir=temp_dir, workers=-2)
+
+
+def test_generate_cards_single_file(items, temp_dir):
+    """Test generating all cards into a single PDF."""
+    filenames = generate_cards(
+        items,
+        num_cards=5,
+        output_dir=temp_dir,
+        prefix="TestDeck",
+        single_file=True,
+    )
+
+    assert filenames == [os.path.join(temp_dir, "TestDeck.pdf")]
+    assert os.listdir(temp_dir) == ["TestDeck.pdf"]
+
+
+@pytest.mark.parametrize("spec", ["3x3", "4x6", "5x5-free"])
+def test_generate_cards_shapes(items, temp_dir, spec):
+    """Test rendering cards of other grid shapes."""
+    filenames = generate_cards(
+        items, num_cards=2, output_dir=temp_dir, win_at=12, shape=CardShape.parse(spec), single_file=True
+    )
+    assert os.path.getsize(filenames[0]) > 0
+
+
+def test_generate_cards_cache(items, temp_dir):
+    """Test that a repeated run serves every card from the render cache."""
+    cache = RenderCache(os.path.join(temp_dir, "cache"))
+    first = generate_cards(items, 3, os.path.join(temp_dir, "a"), win_at=20, seed=5, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 3)
+
+    second = generate_cards(items, 3, os.path.join(temp_dir, "b"), win_at=20, seed=5, cache=cache)
+    assert (cache.hits, cache.misses) == (3, 3)
+    for a, b in zip(first, second, strict=True):
+        with open(a, "rb") as fa, open(b, "rb") as fb:
+            assert fa.read() == fb.read()
+
+
+def test_card_pdf_cache_key_render_version(items):
+    """Test that bumping the render version invalidates cached card PDFs."""
+    card = generate_valid_card(win_at=20, total_items=len(items))
+    key = card_pdf_cache_key(card, items, "BINGO", "Test")
+    with patch("bingo.pdf.CARD_PDF_RENDER_VERSION", -1):
+        assert card_pdf_cache_key(card, items, "BINGO", "Test") != key
+
+
+@pytest.mark.skipif(not NOTO_EMOJI_PATH.exists(), reason="Noto Emoji font not bundled")
+def test_emoji_subset_shared_across_cards(items, temp_dir):
+    """Test that each game gets its own emoji subset, embedded in every card under its own name."""
+    from pypdf import PdfReader
+
+    emoji_font = get_emoji_font(items)
+    assert emoji_font.startswith("NotoEmoji-")
+    assert get_emoji_font(get_game_data("vintage_christmas_films")) not in (emoji_font, "NotoEmoji")
+    assert get_emoji_font() == "NotoEmoji"
+
+    subset_hash = emoji_font.removeprefix("NotoEmoji-")
+    for seed in (1, 2):
+        filename = generate_cards(items, 1, temp_dir, win_at=20, seed=seed, prefix=f"Card{seed}")[0]
+        fonts = PdfReader(filename).pages[0]["/Resources"]["/Font"].values()
+        base_fonts = [font.get_object()["/BaseFont"] for font in fonts]
+        assert sum(base_font.endswith(f"-{subset_hash}") for base_font in base_fonts) == 1
+
+
 def test_generate_cards_creates_directory(items, temp_dir):
     """Test that generate_cards creates output directory if needed."""
     output_dir = os.path.join(temp_dir, "nested", "output")
@@ -112,3 +262,24 @@ def test_generate_cards_vintage(vintage_items, temp_dir):
     for filename in filenames:
         assert os.path.exists(filename)
         assert os.path.getsize(filename) > 0
+
+
+
+def test_draw_emoji_shaped():
+    """Test that emoji are drawn from their shaped characters, centred on their ink."""
+    from unittest.mock import MagicMock
+
+    items = get_game_data("vintage_christmas_films")
+    atlas = get_emoji_atlas(items)
+    c = MagicMock()
+    draw_emoji(c, "🛷🏃‍♀️", 100, 50, 20, "NotoEmoji", atlas)
+
+    x, y, text = c.drawString.call_args.args
+    assert text == "🛷🏃"
+    left, bottom, right, top = atlas["🛷🏃‍♀️"].bounds
+    assert x + 20 * (left + right) / 2 == pytest.approx(100, abs=0.01)
+    assert y + 20 * (bottom + top) / 2 == pytest.approx(50, abs=0.01)
+
+    # Without an atlas the string is centred on its advance
+    draw_emoji(c, "🎄", 100, 50, 20, "NotoEmoji", None)
+    c.drawCentredString.assert_called_once_with(100, 43, "🎄")
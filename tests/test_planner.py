@@ -0,0 +1,78 @@
+"""Tests for bingo.planner module."""
+
+from collections import Counter
+
+import pytest
+
+from bingo.card import CardIndex, card_fingerprints
+from bingo.planner import WinTarget, generate_planned_batch, parse_win_distribution, plan_wins, win_summary
+
+
+def test_parse_win_distribution():
+    """Test parsing single calls, ranges and open-ended ranges."""
+    targets = parse_win_distribution("2@18, 5@20-22,rest@24+", total_items=30)
+    assert targets == [
+        WinTarget(2, range(18, 19)),
+        WinTarget(5, range(20, 23)),
+        WinTarget(None, range(24, 27)),
+    ]
+
+
+@pytest.mark.parametrize(
+    "spec, match",
+    [
+        ("2-18", "Invalid win distribution entry"),
+        ("two@18", "Invalid win distribution entry"),
+        ("2@4", "feasible: 5-26"),
+        ("2@20-30", "feasible: 5-26"),
+        ("2@22-20", "feasible: 5-26"),
+        ("rest@18,rest@20", "Only one"),
+    ],
+)
+def test_parse_win_distribution_invalid(spec, match):
+    """Test that malformed or infeasible distributions are rejected."""
+    with pytest.raises(ValueError, match=match):
+        parse_win_distribution(spec, total_items=30)
+
+
+def test_plan_wins_counts():
+    """Test that a plan matches the requested histogram."""
+    targets = parse_win_distribution("2@18,5@20,rest@24-25", total_items=30)
+    schedule = plan_wins(targets, 20, seed=1)
+    assert Counter(schedule) == {18: 2, 20: 5, 24: 7, 25: 6}
+    assert plan_wins(targets, 20, seed=1) == schedule
+
+
+def test_plan_wins_card_count_mismatch():
+    """Test that plans must cover the deck exactly."""
+    with pytest.raises(ValueError, match="asks for 7 cards"):
+        plan_wins(parse_win_distribution("2@18,5@20", total_items=30), 6)
+    with pytest.raises(ValueError, match="add a 'rest@...' entry"):
+        plan_wins(parse_win_distribution("2@18,5@20", total_items=30), 8)
+
+
+def test_generate_planned_batch():
+    """Test that each card wins at its scheduled call."""
+    schedule = plan_wins(parse_win_distribution("3@6,4@18,rest@24+", total_items=30), 15, seed=2)
+    batch = generate_planned_batch(schedule, total_items=30, seed=2)
+    assert batch.completion_times().tolist() == schedule
+    assert (generate_planned_batch(schedule, total_items=30, seed=2).grids == batch.grids).all()
+
+
+def test_generate_planned_batch_negative_seed():
+    """Test that negative seeds raise ValueError."""
+    with pytest.raises(ValueError, match="Seed must not be negative"):
+        generate_planned_batch([20, 24], total_items=30, seed=-1)
+
+
+def test_generate_planned_batch_unique():
+    """Test planned generation with a duplicate index."""
+    index = CardIndex()
+    batch = generate_planned_batch([20, 21, 20, 21], total_items=30, seed=3, unique=index)
+    assert len(index) == 4
+    assert len(set(card_fingerprints(batch.grids))) == 4
+
+
+def test_win_summary():
+    """Test the achieved distribution summary line."""
+    assert win_summary([20, 18, 20]) == "Wins by call: 18: 1 card, 20: 2 cards"
@@ -0,0 +1,112 @@
+"""Tests for bingo.simulate module."""
+
+import numpy as np
+import pytest
+
+from bingo.card import CardShape, completion_times, generate_cards_batch
+from bingo.simulate import call_ranks, simulate_deck
+
+
+@pytest.fixture
+def deck():
+    """Get a small deck of cards that win at 20 in film order."""
+    return generate_cards_batch(12, win_at=20, total_items=30, seed=1)
+
+
+def test_call_ranks_shuffle():
+    """Test that shuffled games call every event exactly once."""
+    ranks = call_ranks(np.random.default_rng(0), 50, 30)
+    assert ranks.shape == (50, 31)
+    assert (np.sort(ranks[:, 1:], axis=1) == np.arange(1, 31)).all()
+
+
+def test_call_ranks_film_skip():
+    """Test film order with skipped events."""
+    ranks = call_ranks(np.random.default_rng(0), 200, 30, order="film", skip=0.5)
+    called = ranks[:, 1:] <= 30
+    assert 0.3 < called.mean() < 0.7
+    assert (ranks[:, 1:][called] == np.broadcast_to(np.arange(1, 31), (200, 30))[called]).all()
+
+
+def test_call_ranks_unknown_order():
+    """Test that unknown call orders are rejected."""
+    with pytest.raises(ValueError, match="Unknown call order"):
+        call_ranks(np.random.default_rng(0), 1, 30, order="backwards")
+
+
+def test_simulate_deck_film_order(deck):
+    """Test that unperturbed film order reproduces the designed win."""
+    result = simulate_deck(deck.grids, 30, games=100, order="film", seed=1)
+    assert result.first_win[20] == 100
+    assert result.winners[12] == 100
+    assert (result.card_win_probability() == 1.0).all()
+
+
+def test_simulate_deck_shuffle_matches_completion_times(deck):
+    """Test the vectorized games against in-order completion times of cards relabelled by call."""
+    result = simulate_deck(deck.grids, 30, games=20, seed=3)
+    ranks = call_ranks(np.random.default_rng(np.random.SeedSequence([3, 0])), 20, 30)
+    first = [completion_times(game_ranks[deck.grids]).min() for game_ranks in ranks]
+    assert result.first_win.tolist() == np.bincount(first, minlength=32).tolist()
+    assert result.winners[1:].sum() == 20
+
+
+def test_simulate_deck_workers_reproducible(deck):
+    """Test that the worker count does not change results."""
+    serial = simulate_deck(deck.grids, 30, games=30_000, seed=5, workers=1)
+    parallel = simulate_deck(deck.grids, 30, games=30_000, seed=5, workers=2)
+    assert (serial.first_win == parallel.first_win).all()
+    assert (serial.card_wins == parallel.card_wins).all()
+
+
+def test_simulate_deck_no_winner(deck):
+    """Test that games where every event is skipped have no winner."""
+    result = simulate_deck(deck.grids, 30, games=10, order="film", skip=1.0, seed=1)
+    assert result.no_winner == 10
+    assert result.card_wins.sum() == 0
+    assert "no winner: 100.00%" in result.summary()
+
+
+def test_simulate_deck_invalid_skip(deck):
+    """Test that skip must be a probability."""
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        simulate_deck(deck.grids, 30, games=10, skip=1.5)
+
+
+def test_simulate_deck_negative_workers(deck):
+    """Test that a negative number of processes raises ValueError."""
+    with pytest.raises(ValueError, match="must not be negative"):
+        simulate_deck(deck.grids, 30, games=10, workers=-2)
+
+
+def test_simulate_deck_nothing_to_simulate(deck):
+    """Test that an empty deck or no games raise ValueError."""
+    with pytest.raises(ValueError, match="empty deck"):
+        simulate_deck(deck.grids[:0], 30, games=10)
+    for games in (0, -5):
+        with pytest.raises(ValueError, match="at least one game"):
+            simulate_deck(deck.grids, 30, games=games)
+
+
+def test_simulate_deck_negative_seed(deck):
+    """Test that negative seeds raise ValueError."""
+    with pytest.raises(ValueError, match="Seed must not be negative"):
+        simulate_deck(deck.grids, 30, games=10, seed=-5)
+
+
+def test_simulation_summary(deck):
+    """Test the summary report."""
+    summary = simulate_deck(deck.grids, 30, games=1000, seed=1).summary()
+    assert "games/s" in summary
+    assert "First win: mean call" in summary
+    assert "Simultaneous winners:" in summary
+    assert "card  12:" in summary
+
+
+def test_simulate_deck_free_center():
+    """Test that a free center counts as called before the first event."""
+    shape = CardShape(5, 5, free_center=True)
+    deck = generate_cards_batch(8, win_at=16, total_items=30, seed=2, shape=shape)
+    result = simulate_deck(deck.grids, 30, games=5, order="film", seed=1)
+    assert result.first_win[16] == 5
+    assert result.card_wins.tolist() == [5] * 8